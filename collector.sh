@@ -137,6 +137,10 @@ main() {
         echo "  --skip-usage            : Skip usage data collection"
         echo "  --skip-enrichment       : Skip instance metadata enrichment"
         echo "  --skip-recommendations  : Skip recommendations collection"
+        echo "  --metadata-rate-limit <N> : Start at most N (> 0) instance metadata lookups per second"
+        echo "  --force-recommendations : Ignore recommendations cached less than an hour ago"
+        echo "  --regions <R1,R2,...>   : Fetch recommendations from these regions in parallel"
+        echo "  --refresh-growth-cache  : Ignore compartment/tag discovery cached less than a day ago"
         echo ""
         echo "Examples:"
         echo "  # Full collection"
@@ -151,6 +155,9 @@ main() {
         echo "  # Full collection plus growth data"
         echo "  $0 ocid1.tenancy.oc1..aaaaa us-ashburn-1 2025-11-01 2025-11-04 --growth-collection"
         echo ""
+        echo "  # Recommendations from several regions (recommendations_<region>.*)"
+        echo "  $0 ocid1.tenancy.oc1..aaaaa us-ashburn-1 2025-11-01 2025-11-04 --only-recommendations --regions us-ashburn-1,eu-frankfurt-1"
+        echo ""
         echo "  # Custom currency"
         echo "  $0 ocid1.tenancy.oc1..aaaaa us-ashburn-1 2025-11-01 2025-11-04 --currency EUR"
         echo ""
@@ -173,12 +180,16 @@ main() {
         echo "============== Execution Complete =============="
         echo "📁 Check the current directory for output files:"
         echo "   - output_merged.csv (if cost/usage collected)"
+        echo "   - output_merged.parquet (if cost/usage collected and pyarrow is installed)"
         echo "   - output.csv (if cost/usage collected)"
         echo "   - out.json (if cost/usage collected)"
         echo "   - instance_metadata.json (if cost/usage collected)"
         echo "   - recommendations.out (if recommendations collected)"
+        echo "   - recommendations.json, recommendations.jsonl (if recommendations collected)"
+        echo "   - recommendations_<region>.out/.json/.jsonl (if --regions given)"
         echo "   - growth_collection_tags.json (if growth collection run)"
         echo "   - growth_collection_summary.txt (if growth collection run)"
+        echo "   - growth_audit_events.jsonl, growth_metrics_*.jsonl (if growth collection run)"
     else
         echo ""
         echo "❌ Execution failed with exit code $exit_code"
@@ -5,25 +5,68 @@ Copyright (c) 2025 Oracle and/or its affiliates.
 All rights reserved. The Universal Permissive License (UPL), Version 1.0
 """
 
-import json
 import sys
+import shutil
 import subprocess
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-import pandas as pd
 
-from utils.progress import ProgressSpinner, ProgressTracker
-from utils.executor import OCIMetadataFetcher
+# pandas, numpy and pyarrow are imported where they are used so that --help,
+# argument errors and --only-recommendations do not pay their import cost
+from utils.progress import BufferedOutput, ProgressSpinner, ProgressTracker
+from utils.executor import MAX_INFLIGHT_REQUESTS, OCIMetadataFetcher
 from utils.api_executor import OCIAPIExecutor
 from utils.recommendations import OCIRecommendationsFetcher
 from utils.growth_collector import OCIGrowthCollector
+from utils.serialization import write_csv, write_json, write_json_object
+
+
+RECOMMENDATIONS_CACHE_TTL = 3600  # seconds cached recommendations are reused
+COMPUTE_INSTANCE_PREFIX = 'ocid1.instance.oc1.'
+USAGE_COLUMNS = ['resourceId', 'timeUsageStarted', 'platform', 'region', 'skuPartNumber', 'shape', 'resourceName']
+
+
+def _items_to_frame(items, columns):
+    """
+    Build a DataFrame holding only the given string columns of API items.
+
+    Columns that do not appear in any item are left out, matching what
+    pd.DataFrame(items) would have produced.
+
+    Args:
+        items: List of API item dicts
+        columns: Column names to keep
+
+    Returns:
+        pandas DataFrame with one row per item
+    """
+    import pandas as pd
+
+    try:
+        import pyarrow as pa
+    except ImportError:  # pyarrow is optional - fall back to pandas.DataFrame
+        pa = None
+
+    present = set().union(*items) if items else set()
+    columns = [col for col in columns if col in present]
+
+    if pa is not None:
+        try:
+            schema = pa.schema([(col, pa.string()) for col in columns])
+            return pa.Table.from_pylist(items, schema=schema).to_pandas()
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+
+    return pd.DataFrame(items, columns=columns)
 
 
 class OCICostCollector:
     """Collects cost and usage data from OCI and enriches with instance metadata."""
     
-    def __init__(self, tenancy_ocid, home_region, from_date, to_date, output_dir='output'):
+    def __init__(self, tenancy_ocid, home_region, from_date, to_date, output_dir='output',
+                 metadata_rate_limit=None):
         self.tenancy_ocid = tenancy_ocid
         self.home_region = home_region
         self.from_date = from_date
@@ -33,34 +76,43 @@ class OCICostCollector:
         # Create output directory if it doesn't exist
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-    
-    def make_api_call(self, query_type, group_by_fields, call_name):
-        """Make an API call to OCI Usage API."""
-        api_executor = OCIAPIExecutor(
+        
+        # Shared metadata fetcher, so instances already looked up are served from its cache;
+        # metadata_rate_limit caps the instance lookups started per second
+        self.metadata_fetcher = OCIMetadataFetcher(rate_limit_per_sec=metadata_rate_limit)
+        
+        # Shared Usage API executor for all calls
+        self.api_executor = OCIAPIExecutor(
             self.tenancy_ocid,
             self.home_region,
             output_dir=self.output_dir
         )
-        
-        return api_executor.make_api_call(
+    
+    def make_api_call(self, query_type, group_by_fields, call_name, show_progress=True):
+        """Make an API call to OCI Usage API."""
+        return self.api_executor.make_api_call(
             query_type=query_type,
             group_by_fields=group_by_fields,
             call_name=call_name,
             from_date=self.from_date,
-            to_date=self.to_date
+            to_date=self.to_date,
+            show_progress=show_progress
         )
     
     def fetch_instance_metadata(self, instance_ids):
-        """Fetch compute instance metadata using multi-threaded OCI CLI calls."""
+        """Fetch compute instance metadata using multi-threaded GetInstance lookups."""
         print(f"\n{'='*70}")
         print("🔄 Fetching Compute Instance Metadata")
         print(f"{'='*70}")
         print(f"Total instances to query: {len(instance_ids)}")
         print(f"Using multi-threaded executor for faster processing...\n")
         
-        # Use OCIMetadataFetcher for parallel processing with built-in progress tracking
-        fetcher = OCIMetadataFetcher(max_workers=30)
-        instance_metadata, successful, failed = fetcher.fetch_metadata(instance_ids)
+        # Use OCIMetadataFetcher for parallel processing with built-in progress tracking.
+        # Each worker mostly waits on an in-process GetInstance request, so the pool
+        # grows with the number of instances from 30, up to 3x the requests the
+        # fetcher allows in flight (extra threads beyond that would only queue).
+        self.metadata_fetcher.max_workers = min(max(30, len(instance_ids) // 20), 3 * MAX_INFLIGHT_REQUESTS)
+        instance_metadata, successful, failed = self.metadata_fetcher.fetch_metadata(instance_ids)
         
         print(f"\n✅ Successfully fetched {successful} instance metadata")
         if failed > 0:
@@ -70,90 +122,137 @@ class OCICostCollector:
     
     def merge_and_enrich(self, data1, data2):
         """Merge two API responses and enrich with instance metadata."""
+        df_merged, compute_instances = self.merge_data(data1, data2)
+        
+        instance_metadata = {}
+        if compute_instances:
+            instance_metadata = self.fetch_instance_metadata(compute_instances)
+        
+        return self.enrich_with_metadata(df_merged, compute_instances, instance_metadata)
+    
+    def merge_data(self, data1, data2):
+        """
+        Merge the COST and USAGE API responses.
+        
+        Args:
+            data1: COST API response
+            data2: USAGE API response
+            
+        Returns:
+            Tuple of (merged dataframe, list of compute instance OCIDs)
+        """
+        import numpy as np
+        import pandas as pd
+        from pandas.api.types import union_categoricals
+        
         print(f"\n{'='*70}")
         print(f"🔄 Merging and Enriching Data")
         print(f"{'='*70}")
         
-        # Create spinner for merge operation
+        # ProgressSpinner only animates on a terminal, so redirected runs do not
+        # pay for a repaint thread competing for the GIL with the pandas work below
         spinner = ProgressSpinner("Saving and processing data...")
         spinner.start()
         
-        # Save raw responses
-        raw_output = {'call1': data1, 'call2': data2}
-        out_file = self.output_dir / 'out.json'
-        with open(out_file, 'w') as f:
-            json.dump(raw_output, f, indent=2)
-        print(f"✅ Raw JSON saved to {out_file}")
-        
-        # Convert to DataFrames
-        df1 = pd.DataFrame(data1['items'])
-        df2 = pd.DataFrame(data2['items'])
-        
-        print(f"📋 First dataset (COST): {len(df1)} records")
-        print(f"📋 Second dataset (USAGE): {len(df2)} records")
-        
-        # Create merge key (resourceId + timeUsageStarted)
-        df1['merge_key'] = df1['resourceId'].astype(str) + '_' + df1['timeUsageStarted'].astype(str)
-        df2['merge_key'] = df2['resourceId'].astype(str) + '_' + df2['timeUsageStarted'].astype(str)
-        
-        # Select columns from df2 to avoid duplicates
-        df2_cols = ['merge_key', 'platform', 'region', 'skuPartNumber', 'shape', 'resourceName']
-        df2_cols = [col for col in df2_cols if col in df2.columns]
-        
-        # Merge datasets
-        df_merged = df1.merge(
-            df2[df2_cols],
-            on='merge_key',
-            how='left',
-            suffixes=('', '_from_call2')
-        )
+        try:
+            # Save raw responses
+            out_file = self.output_dir / 'out.json'
+            write_json_object([('call1', data1), ('call2', data2)], out_file)
+            print(f"✅ Raw JSON saved to {out_file}")
+        
+            # Convert to DataFrames
+            df1 = pd.DataFrame(data1['items'])
+            # Only the key and descriptive columns of the USAGE call are merged
+            df2 = _items_to_frame(data2['items'], USAGE_COLUMNS)
+        
+            print(f"📋 First dataset (COST): {len(df1)} records")
+            print(f"📋 Second dataset (USAGE): {len(df2)} records")
+        
+            # Merge on resourceId + timeUsageStarted directly (no concatenated string key)
+            merge_keys = ['resourceId', 'timeUsageStarted']
+        
+            # Share one categorical dtype per key so the join runs on integer codes
+            for col in merge_keys:
+                if col in df1.columns and col in df2.columns:
+                    dtype = union_categoricals(
+                        [pd.Categorical(df1[col]), pd.Categorical(df2[col])]
+                    ).dtype
+                    df1[col] = df1[col].astype(dtype)
+                    df2[col] = df2[col].astype(dtype)
+
+            # Merge datasets (df2 already holds only the USAGE_COLUMNS, so it is
+            # passed as-is instead of through a column-selection copy)
+            df_merged = df1.merge(
+                df2,
+                on=merge_keys,
+                how='left',
+                suffixes=('', '_from_call2')
+            )
+
+            print(f"✅ Merged dataset: {len(df_merged)} records with {len(df_merged.columns)} columns")
+        
+            # Extract compute instance IDs. resourceId is categorical, so the distinct
+            # OCIDs still present after the merge come straight from the codes and the
+            # prefix check runs once per OCID rather than once per row.
+            resource_ids = df_merged['resourceId']
+            present_codes = np.unique(resource_ids.cat.codes.to_numpy())
+            present_ids = resource_ids.cat.categories[present_codes[present_codes >= 0]]
+            compute_instances = [rid for rid in present_ids if rid.startswith(COMPUTE_INSTANCE_PREFIX)]
+        
+            # Save basic merged CSV. Without compute instances nothing gets enriched,
+            # so output.csv is copied from output_merged.csv below instead.
+            output_csv = self.output_dir / 'output.csv'
+            if compute_instances:
+                write_csv(df_merged, output_csv)
+                print(f"✅ Basic merged CSV saved to {output_csv}")
+
+        finally:
+            spinner.stop()
         
-        # Drop merge key
-        df_merged = df_merged.drop('merge_key', axis=1)
+        print(f"\n📊 Found {len(compute_instances)} unique compute instances")
         
-        print(f"✅ Merged dataset: {len(df_merged)} records with {len(df_merged.columns)} columns")
+        return df_merged, compute_instances
+    
+    def enrich_with_metadata(self, df_merged, compute_instances, instance_metadata):
+        """
+        Fill shape/resourceName from pre-fetched instance metadata and save the CSVs.
         
-        # Save basic merged CSV
+        Args:
+            df_merged: Merged dataframe from merge_data
+            compute_instances: Compute instance OCIDs found by merge_data
+            instance_metadata: Metadata keyed by instance OCID
+            
+        Returns:
+            Enriched dataframe
+        """
         output_csv = self.output_dir / 'output.csv'
-        df_merged.to_csv(output_csv, index=False)
-        print(f"✅ Basic merged CSV saved to {output_csv}")
-        
-        # Extract compute instance IDs
-        compute_instances = df_merged[
-            df_merged['resourceId'].str.contains('instance.oc1', na=False, case=False)
-        ]['resourceId'].unique().tolist()
         
-        spinner.stop()
-        
-        print(f"\n📊 Found {len(compute_instances)} unique compute instances")
-        
-        # Fetch instance metadata if we have instances
         if len(compute_instances) > 0:
-            instance_metadata = self.fetch_instance_metadata(compute_instances)
-            
             # Save metadata cache
             metadata_file = self.output_dir / 'instance_metadata.json'
-            with open(metadata_file, 'w') as f:
-                json.dump(instance_metadata, f, indent=2)
+            write_json(instance_metadata, metadata_file)
             print(f"✅ Instance metadata cached to {metadata_file}")
             
             # Enrich dataframe
             print(f"\n🔄 Enriching data with instance metadata...")
-            spinner2 = ProgressSpinner("Processing enrichment...")
-            spinner2.start()
-            
-            def enrich_row(row):
-                resource_id = row.get('resourceId', '')
-                if resource_id in instance_metadata:
-                    metadata = instance_metadata[resource_id]
-                    if pd.isna(row.get('shape')) or row.get('shape') == '':
-                        row['shape'] = metadata.get('shape', '')
-                    if pd.isna(row.get('resourceName')) or row.get('resourceName') == '':
-                        row['resourceName'] = metadata.get('resourceName', '')
-                return row
             
-            df_merged = df_merged.apply(enrich_row, axis=1)
-            spinner2.stop()
+            # Fill missing shape/resourceName from metadata with column-wise operations.
+            # Only rows of instances with fetched metadata can change, so one mask
+            # selects them for every column; on the categorical resourceId both the
+            # isin and the map run once per distinct OCID.
+            compute_mask = df_merged['resourceId'].isin(instance_metadata.keys())
+            compute_ids = df_merged.loc[compute_mask, 'resourceId']
+            for column in ('shape', 'resourceName'):
+                column_map = {rid: metadata.get(column, '') for rid, metadata in instance_metadata.items()}
+                mapped = compute_ids.map(column_map)
+
+                if column not in df_merged.columns:
+                    df_merged[column] = None
+
+                current = df_merged.loc[compute_mask, column]
+                missing = current.isna() | (current == '')
+                fill_mask = missing & mapped.notna()
+                df_merged.loc[fill_mask[fill_mask].index, column] = mapped[fill_mask]
             
             # Count enriched records
             enriched_shape = df_merged['shape'].notna().sum()
@@ -166,10 +265,21 @@ class OCICostCollector:
         else:
             print("⚠️  No compute instances found, skipping metadata enrichment")
         
-        # Save final enriched CSV
+        # Low-cardinality descriptive columns are stored as categoricals
+        for col in ('shape', 'platform', 'region', 'skuPartNumber'):
+            if col in df_merged.columns:
+                df_merged[col] = df_merged[col].astype('category')
+        
+        # Save final enriched CSV (plus a Parquet copy from the same Arrow table)
         output_merged = self.output_dir / 'output_merged.csv'
-        df_merged.to_csv(output_merged, index=False)
+        output_parquet = self.output_dir / 'output_merged.parquet'
+        parquet_written = write_csv(df_merged, output_merged, parquet_path=output_parquet)
+        if not compute_instances:
+            shutil.copyfile(output_merged, output_csv)
+            print(f"✅ Basic merged CSV saved to {output_csv}")
         print(f"✅ Final enriched CSV saved to {output_merged}")
+        if parquet_written:
+            print(f"✅ Parquet copy saved to {output_parquet}")
         
         return df_merged
     
@@ -200,162 +310,267 @@ class OCICostCollector:
             
             # Save enhanced version with tags
             output_with_tags = self.output_dir / 'output_with_tags.csv'
-            df_merged.to_csv(output_with_tags, index=False)
+            write_csv(df_merged, output_with_tags)
             print(f"✅ Enhanced CSV with tags saved to {output_with_tags}")
         
         return df_merged
     
+    def run_growth_collection(self, force_refresh=False):
+        """
+        Run the growth collection (tag analysis) stage.
+        
+        Args:
+            force_refresh: Ignore cached compartment and tag discovery results
+        
+        Returns:
+            OCIGrowthCollector holding the collected tag data
+        """
+        print(f"\n{'='*70}")
+        print("🌱 Running Growth Collection - Tag Analysis")
+        print(f"{'='*70}")
+        
+        growth_collector_obj = OCIGrowthCollector(
+            tenancy_ocid=self.tenancy_ocid,
+            home_region=self.home_region,
+            output_dir=str(self.output_dir)
+        )
+        
+        # Collect tag data
+        growth_collector_obj.collect_all(
+            from_date=self.from_date,
+            to_date=self.to_date,
+            force_refresh=force_refresh
+        )
+        
+        return growth_collector_obj
+    
+    def fetch_recommendations(self, currency='USD', force=False, regions=None):
+        """
+        Fetch cost-saving recommendations from Cloud Advisor.
+        
+        Args:
+            currency: Currency code for savings estimates
+            force: Ignore recently cached recommendations and always call the API
+            regions: Regions to fetch in parallel, each saved to its own
+                recommendations_<region>.* files (default: home region only)
+            
+        Returns:
+            Path to the recommendations file or None if failed
+        """
+        print(f"\n{'='*70}")
+        print("🔄 Fetching Cost-Saving Recommendations")
+        print(f"{'='*70}")
+        
+        recommendations_fetcher = OCIRecommendationsFetcher(
+            tenancy_ocid=self.tenancy_ocid,
+            region=self.home_region,
+            output_dir=str(self.output_dir),
+            currency=currency
+        )
+        
+        max_cache_age = None if force else RECOMMENDATIONS_CACHE_TTL
+        if regions:
+            return recommendations_fetcher.fetch_and_save_many(regions, max_cache_age=max_cache_age)
+        return recommendations_fetcher.fetch_and_save(max_cache_age=max_cache_age)
+    
     def collect(self, skip_cost=False, skip_usage=False, skip_enrichment=False, 
-                skip_recommendations=False, growth_collection=False, currency='USD'):
+                skip_recommendations=False, growth_collection=False, currency='USD',
+                force_recommendations=False, refresh_growth_cache=False, recommendation_regions=None):
         """Main collection workflow with optional stage control."""
-        print("="*70)
-        print("🚀 OCI Cost Report Collector v2.2.1")
-        print("="*70)
-        print(f"Tenancy: {self.tenancy_ocid}")
-        print(f"Region: {self.home_region}")
-        print(f"From: {self.from_date}")
-        print(f"To: {self.to_date}")
-        print(f"Currency: {currency}")
-        
-        # Stage control
-        if skip_cost or skip_usage or skip_enrichment or skip_recommendations or growth_collection:
-            print(f"\n⚠️  Running with stage control:")
-            if skip_cost:
-                print("   - Skipping COST data collection")
-            if skip_usage:
-                print("   - Skipping USAGE data collection")
-            if skip_enrichment:
-                print("   - Skipping instance metadata enrichment")
-            if skip_recommendations:
-                print("   - Skipping recommendations collection")
-            if growth_collection:
-                print("   + GROWTH COLLECTION ADD-ON (tag enrichment)")
-        
-        growth_collector_obj = None
-        
-        data1 = None
-        data2 = None
-        df_merged = None
-        
-        # First API call - COST query with service details
-        if not skip_cost:
-            data1 = self.make_api_call(
-                query_type="COST",
-                group_by_fields=["service", "skuName", "resourceId", "compartmentPath"],
-                call_name="COST_API_Call"
-            )
+        try:
+            print("="*70)
+            print("🚀 OCI Cost Report Collector v2.2.1")
+            print("="*70)
+            print(f"Tenancy: {self.tenancy_ocid}")
+            print(f"Region: {self.home_region}")
+            print(f"From: {self.from_date}")
+            print(f"To: {self.to_date}")
+            print(f"Currency: {currency}")
             
-            if data1 is None:
+            # Stage control
+            if skip_cost or skip_usage or skip_enrichment or skip_recommendations or growth_collection:
+                print(f"\n⚠️  Running with stage control:")
+                if skip_cost:
+                    print("   - Skipping COST data collection")
+                if skip_usage:
+                    print("   - Skipping USAGE data collection")
+                if skip_enrichment:
+                    print("   - Skipping instance metadata enrichment")
+                if skip_recommendations:
+                    print("   - Skipping recommendations collection")
+                if growth_collection:
+                    print("   + GROWTH COLLECTION ADD-ON (tag enrichment)")
+            
+            growth_collector_obj = None
+            
+            data1 = None
+            data2 = None
+            df_merged = None
+            
+            # COST (service details) and USAGE (platform details) queries are
+            # independent, so the executor runs them concurrently
+            calls = []
+            if not skip_cost:
+                calls.append(("COST", ["service", "skuName", "resourceId", "compartmentPath"],
+                              "COST_API_Call", self.from_date, self.to_date))
+            if not skip_usage:
+                calls.append(("USAGE", ["resourceId", "platform", "region", "skuPartNumber"],
+                              "USAGE_API_Call", self.from_date, self.to_date))
+            
+            results = dict(zip((call[0] for call in calls), self.api_executor.make_parallel_calls(calls)))
+            # Popped so that releasing data1/data2 after the merge frees the responses
+            data1 = results.pop("COST", None)
+            data2 = results.pop("USAGE", None)
+            del results
+            
+            if not skip_cost and data1 is None:
                 print("\n❌ Failed to retrieve cost data")
                 return False
-        
-        # Second API call - USAGE query with platform details
-        if not skip_usage:
-            data2 = self.make_api_call(
-                query_type="USAGE",
-                group_by_fields=["resourceId", "platform", "region", "skuPartNumber"],
-                call_name="USAGE_API_Call"
-            )
             
-            if data2 is None:
+            if not skip_usage and data2 is None:
                 print("\n❌ Failed to retrieve usage data")
                 return False
-        
-        # Merge and enrich
-        if not (skip_cost or skip_usage):
-            try:
-                if skip_enrichment:
-                    print("\n⚠️  Skipping enrichment - saving basic merged data only")
-                    # Still need to do basic merge even if skipping enrichment
-                df_merged = self.merge_and_enrich(data1, data2)
-                
-                # Enrich with growth collection tag data if flag is enabled
-                if growth_collection and df_merged is not None:
-                    print(f"\n{'='*70}")
-                    print("🌱 Running Growth Collection - Tag Analysis")
-                    print(f"{'='*70}")
-                    
-                    growth_collector_obj = OCIGrowthCollector(
-                        tenancy_ocid=self.tenancy_ocid,
-                        home_region=self.home_region,
-                        output_dir=str(self.output_dir)
+            
+            with ThreadPoolExecutor(max_workers=3) as stage_executor:
+                # Recommendations and growth collection do not depend on the merged
+                # data, so they run in the background while the merge is enriched.
+                # Their output is buffered and printed when their result is used,
+                # so it does not interleave with the enrichment output.
+                recommendations_future = None
+                if not skip_recommendations:
+                    recommendations_output = BufferedOutput()
+                    recommendations_future = stage_executor.submit(
+                        recommendations_output.call, self.fetch_recommendations,
+                        currency, force_recommendations, recommendation_regions
                     )
-                    
-                    try:
-                        # Collect tag data
-                        growth_collector_obj.collect_all(
-                            from_date=self.from_date,
-                            to_date=self.to_date
-                        )
-                        
-                        # Enrich the merged dataframe with tag information
-                        print(f"\n{'='*70}")
-                        print("🔄 Enriching cost/usage data with tag information")
-                        print(f"{'='*70}")
-                        
-                        df_merged = growth_collector_obj.enrich_dataframe_with_tags(df_merged)
-                        
-                        # Re-save the enriched dataframe to output_merged.csv
-                        output_merged = self.output_dir / 'output_merged.csv'
-                        df_merged.to_csv(output_merged, index=False)
-                        print(f"✅ Tag-enriched data saved to {output_merged}")
-                        
-                    except Exception as e:
-                        print(f"\n⚠️  Warning: Growth collection/enrichment failed: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        print("Continuing with unenriched data...")
-                    
-            except Exception as e:
-                print(f"\n❌ Merge and enrichment failed: {e}")
-                import traceback
-                traceback.print_exc()
-                return False
-        
-        # Fetch cost-saving recommendations from Cloud Advisor
-        if not skip_recommendations:
+                
+                growth_future = None
+                recommendations_file = None
+                try:
+                    # Merge and enrich
+                    if not (skip_cost or skip_usage):
+                        try:
+                            if skip_enrichment:
+                                print("\n⚠️  Skipping enrichment - saving basic merged data only")
+                                # Still need to do basic merge even if skipping enrichment
+                            df_merged, compute_instances = self.merge_data(data1, data2)
+                            # The raw responses are on disk in out.json; release them
+                            data1 = data2 = None
+                            
+                            if growth_collection and df_merged is not None:
+                                growth_output = BufferedOutput()
+                                growth_future = stage_executor.submit(
+                                    growth_output.call, self.run_growth_collection, refresh_growth_cache
+                                )
+                            
+                            # Metadata is only needed for enrichment, so it is fetched in this thread
+                            instance_metadata = {}
+                            if compute_instances:
+                                instance_metadata = self.fetch_instance_metadata(compute_instances)
+                            df_merged = self.enrich_with_metadata(df_merged, compute_instances, instance_metadata)
+                            
+                            # Enrich with growth collection tag data if flag is enabled
+                            if growth_future is not None:
+                                try:
+                                    try:
+                                        growth_collector_obj = growth_future.result()
+                                    finally:
+                                        growth_output.flush()
+                                    
+                                    # Enrich the merged dataframe with tag information
+                                    print(f"\n{'='*70}")
+                                    print("🔄 Enriching cost/usage data with tag information")
+                                    print(f"{'='*70}")
+                                    
+                                    columns_before = set(df_merged.columns)
+                                    df_merged = growth_collector_obj.enrich_dataframe_with_tags(df_merged)
+                                    
+                                    # Re-save the enriched dataframe to output_merged.csv, unless
+                                    # no tag columns were added and the saved file is still current
+                                    output_merged = self.output_dir / 'output_merged.csv'
+                                    if set(df_merged.columns) != columns_before:
+                                        output_parquet = self.output_dir / 'output_merged.parquet'
+                                        parquet_written = write_csv(df_merged, output_merged, parquet_path=output_parquet)
+                                        print(f"✅ Tag-enriched data saved to {output_merged}")
+                                        if parquet_written:
+                                            print(f"✅ Parquet copy saved to {output_parquet}")
+                                    else:
+                                        print(f"⚠️  No tag columns added, keeping {output_merged}")
+                                    
+                                except Exception as e:
+                                    print(f"\n⚠️  Warning: Growth collection/enrichment failed: {e}")
+                                    import traceback
+                                    traceback.print_exc()
+                                    print("Continuing with unenriched data...")
+                                
+                        except Exception as e:
+                            print(f"\n❌ Merge and enrichment failed: {e}")
+                            import traceback
+                            traceback.print_exc()
+                            return False
+                
+                finally:
+                    # Resolved even when the merge fails, so the output the
+                    # background stages buffered (including their errors) is printed
+                    if growth_future is not None:
+                        wait([growth_future])
+                        growth_output.flush()
+                    if recommendations_future is not None:
+                        try:
+                            recommendations_file = recommendations_future.result()
+                        finally:
+                            recommendations_output.flush()
+                
+                # Cost-saving recommendations are only needed for the final summary
+                if recommendations_future is not None:
+                    if recommendations_file:
+                        print(f"✅ Recommendations successfully fetched and saved")
+                    else:
+                        print(f"⚠️  Warning: Could not fetch recommendations (may not have Cloud Advisor access)")
+            
+            # Success summary
             print(f"\n{'='*70}")
-            print("🔄 Fetching Cost-Saving Recommendations")
+            print("🎉 SUCCESS!")
             print(f"{'='*70}")
+            print(f"📁 Output directory: {self.output_dir.resolve()}")
+            print("\n📋 Output files:")
+            if not (skip_cost or skip_usage):
+                if growth_collection:
+                    print(f"  - {self.output_dir}/output_merged.csv: Complete data enriched with tags")
+                else:
+                    print(f"  - {self.output_dir}/output_merged.csv: Complete enriched data")
+                if (self.output_dir / 'output_merged.parquet').exists():
+                    print(f"  - {self.output_dir}/output_merged.parquet: Same data in Parquet format (faster to load)")
+                print(f"  - {self.output_dir}/output.csv: Basic merged data (no enrichment)")
+                print(f"  - {self.output_dir}/out.json: Raw API responses")
+                print(f"  - {self.output_dir}/instance_metadata.json: Cached instance metadata")
+            if not skip_recommendations and recommendation_regions:
+                print(f"  - {self.output_dir}/recommendations_<region>.out, .json, .jsonl: "
+                      f"Recommendations per region ({', '.join(recommendation_regions)})")
+            elif not skip_recommendations:
+                print(f"  - {self.output_dir}/recommendations.out: Actionable cost-saving recommendations")
+                print(f"  - {self.output_dir}/recommendations.json: Raw recommendations JSON")
+                print(f"  - {self.output_dir}/recommendations.jsonl: Raw recommendations, one per line")
+            if growth_collection and not (skip_cost or skip_usage):
+                print(f"  - {self.output_dir}/growth_collection_tags.json: Complete tag analysis data")
+                print(f"  - {self.output_dir}/growth_collection_summary.txt: Tag analysis summary")
+                print(f"  - {self.output_dir}/growth_audit_events.jsonl, growth_metrics_*.jsonl: Audit event and metric samples")
             
-            recommendations_fetcher = OCIRecommendationsFetcher(
-                tenancy_ocid=self.tenancy_ocid,
-                region=self.home_region,
-                output_dir=str(self.output_dir),
-                currency=currency
-            )
-            
-            recommendations_file = recommendations_fetcher.fetch_and_save()
-            
-            if recommendations_file:
-                print(f"✅ Recommendations successfully fetched and saved")
-            else:
-                print(f"⚠️  Warning: Could not fetch recommendations (may not have Cloud Advisor access)")
-        
-        # Success summary
-        print(f"\n{'='*70}")
-        print("🎉 SUCCESS!")
-        print(f"{'='*70}")
-        print(f"📁 Output directory: {self.output_dir.resolve()}")
-        print("\n📋 Output files:")
-        if not (skip_cost or skip_usage):
-            if growth_collection:
-                print(f"  - {self.output_dir}/output_merged.csv: Complete data enriched with tags")
-            else:
-                print(f"  - {self.output_dir}/output_merged.csv: Complete enriched data")
-            print(f"  - {self.output_dir}/output.csv: Basic merged data (no enrichment)")
-            print(f"  - {self.output_dir}/out.json: Raw API responses")
-            print(f"  - {self.output_dir}/instance_metadata.json: Cached instance metadata")
-        if not skip_recommendations:
-            print(f"  - {self.output_dir}/recommendations.out: Actionable cost-saving recommendations")
-            print(f"  - {self.output_dir}/recommendations.json: Raw recommendations JSON")
-        if growth_collection and not (skip_cost or skip_usage):
-            print(f"  - {self.output_dir}/growth_collection_tags.json: Complete tag analysis data")
-            print(f"  - {self.output_dir}/growth_collection_summary.txt: Tag analysis summary")
-        if not (skip_cost or skip_usage):
-            print(f"  - {self.output_dir}/request_*.json: API request payloads")
-        
-        return True
+            return True
+        finally:
+            # The fetcher keeps its instance cache; its pool is recreated on the next lookup
+            self.metadata_fetcher.close()
+
+
+def _positive_rate(value):
+    """argparse type for --metadata-rate-limit: a number greater than 0."""
+    try:
+        rate = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    if not rate > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return rate
 
 
 def main():
@@ -374,11 +589,21 @@ def main():
     parser.add_argument('--skip-usage', action='store_true', help='Skip usage data collection')
     parser.add_argument('--skip-enrichment', action='store_true', help='Skip instance metadata enrichment')
     parser.add_argument('--skip-recommendations', action='store_true', help='Skip recommendations collection')
+    parser.add_argument('--metadata-rate-limit', type=_positive_rate, default=None,
+                        help='Max instance metadata lookups started per second during enrichment, '
+                             'greater than 0 (default: no limit)')
     parser.add_argument('--only-recommendations', action='store_true', help='Only fetch recommendations (skip all other stages)')
+    parser.add_argument('--force-recommendations', action='store_true',
+                        help='Fetch recommendations even if they were cached for this tenancy and region less than an hour ago')
+    parser.add_argument('--regions', type=lambda value: [region.strip() for region in value.split(',') if region.strip()],
+                        help='Comma-separated regions to fetch recommendations from in parallel, '
+                             'saved to recommendations_<region>.* (default: home region only)')
     parser.add_argument('--growth-collection', action='store_true', 
                         help='Collect growth-related data (tag namespaces, definitions, defaults, cost-tracking tags)')
     parser.add_argument('--only-growth', action='store_true', 
                         help='Only run growth collection (skip cost/usage data collection)')
+    parser.add_argument('--refresh-growth-cache', action='store_true',
+                        help='Re-discover compartments and tags even if the cached results are less than a day old')
     
     args = parser.parse_args()
     
@@ -399,7 +624,8 @@ def main():
             skip_enrichment=True,
             skip_recommendations=True,
             growth_collection=True,
-            currency=args.currency
+            currency=args.currency,
+            refresh_growth_cache=args.refresh_growth_cache
         )
         sys.exit(0 if success else 1)
     
@@ -408,7 +634,8 @@ def main():
         tenancy_ocid=args.tenancy_ocid,
         home_region=args.home_region,
         from_date=args.from_date,
-        to_date=args.to_date
+        to_date=args.to_date,
+        metadata_rate_limit=args.metadata_rate_limit
     )
     
     # Handle only-recommendations mode
@@ -416,13 +643,9 @@ def main():
         print("="*70)
         print("🚀 Running in RECOMMENDATIONS-ONLY mode")
         print("="*70)
-        recommendations_fetcher = OCIRecommendationsFetcher(
-            tenancy_ocid=args.tenancy_ocid,
-            region=args.home_region,
-            output_dir=str(collector.output_dir),
-            currency=args.currency
+        recommendations_file = collector.fetch_recommendations(
+            args.currency, force=args.force_recommendations, regions=args.regions
         )
-        recommendations_file = recommendations_fetcher.fetch_and_save()
         if recommendations_file:
             print("\n✅ Recommendations fetched successfully!")
             sys.exit(0)
@@ -437,7 +660,10 @@ def main():
         skip_enrichment=args.skip_enrichment,
         skip_recommendations=args.skip_recommendations,
         growth_collection=args.growth_collection,
-        currency=args.currency
+        currency=args.currency,
+        force_recommendations=args.force_recommendations,
+        refresh_growth_cache=args.refresh_growth_cache,
+        recommendation_regions=args.regions
     )
     sys.exit(0 if success else 1)
 
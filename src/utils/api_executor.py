@@ -4,10 +4,18 @@ Copyright (c) 2025 Oracle and/or its affiliates.
 """
 
 import json
+import os
+import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from .progress import ProgressSpinner
+from .progress import ProgressSpinner, ProgressTracker
+from .serialization import json_dumps, json_loads
+
+# Maximum Usage API requests in flight per executor, to stay clear of 429 throttling
+MAX_CONCURRENT_REQUESTS = 4
 
 
 class OCIAPIExecutor:
@@ -20,8 +28,25 @@ class OCIAPIExecutor:
         self.api_endpoint = f"https://usageapi.{home_region}.oci.oraclecloud.com/20200107/usage"
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Resolve the OCI CLI once instead of on every PATH lookup. A missing
+        # binary is not an error here: the SDK transport does not need it.
+        self._oci_bin = shutil.which('oci') or 'oci'
+        
+        # The executor is shared across calls, so the raw-request command is
+        # built once; each call pipes its request body through stdin
+        self._raw_request_command = [
+            self._oci_bin, 'raw-request',
+            '--http-method', 'POST',
+            '--target-uri', self.api_endpoint,
+            '--request-body', 'file:///dev/stdin',
+            '--output', 'json'
+        ]
+        
+        # Caps concurrent requests made through this executor
+        self._request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
     
-    def make_api_call(self, query_type, group_by_fields, call_name, from_date, to_date):
+    def make_api_call(self, query_type, group_by_fields, call_name, from_date, to_date, show_progress=True):
         """
         Make a single API call to OCI Usage API with progress tracking.
         
@@ -31,6 +56,7 @@ class OCIAPIExecutor:
             call_name: Name of the API call for logging
             from_date: Start date (YYYY-MM-DD)
             to_date: End date (YYYY-MM-DD)
+            show_progress: Display a spinner while waiting (disable when calls run concurrently)
         
         Returns:
             API response data or None if failed
@@ -46,47 +72,61 @@ class OCIAPIExecutor:
             "compartmentDepth": 4
         }
         
-        # Save request body to temp file
-        request_file = self.output_dir / Path(f"request_{call_name}.json")
-        with open(request_file, 'w') as f:
-            json.dump(request_body, f, indent=2)
+        # The OCI SDK is slow to import, so it is only loaded once a call is made
+        from .oci_client import SDK_TIMEOUTS, get_rest_client
+        rest_client = get_rest_client()
         
-        # Create and start progress spinner
-        spinner = ProgressSpinner(f"🌐 Contacting OCI API for {call_name}...")
-        spinner.start()
+        # Create and start progress spinner (skipped under make_parallel_calls,
+        # which renders one aggregate tracker instead of a thread per call)
+        spinner = ProgressSpinner(f"🌐 Contacting OCI API for {call_name}...") if show_progress else None
+        if spinner:
+            spinner.start()
         
-        result = None
+        # Raw response bytes, kept so debug files can be written without re-serializing
+        payload = None
         try:
-            # Execute OCI CLI raw-request
-            result = subprocess.run(
-                [
-                    'oci', 'raw-request',
-                    '--http-method', 'POST',
-                    '--target-uri', self.api_endpoint,
-                    '--request-body', f'file://{request_file}',
-                    '--output', 'json'
-                ],
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            # Stop spinner
-            spinner.stop()
-            
-            # Clean up temp file
-            request_file.unlink()
-            
-            if result.returncode != 0:
-                print(f"❌ API call failed: {result.stderr}")
-                print(f"\n📋 Debug information:")
-                print(f"   Return code: {result.returncode}")
-                print(f"   Command: oci raw-request")
-                print(f"   Stderr: {result.stderr[:300]}")
-                return None
+            if rest_client is not None:
+                # Signed REST call over the shared SDK session
+                with self._request_slots:
+                    status, payload = rest_client.request_raw(
+                        'POST', self.api_endpoint, body=request_body, timeout=300
+                    )
+                
+                # Stop spinner
+                if spinner:
+                    spinner.stop()
+                
+                if not payload:
+                    print(f"❌ API call failed: empty response (HTTP {status})")
+                    return None
+            else:
+                # Execute OCI CLI raw-request, piping the request body through stdin
+                with self._request_slots:
+                    result = subprocess.run(
+                        self._raw_request_command,
+                        input=json_dumps(request_body, indent=False),
+                        capture_output=True,
+                        timeout=300
+                    )
+                
+                # Stop spinner
+                if spinner:
+                    spinner.stop()
+                
+                if result.returncode != 0:
+                    stderr = result.stderr.decode('utf-8', errors='replace')
+                    print(f"❌ API call failed: {stderr}")
+                    print(f"\n📋 Debug information:")
+                    print(f"   Return code: {result.returncode}")
+                    print(f"   Command: oci raw-request")
+                    print(f"   Stderr: {stderr[:300]}")
+                    return None
+                
+                payload = result.stdout
             
-            # Parse response
-            response = json.loads(result.stdout)
+            # Parse response (payload is bytes, which orjson reads without a decode).
+            # The whole document is kept: out.json stores every item field.
+            response = json_loads(payload)
             
             # Extract data first
             api_data = response.get('data', response)
@@ -118,9 +158,8 @@ class OCIAPIExecutor:
                     print(f"   Additional details: {api_data.get('details')}")
                 
                 # Save error response for investigation
-                debug_file = self.output_dir / Path(f"debug_error_{call_name}.json")
-                with open(debug_file, 'w') as f:
-                    json.dump(response, f, indent=2)
+                debug_file = self.output_dir / f"debug_error_{call_name}.json"
+                debug_file.write_bytes(payload)
                 print(f"\n   📁 Full error response saved to: {debug_file}")
                 
                 return None
@@ -134,32 +173,38 @@ class OCIAPIExecutor:
             print(f"\n📋 Response details for debugging:")
             print(f"   Response type: {type(api_data)}")
             print(f"   Response keys: {list(api_data.keys()) if isinstance(api_data, dict) else 'N/A'}")
-            print(f"   Full response (first 500 chars): {str(response)[:500]}")
+            # Slice the raw bytes; str(response) would format the whole document first
+            print(f"   Full response (first 500 chars): {payload[:500].decode('utf-8', errors='replace')}")
             
-            # Save full response for investigation
-            debug_file = self.output_dir / Path(f"debug_response_{call_name}.json")
-            with open(debug_file, 'w') as f:
-                json.dump(response, f, indent=2)
-            print(f"   📁 Full response saved to: {debug_file}")
+            # Save full response for investigation (opt-in: it can be very large)
+            if os.environ.get('OCI_FINOPS_DEBUG') == '1':
+                debug_file = self.output_dir / f"debug_response_{call_name}.json"
+                debug_file.write_bytes(payload)
+                print(f"   📁 Full response saved to: {debug_file}")
+            else:
+                print(f"   Response size: {len(payload)} bytes (set OCI_FINOPS_DEBUG=1 to save it)")
             
             return None
         
-        except subprocess.TimeoutExpired:
-            spinner.stop()
+        except (subprocess.TimeoutExpired,) + SDK_TIMEOUTS:
+            if spinner:
+                spinner.stop()
             print("❌ API call timeout after 300 seconds")
             print("\n📋 Debug information:")
             print("   The API took longer than 300 seconds to respond")
             print("   This may indicate a large dataset or network issues")
             return None
         except json.JSONDecodeError as json_err:
-            spinner.stop()
+            if spinner:
+                spinner.stop()
             print(f"❌ Failed to parse API response as JSON: {json_err}")
             print("\n📋 Debug information:")
-            if result:
-                print(f"   Raw response (first 500 chars): {result.stdout[:500]}")
+            if payload:
+                print(f"   Raw response (first 500 chars): {payload[:500].decode('utf-8', errors='replace')}")
             return None
         except Exception as e:
-            spinner.stop()
+            if spinner:
+                spinner.stop()
             print(f"❌ API call failed: {e}")
             print("\n📋 Debug information:")
             print(f"   Exception type: {type(e).__name__}")
@@ -168,7 +213,10 @@ class OCIAPIExecutor:
     
     def make_parallel_calls(self, calls):
         """
-        Execute multiple API calls in sequence with clear separation.
+        Execute multiple API calls concurrently.
+        
+        Each result is stored at its call's submission index, so the output
+        order does not depend on which call finishes first.
         
         Args:
             calls: List of tuples (query_type, group_by_fields, call_name, from_date, to_date)
@@ -176,21 +224,26 @@ class OCIAPIExecutor:
         Returns:
             List of API responses in the same order as input
         """
-        results = []
+        if len(calls) <= 1:
+            return [self.make_api_call(*call) for call in calls]
         
-        for query_type, group_by_fields, call_name, from_date, to_date in calls:
-            print(f"\n{'='*70}")
-            print(f"🔄 Making {call_name}")
-            print(f"{'='*70}")
-            
-            result = self.make_api_call(
-                query_type=query_type,
-                group_by_fields=group_by_fields,
-                call_name=call_name,
-                from_date=from_date,
-                to_date=to_date
-            )
+        print(f"\n{'='*70}")
+        print(f"🔄 Making {', '.join(call[2] for call in calls)} in parallel")
+        print(f"{'='*70}")
+        
+        # One tracker for all calls; per-call spinners would garble the terminal
+        progress = ProgressTracker(len(calls), "Usage API calls")
+        results = [None] * len(calls)
+        
+        with ThreadPoolExecutor(max_workers=min(len(calls), 8)) as executor:
+            futures = {
+                executor.submit(self.make_api_call, *call, show_progress=False): index
+                for index, call in enumerate(calls)
+            }
             
-            results.append(result)
+            for completed, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                progress.update(completed)
         
+        progress.finish()
         return results
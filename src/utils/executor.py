@@ -3,44 +3,112 @@ Parallel executor utilities for concurrent OCI API operations.
 Copyright (c) 2025 Oracle and/or its affiliates.
 """
 
-import json
+import re
+import shutil
 import subprocess
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from .progress import ProgressTracker
+from .serialization import json_loads
+
+# Maximum GetInstance requests in flight at once over the shared SDK session
+MAX_INFLIGHT_REQUESTS = 50
+
+# Instance OCID (ocid1.instance.<realm>.<region>.<unique_id>); group 1 is the region
+INSTANCE_OCID_PATTERN = re.compile(r'^ocid1\.instance\.oc[0-9]+\.([a-z0-9-]+)\..+$')
 
 
 class OCIMetadataFetcher:
     """Fetch OCI instance metadata in parallel using ThreadPoolExecutor."""
     
-    def __init__(self, max_workers=10):
-        """Initialize fetcher with thread pool size."""
+    def __init__(self, max_workers=10, rate_limit_per_sec=None):
+        """
+        Initialize fetcher with thread pool size.
+        
+        Args:
+            max_workers: Upper bound on worker threads; each call uses at most one
+                thread per pending instance. Since workers spend nearly all their
+                time waiting on OCI, about 2-3x the expected number of in-flight
+                requests works best (the extra threads absorb slow responses).
+            rate_limit_per_sec: Optional cap on lookups started per second
+                (greater than 0; None means no limit)
+        """
+        if rate_limit_per_sec is not None and not rate_limit_per_sec > 0:
+            raise ValueError(f"rate_limit_per_sec must be greater than 0, got {rate_limit_per_sec}")
         self.max_workers = max_workers
+        self.rate_limit_per_sec = rate_limit_per_sec
+        # OCI CLI path for the fallback transport, resolved once
+        self._oci_bin = shutil.which('oci') or 'oci'
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+        # Successful lookups keyed by instance OCID; failures are not cached so
+        # they are retried on the next call
+        self._cache = {}
+        # In-process requests are cheap, so the pool can be large; this keeps
+        # the number of concurrent calls against a regional endpoint bounded
+        self._inflight = threading.BoundedSemaphore(MAX_INFLIGHT_REQUESTS)
+        # Long-lived worker pool reused across fetch_metadata calls
+        self._executor = None
+        self._executor_workers = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
-    def _fetch_single_instance(self, instance_id):
+    def close(self):
+        """Shut down the worker pool, waiting for running lookups."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _get_executor(self):
+        """Return the shared worker pool, recreating it if max_workers changed."""
+        if self._executor is None or self._executor_workers != self.max_workers:
+            self.close()
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='oci-meta')
+            self._executor_workers = self.max_workers
+        return self._executor
+    
+    def _throttle(self):
+        """Space out lookups so no more than rate_limit_per_sec start per second."""
+        if not self.rate_limit_per_sec:
+            return
+        
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + 1.0 / self.rate_limit_per_sec
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _fetch_single_instance(self, instance_id, region):
         """Fetch metadata for a single instance. Helper for parallel processing."""
+        self._throttle()
         try:
-            # Extract region from OCID (format: ocid1.instance.oc1.<region>.<unique_id>)
-            parts = instance_id.split('.')
-            if len(parts) < 4:
-                return instance_id, None
-            
-            region = parts[3]
+            # Prefer a signed in-process GET over forking the OCI CLI
+            from .oci_client import get_rest_client
+            rest_client = get_rest_client()
+            if rest_client is not None:
+                return instance_id, self._fetch_instance_sdk(rest_client, instance_id, region)
             
             # Call OCI CLI to get instance details
             result = subprocess.run(
                 [
-                    'oci', 'compute', 'instance', 'get',
+                    self._oci_bin, 'compute', 'instance', 'get',
                     '--instance-id', instance_id,
                     '--region', region,
                     '--output', 'json'
                 ],
                 capture_output=True,
-                text=True,
                 timeout=30
             )
             
             if result.returncode == 0:
-                instance_data = json.loads(result.stdout)
+                instance_data = json_loads(result.stdout)
                 if 'data' in instance_data:
                     data = instance_data['data']
                     return instance_id, {
@@ -53,6 +121,35 @@ class OCIMetadataFetcher:
         except subprocess.TimeoutExpired:
             return instance_id, None
     
+    def _fetch_instance_sdk(self, rest_client, instance_id, region):
+        """
+        Fetch instance details through the shared OCI REST session.
+        
+        Args:
+            rest_client: OCIRestClient to send the request with
+            instance_id: Instance OCID
+            region: Region name or short code taken from the OCID
+        
+        Returns:
+            dict with shape and resourceName, or None if the lookup failed
+        """
+        from .oci_client import SDK_ERRORS, service_endpoint
+        
+        try:
+            url = f"{service_endpoint('compute', region)}/20160918/instances/{instance_id}"
+            with self._inflight:
+                status, data = rest_client.request('GET', url, timeout=30)
+        except SDK_ERRORS:
+            return None
+        
+        if status != 200 or not isinstance(data, dict):
+            return None
+        
+        return {
+            'shape': data.get('shape', ''),
+            'resourceName': data.get('displayName', '')
+        }
+    
     def fetch_metadata(self, instance_ids, progress_callback=None):
         """
         Fetch metadata for multiple instances in parallel with progress tracking.
@@ -64,39 +161,50 @@ class OCIMetadataFetcher:
         Returns:
             Tuple of (instance_metadata dict, successful count, failed count)
         """
-        instance_metadata = {}
-        successful = 0
-        failed = 0
+        # Serve previously fetched instances from the cache
+        instance_metadata = {iid: self._cache[iid] for iid in instance_ids if iid in self._cache}
+        pending_ids = [iid for iid in instance_ids if iid not in self._cache]
+        successful = len(instance_metadata)
+        
+        # Malformed OCIDs fail here instead of occupying a worker; valid ones
+        # are submitted with their region already extracted
+        matches = [(iid, INSTANCE_OCID_PATTERN.match(iid)) for iid in pending_ids]
+        pending = [(iid, match.group(1)) for iid, match in matches if match]
+        failed = len(pending_ids) - len(pending)
         completed = 0
         
+        if not pending:
+            return instance_metadata, successful, failed
+        
         # Create progress tracker
-        progress = ProgressTracker(len(instance_ids), "Retrieving instance details")
-        
-        # Use ThreadPoolExecutor for parallel processing
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_instance = {
-                executor.submit(self._fetch_single_instance, iid): iid 
-                for iid in instance_ids
-            }
+        progress = ProgressTracker(len(pending), "Retrieving instance details")
+        
+        # Submit all tasks to the shared pool; it starts threads on demand, so
+        # small batches only use as many workers as they need
+        executor = self._get_executor()
+        future_to_instance = {
+            executor.submit(self._fetch_single_instance, iid, region): iid 
+            for iid, region in pending
+        }
+        
+        # Process completed tasks as they finish
+        for future in as_completed(future_to_instance):
+            instance_id, metadata = future.result()
+            completed += 1
+            
+            if metadata is not None:
+                instance_metadata[instance_id] = metadata
+                self._cache[instance_id] = metadata
+                successful += 1
+            else:
+                failed += 1
+            
+            # Update progress display
+            progress.update(completed)
             
-            # Process completed tasks as they finish
-            for future in as_completed(future_to_instance):
-                instance_id, metadata = future.result()
-                completed += 1
-                
-                if metadata is not None:
-                    instance_metadata[instance_id] = metadata
-                    successful += 1
-                else:
-                    failed += 1
-                
-                # Update progress display
-                progress.update(completed)
-                
-                # Optional callback
-                if progress_callback:
-                    progress_callback(completed)
+            # Optional callback
+            if progress_callback:
+                progress_callback(completed)
         
         # Finish progress display
         progress.finish()
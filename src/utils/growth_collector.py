@@ -3,19 +3,43 @@ Growth Collection utilities for OCI tag-related data.
 Copyright (c) 2025 Oracle and/or its affiliates.
 """
 
+import itertools
 import json
 import subprocess
 import sys
+import threading
+import time
+from collections import Counter
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from .progress import ProgressSpinner, ProgressTracker
+from .serialization import atomic_open, json_dumps, json_loads, write_json, write_json_object, write_jsonl
+
+# Compartments, tag namespaces and tag definitions change rarely, so discovery
+# results are reused for this many seconds (see OCIGrowthCollector.cache_ttl)
+DISCOVERY_CACHE_TTL = 24 * 3600
+
+# Tag keys (lowercase) mapped to the primary_cost_center / primary_environment columns
+COST_CENTER_KEYS = frozenset({'costcenter', 'cost-center', 'cost_center', 'department'})
+ENV_KEYS = frozenset({'environment', 'env', 'stage'})
+
+# Audit events and metric samples kept per run; they are written to JSON Lines
+# files next to growth_collection_tags.json instead of being embedded in it
+MAX_SAMPLE_EVENTS = 1000
+MAX_METRIC_SAMPLES = 100
+AUDIT_EVENTS_FILE = 'growth_audit_events.jsonl'
+
+# The tag/cost Usage API query is split into date ranges of this many days,
+# queried in parallel. Rows are per day, so the ranges add up exactly.
+USAGE_SHARD_DAYS = 7
 
 
 class OCIGrowthCollector:
     """Collects tag-related data for growth analysis from OCI."""
     
-    def __init__(self, tenancy_ocid, home_region, output_dir='output', max_workers_tags=20, max_workers_compartments=30):
+    def __init__(self, tenancy_ocid, home_region, output_dir='output', max_workers_tags=20, max_workers_compartments=30,
+                 cache_ttl=DISCOVERY_CACHE_TTL):
         """
         Initialize Growth Collector.
         
@@ -23,14 +47,22 @@ class OCIGrowthCollector:
             tenancy_ocid: OCI Tenancy OCID
             home_region: Home region (e.g., us-ashburn-1)
             output_dir: Output directory for collected data
-            max_workers_tags: Max parallel workers for tag definitions (default: 10)
-            max_workers_compartments: Max parallel workers for compartment scanning (default: 20)
+            max_workers_tags: Max parallel workers for tag definitions and metric
+                queries (default: 20); smaller batches use fewer threads
+            max_workers_compartments: Max parallel workers for compartment scanning
+                (default: 30); smaller tenancies use fewer threads
+            cache_ttl: Seconds to reuse cached compartment/tag discovery results
+                (default: 24h, 0 disables the cache)
         """
         self.tenancy_ocid = tenancy_ocid
         self.home_region = home_region
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Discovery cache, one directory per tenancy
+        self.cache_ttl = cache_ttl
+        self.cache_dir = self.output_dir / '.cache' / tenancy_ocid
+        
         # Performance settings
         self.max_workers_tags = max_workers_tags
         self.max_workers_compartments = max_workers_compartments
@@ -40,37 +72,179 @@ class OCIGrowthCollector:
         self.tag_definitions = {}
         self.tag_defaults = []
         self.compartments = []
+        # Shared tag/cost Usage API results keyed by (from_date, to_date)
+        self._tags_and_costs = {}
+        # Worker pools reused by the compartment-scoped collections, keyed by
+        # pool size (see _executor)
+        self._shared_executors = {}
+        
+    def _cache_get(self, key, is_valid=None, max_age=None, announce=True):
+        """
+        Load a discovery result cached by a previous run if it is recent enough.
+        
+        Args:
+            key: Cache entry name (e.g. 'compartments')
+            is_valid: Optional predicate the cached data must satisfy to be used
+            max_age: Seconds the entry stays usable (default: cache_ttl)
+            announce: Print a message when the cached data is used
+        
+        Returns:
+            Cached data or None if disabled, missing, unreadable, stale or invalid
+        """
+        if not self.cache_ttl:
+            return None
+        
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            entry = json_loads(cache_file.read_bytes())
+            age = time.time() - entry['ts']
+            data = entry['data']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        if age > (self.cache_ttl if max_age is None else max_age) or (is_valid is not None and not is_valid(data)):
+            return None
+        
+        if announce:
+            print(f"♻️  Using cached {key.replace('_', ' ')} from {cache_file} ({int(age // 60)} min old)")
+        return data
+    
+    def _cache_put(self, key, data):
+        """Store a discovery result in the cache (no-op when the cache is disabled)."""
+        if not self.cache_ttl:
+            return
+        
+        # write_json goes through a temporary file and a rename, so a concurrent
+        # or interrupted run never sees a partially written entry
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_json({'ts': time.time(), 'data': data}, self.cache_dir / f"{key}.json", indent=False)
+        except OSError as e:
+            print(f"⚠️  Could not write {key} cache: {e}")
+    
+    def clear_cache(self):
+        """Delete the cached discovery results for this tenancy."""
+        if self.cache_dir.exists():
+            for cache_file in itertools.chain(self.cache_dir.glob('*.json'), self.cache_dir.glob('*.tmp')):
+                cache_file.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _pool_size(max_workers, task_count):
+        """
+        Size a worker pool for a batch of tasks.
+        
+        Args:
+            max_workers: Configured upper bound (max_workers_tags/max_workers_compartments)
+            task_count: Number of tasks to run
+            
+        Returns:
+            Number of workers: one per task, at least 2 and at most max_workers
+        """
+        return max(1, min(max_workers, max(2, task_count)))
+    
+    def _executor(self, workers):
+        """
+        Return a reusable worker pool of the given size.
+        
+        Tag definitions, tag defaults, Usage API date ranges, metric queries,
+        audit events and event rules run on pools kept per size, so each phase
+        is limited to the workers it reports while the threads are started once
+        and reused by later phases of the same size (the compartment-sized
+        phases usually share one). close() shuts all of them down.
+        
+        Args:
+            workers: Number of worker threads (see _pool_size)
+            
+        Returns:
+            ThreadPoolExecutor (created on first use)
+        """
+        executor = self._shared_executors.get(workers)
+        if executor is None:
+            executor = self._shared_executors[workers] = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix='oci-collect'
+            )
+        return executor
+    
+    def close(self):
+        """Shut down the shared worker pools; they are recreated if used again."""
+        for executor in self._shared_executors.values():
+            executor.shutdown(wait=True)
+        self._shared_executors.clear()
+    
+    def _identity_url(self, path):
+        """Build an Identity API URL in the home region."""
+        from .oci_client import service_endpoint
+        return f"{service_endpoint('identity', self.home_region)}/20160918/{path}"
+    
+    def _list_identity(self, rest_client, path, params=None, timeout=300):
+        """
+        List an Identity resource over REST, shaped like `oci iam ... list --all` data.
         
-    def _execute_oci_command(self, command, description):
+        Args:
+            rest_client: OCIRestClient to send the requests with
+            path: List path below the API version (e.g. 'tagDefaults')
+            params: Optional query parameters
+            timeout: Per-page request timeout in seconds
+            
+        Returns:
+            Tuple of (HTTP status code, list of items with CLI-style keys or error body)
+        """
+        from .oci_client import to_cli_keys
+        status, data = rest_client.list_all(self._identity_url(path), params=params, timeout=timeout)
+        return status, (to_cli_keys(data) if status == 200 else data)
+    
+    def _execute_oci_command(self, command, description, rest_request=None, request_body=None):
         """
         Execute an OCI CLI command with progress tracking.
         
         Args:
             command: List containing the OCI CLI command and arguments
-            description: Description for progress spinner
+            description: Description for progress spinner (None for no spinner)
+            rest_request: Optional callable taking an OCIRestClient and returning
+                (status, data); used instead of the CLI when the OCI SDK is available
+            request_body: Optional JSON body piped to the CLI on stdin (for
+                `--request-body file:///dev/stdin`)
             
         Returns:
             Parsed JSON response or None if failed
         """
-        spinner = ProgressSpinner(description)
-        spinner.start()
+        # The OCI SDK is slow to import, so it is only loaded once a call is made
+        from .oci_client import SDK_TIMEOUTS, get_rest_client
+        rest_client = get_rest_client() if rest_request is not None else None
+        
+        spinner = ProgressSpinner(description) if description else None
+        if spinner:
+            spinner.start()
         
         try:
+            if rest_client is not None:
+                status, data = rest_request(rest_client)
+                if spinner:
+                    spinner.stop()
+                
+                if status != 200:
+                    message = data.get('message', data) if isinstance(data, dict) else data
+                    print(f"❌ Request failed (HTTP {status}): {str(message)[:200]}")
+                    return None
+                
+                return data
+            
             result = subprocess.run(
                 command,
+                input=json_dumps(request_body, indent=False) if request_body is not None else None,
                 capture_output=True,
-                text=True,
                 timeout=300
             )
             
-            spinner.stop()
+            if spinner:
+                spinner.stop()
             
             if result.returncode != 0:
-                print(f"❌ Command failed: {result.stderr[:200]}")
+                print(f"❌ Command failed: {result.stderr.decode('utf-8', errors='replace')[:200]}")
                 return None
             
             # Parse JSON response
-            response = json.loads(result.stdout)
+            response = json_loads(result.stdout)
             
             # Check for data field (standard OCI CLI response format)
             if 'data' in response:
@@ -78,23 +252,193 @@ class OCIGrowthCollector:
             
             return response
             
-        except subprocess.TimeoutExpired:
-            spinner.stop()
+        except (subprocess.TimeoutExpired,) + SDK_TIMEOUTS:
+            if spinner:
+                spinner.stop()
             print(f"⏱️  Command timed out")
             return None
         except json.JSONDecodeError as e:
-            spinner.stop()
+            if spinner:
+                spinner.stop()
             print(f"❌ Failed to parse JSON response: {e}")
             return None
         except Exception as e:
-            spinner.stop()
+            if spinner:
+                spinner.stop()
+            print(f"❌ Unexpected error: {e}")
+            return None
+    
+    def _fetch_usage_items(self, command, description, api_endpoint, request_body):
+        """
+        Run a Usage API query and iterate over the returned items.
+        
+        With ijson installed, items are parsed one at a time as the response
+        arrives (from the REST session, or from the OCI CLI's stdout when the
+        CLI is used), so the full item list is never held in memory. Otherwise
+        the response is parsed in one piece.
+        
+        Args:
+            command: OCI CLI raw-request command (fallback transport)
+            description: Description for progress spinner (None for no spinner)
+            api_endpoint: Usage API URL
+            request_body: Usage API request body
+            
+        Returns:
+            Iterator over usage items, or None if the request failed
+        """
+        from .oci_client import SDK_ERRORS, SDK_TIMEOUTS, get_rest_client
+        from .serialization import ijson
+        
+        if ijson is None:
+            data = self._execute_oci_command(
+                command,
+                description,
+                rest_request=lambda client: client.request('POST', api_endpoint, body=request_body),
+                request_body=request_body
+            )
+            return iter(data['items']) if data and 'items' in data else None
+        
+        rest_client = get_rest_client()
+        if rest_client is None:
+            # raw-request prints the response body under 'data'
+            return self._stream_cli_items(command, description, request_body, 'data.items.item')
+        
+        spinner = ProgressSpinner(description) if description else None
+        if spinner:
+            spinner.start()
+        try:
+            status, items = rest_client.stream_items('POST', api_endpoint, 'items.item', body=request_body)
+        except SDK_TIMEOUTS:
+            print(f"⏱️  Command timed out")
+            return None
+        except SDK_ERRORS as e:
+            print(f"❌ Unexpected error: {e}")
+            return None
+        finally:
+            if spinner:
+                spinner.stop()
+        
+        if status != 200:
+            message = items.get('message', items) if isinstance(items, dict) else items
+            print(f"❌ Request failed (HTTP {status}): {str(message)[:200]}")
+            return None
+        
+        return items
+    
+    def _stream_cli_items(self, command, description, request_body, prefix, timeout=300):
+        """
+        Run an OCI CLI command and iterate over a JSON array in its output as it
+        is printed.
+        
+        The CLI's stdout is read through a pipe instead of being captured whole,
+        and stderr is drained by a thread so the CLI never blocks on a full pipe.
+        The first item is read before returning, so failures are reported here
+        the same way _execute_oci_command reports them. Requires ijson.
+        
+        Args:
+            command: OCI CLI command reading its request body from stdin
+            description: Description for progress spinner (None for no spinner)
+            request_body: JSON body piped to the CLI on stdin
+            prefix: ijson path of the array elements (e.g. 'data.items.item')
+            timeout: Seconds before the CLI is killed
+            
+        Returns:
+            Iterator over the elements, or None if the command failed
+        """
+        from .serialization import iter_json_items
+        
+        spinner = ProgressSpinner(description) if description else None
+        if spinner:
+            spinner.start()
+        
+        try:
+            proc = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=1024 * 1024
+            )
+        except OSError as e:
+            if spinner:
+                spinner.stop()
             print(f"❌ Unexpected error: {e}")
             return None
+        
+        stderr = []
+        stderr_reader = threading.Thread(target=lambda: stderr.append(proc.stderr.read()), daemon=True)
+        stderr_reader.start()
+        
+        timed_out = threading.Event()
+        
+        def kill():
+            timed_out.set()
+            proc.kill()
+        
+        watchdog = threading.Timer(timeout, kill)
+        watchdog.start()
+        
+        def finish():
+            # Reap the CLI and return its exit status and stderr text
+            proc.stdout.close()
+            returncode = proc.wait()
+            watchdog.cancel()
+            stderr_reader.join()
+            return returncode, b''.join(stderr).decode('utf-8', errors='replace')
+        
+        try:
+            proc.stdin.write(json_dumps(request_body, indent=False))
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass  # the CLI exited early; its exit status is reported below
+        
+        items = iter_json_items(proc.stdout, prefix)
+        try:
+            first = [next(items)]
+        except StopIteration:
+            first = []
+        except Exception as e:
+            returncode, error = finish()
+            if spinner:
+                spinner.stop()
+            if timed_out.is_set():
+                print(f"⏱️  Command timed out")
+            elif returncode != 0:
+                print(f"❌ Command failed: {error[:200]}")
+            else:
+                print(f"❌ Failed to parse JSON response: {e}")
+            return None
+        
+        if not first:
+            returncode, error = finish()
+            if spinner:
+                spinner.stop()
+            if returncode != 0:
+                print("⏱️  Command timed out" if timed_out.is_set() else f"❌ Command failed: {error[:200]}")
+                return None
+            return iter(())
+        
+        if spinner:
+            spinner.stop()
+        
+        def iter_items():
+            try:
+                yield from first
+                yield from items
+            finally:
+                returncode, error = finish()
+                if returncode != 0:
+                    print(f"⚠️  OCI CLI exited with status {returncode}: {error[:200]}")
+        
+        return iter_items()
     
-    def _get_all_compartments(self):
+    def _get_all_compartments(self, force_refresh=False):
         """
         Fetch all compartments in the tenancy recursively.
         
+        Args:
+            force_refresh: Query OCI even if a cached compartment list is fresh
+        
         Returns:
             List of compartment OCIDs
         """
@@ -102,6 +446,12 @@ class OCIGrowthCollector:
         print("📦 Discovering Compartments")
         print(f"{'='*70}")
         
+        cached = None if force_refresh else self._cache_get('compartments')
+        if cached is not None:
+            self.compartments = cached
+            print(f"✅ Found {len(self.compartments)} compartments (including root)")
+            return self.compartments
+        
         command = [
             'oci', 'iam', 'compartment', 'list',
             '--compartment-id', self.tenancy_ocid,
@@ -112,13 +462,18 @@ class OCIGrowthCollector:
         
         data = self._execute_oci_command(
             command,
-            "🔍 Fetching compartments..."
+            "🔍 Fetching compartments...",
+            rest_request=lambda client: self._list_identity(
+                client, 'compartments',
+                {'compartmentId': self.tenancy_ocid, 'compartmentIdInSubtree': 'true'}
+            )
         )
         
         if data:
             # Include root tenancy as a compartment
             self.compartments = [self.tenancy_ocid]
             self.compartments.extend([comp['id'] for comp in data if comp.get('lifecycle-state') == 'ACTIVE'])
+            self._cache_put('compartments', self.compartments)
             print(f"✅ Found {len(self.compartments)} compartments (including root)")
         else:
             print("⚠️  Using root tenancy only")
@@ -126,13 +481,16 @@ class OCIGrowthCollector:
         
         return self.compartments
     
-    def collect_tag_namespaces(self):
+    def collect_tag_namespaces(self, force_refresh=False):
         """
         Collect all tag namespaces from the tenancy.
         Data Point: Tag Namespaces
         API: oci.identity.IdentityClient.list_tag_namespaces(compartment_id)
         Purpose: Understand tagging structure
         
+        Args:
+            force_refresh: Query OCI even if cached tag namespaces are fresh
+        
         Returns:
             List of tag namespace data
         """
@@ -140,17 +498,24 @@ class OCIGrowthCollector:
         print("🏷️  Collecting Tag Namespaces")
         print(f"{'='*70}")
         
-        command = [
-            'oci', 'iam', 'tag-namespace', 'list',
-            '--compartment-id', self.tenancy_ocid,
-            '--all',
-            '--output', 'json'
-        ]
-        
-        data = self._execute_oci_command(
-            command,
-            "🔍 Fetching tag namespaces..."
-        )
+        data = None if force_refresh else self._cache_get('tag_namespaces')
+        if data is None:
+            command = [
+                'oci', 'iam', 'tag-namespace', 'list',
+                '--compartment-id', self.tenancy_ocid,
+                '--all',
+                '--output', 'json'
+            ]
+            
+            data = self._execute_oci_command(
+                command,
+                "🔍 Fetching tag namespaces...",
+                rest_request=lambda client: self._list_identity(
+                    client, 'tagNamespaces', {'compartmentId': self.tenancy_ocid}
+                )
+            )
+            if data:
+                self._cache_put('tag_namespaces', data)
         
         if data:
             self.tag_namespaces = data
@@ -167,16 +532,19 @@ class OCIGrowthCollector:
         
         return self.tag_namespaces
     
-    def _fetch_tags_for_namespace(self, ns_id, ns_name):
+    def _fetch_tags_for_namespace(self, ns_id, ns_name, cached=None):
         """
         Fetch tags for a single namespace (helper for parallel processing).
         
         Args:
             ns_id: Tag namespace OCID
             ns_name: Tag namespace name
+            cached: Optional {'etag', 'data'} from a previous run; with the SDK
+                transport the listing is revalidated and reused if unchanged
             
         Returns:
-            Tuple of (ns_id, dict with namespace_name and tags)
+            Tuple of (ns_id, dict with namespace_name and tags, ETag of the
+            listing or None, True if the cached data was reused)
         """
         command = [
             'oci', 'iam', 'tag', 'list',
@@ -186,40 +554,64 @@ class OCIGrowthCollector:
         ]
         
         try:
+            from .oci_client import get_rest_client, to_cli_keys
+            rest_client = get_rest_client()
+            if rest_client is not None:
+                status, data, etag = rest_client.list_all_conditional(
+                    self._identity_url(f"tagNamespaces/{ns_id}/tags"),
+                    etag=cached['etag'] if cached else None,
+                    timeout=30
+                )
+                if status == 304:
+                    return ns_id, cached['data'], etag, True
+                if status == 200:
+                    return ns_id, {
+                        'namespace_name': ns_name,
+                        'tags': to_cli_keys(data)
+                    }, etag, False
+                message = data.get('message', data) if isinstance(data, dict) else data
+                return ns_id, {
+                    'namespace_name': ns_name,
+                    'tags': [],
+                    'error': f"HTTP {status}: {message}"[:100]
+                }, None, False
+            
             result = subprocess.run(
                 command,
                 capture_output=True,
-                text=True,
                 timeout=30  # Reduced from 60s
             )
             
             if result.returncode == 0:
-                response = json.loads(result.stdout)
+                response = json_loads(result.stdout)
                 data = response.get('data', [])
                 return ns_id, {
                     'namespace_name': ns_name,
                     'tags': data
-                }
+                }, None, False
             else:
                 return ns_id, {
                     'namespace_name': ns_name,
                     'tags': [],
-                    'error': result.stderr[:100]
-                }
+                    'error': result.stderr.decode('utf-8', errors='replace')[:100]
+                }, None, False
         except Exception as e:
             return ns_id, {
                 'namespace_name': ns_name,
                 'tags': [],
                 'error': str(e)
-            }
+            }, None, False
     
-    def collect_tag_definitions(self):
+    def collect_tag_definitions(self, force_refresh=False):
         """
         Collect all tag definitions (tags) for each namespace in parallel.
         Data Point: Tag Definitions
         API: oci.identity.IdentityClient.list_tags(tag_namespace_id)
         Purpose: Available tags per namespace
         
+        Args:
+            force_refresh: Query OCI even if cached tag definitions are fresh
+        
         Returns:
             Dictionary mapping namespace_id to list of tag definitions
         """
@@ -231,30 +623,61 @@ class OCIGrowthCollector:
             print("⚠️  No tag namespaces available. Run collect_tag_namespaces() first.")
             return {}
         
-        print(f"Using {self.max_workers_tags} parallel workers for faster collection...")
-        
-        tracker = ProgressTracker(len(self.tag_namespaces))
-        completed = 0
+        # Cached definitions are only reused if they cover exactly the current namespaces
+        namespace_ids = {ns.get('id') for ns in self.tag_namespaces}
+        cached = None if force_refresh else self._cache_get(
+            'tag_definitions', is_valid=lambda data: set(data) == namespace_ids
+        )
         
-        # Use ThreadPoolExecutor for parallel processing
-        with ThreadPoolExecutor(max_workers=self.max_workers_tags) as executor:
+        if cached is not None:
+            self.tag_definitions = cached
+        else:
+            workers = self._pool_size(self.max_workers_tags, len(self.tag_namespaces))
+            print(f"Using {workers} parallel workers for faster collection...")
+            
+            # ETags of earlier listings stay useful after the cache expires:
+            # unchanged namespaces then answer 304 Not Modified with no body
+            etag_cache = self._cache_get('tag_definition_etags', max_age=float('inf'), announce=False) or {}
+            etags = {}
+            unchanged = 0
+            
+            tracker = ProgressTracker(len(self.tag_namespaces))
+            completed = 0
+            
+            # Use ThreadPoolExecutor for parallel processing
+            executor = self._executor(workers)
             # Submit all tasks
             future_to_namespace = {
-                executor.submit(self._fetch_tags_for_namespace, ns.get('id'), ns.get('name', 'Unknown')): ns
+                executor.submit(
+                    self._fetch_tags_for_namespace, ns.get('id'), ns.get('name', 'Unknown'),
+                    etag_cache.get(ns.get('id'))
+                ): ns
                 for ns in self.tag_namespaces
             }
             
             # Process completed tasks as they finish
             for future in as_completed(future_to_namespace):
-                ns_id, ns_data = future.result()
+                ns_id, ns_data, etag, reused = future.result()
                 completed += 1
                 
                 self.tag_definitions[ns_id] = ns_data
+                if etag:
+                    etags[ns_id] = {'etag': etag, 'data': ns_data}
+                unchanged += reused
                 
                 # Update progress display
                 tracker.update(completed)
-        
-        tracker.finish()
+            
+            tracker.finish()
+            
+            if unchanged:
+                print(f"♻️  {unchanged} namespaces unchanged since the last run (HTTP 304)")
+            
+            # Namespaces that failed are retried on the next run
+            if not any('error' in ns_data for ns_data in self.tag_definitions.values()):
+                self._cache_put('tag_definitions', self.tag_definitions)
+            if etags:
+                self._cache_put('tag_definition_etags', etags)
         
         # Calculate total tags
         total_tags = sum(len(ns_data.get('tags', [])) for ns_data in self.tag_definitions.values())
@@ -280,24 +703,29 @@ class OCIGrowthCollector:
         ]
         
         try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=30  # Reduced from 60s for faster failure
-            )
-            
-            if result.returncode == 0:
-                response = json.loads(result.stdout)
-                data = response.get('data', [])
-                
-                # Add compartment context to each tag default
-                for td in data:
-                    td['source_compartment_id'] = comp_id
-                
-                return comp_id, data
+            from .oci_client import get_rest_client
+            rest_client = get_rest_client()
+            if rest_client is not None:
+                status, data = self._list_identity(
+                    rest_client, 'tagDefaults', {'compartmentId': comp_id}, timeout=30
+                )
+                if status != 200:
+                    return comp_id, None
             else:
-                return comp_id, None
+                result = subprocess.run(
+                    command,
+                    capture_output=True,
+                    timeout=30  # Reduced from 60s for faster failure
+                )
+                if result.returncode != 0:
+                    return comp_id, None
+                data = json_loads(result.stdout).get('data', [])
+            
+            # Add compartment context to each tag default
+            for td in data:
+                td['source_compartment_id'] = comp_id
+            
+            return comp_id, data
                 
         except Exception:
             return comp_id, None
@@ -315,35 +743,73 @@ class OCIGrowthCollector:
         print(f"\n{'='*70}")
         print("⚙️  Collecting Tag Defaults (Auto-tagging Rules)")
         print(f"{'='*70}")
-        print(f"Using {self.max_workers_compartments} parallel workers for faster collection...")
-        
         if not self.compartments:
             self._get_all_compartments()
         
-        all_tag_defaults = []
-        tracker = ProgressTracker(len(self.compartments))
-        completed = 0
+        # Probe the root compartment first. If its listing already reports tag
+        # defaults that live in other compartments, it covers the whole tree
+        # and the per-compartment scan can be skipped.
+        _, root_defaults = self._fetch_tag_defaults_for_compartment(self.tenancy_ocid)
         
-        # Use ThreadPoolExecutor for parallel processing
-        with ThreadPoolExecutor(max_workers=self.max_workers_compartments) as executor:
+        # A tag default can be reported by more than one listing; keep one
+        # entry per (tag definition, compartment)
+        all_tag_defaults = []
+        seen_defaults = set()
+        
+        def add_tag_defaults(tag_defaults):
+            for td in tag_defaults:
+                key = (td.get('tag-definition-id'), td.get('compartment-id'))
+                if key[0] is not None:
+                    if key in seen_defaults:
+                        continue
+                    seen_defaults.add(key)
+                all_tag_defaults.append(td)
+        
+        if root_defaults and any(
+            td.get('compartment-id') not in (None, self.tenancy_ocid) for td in root_defaults
+        ):
+            known_compartments = set(self.compartments)
+            for td in root_defaults:
+                td['source_compartment_id'] = td.get('compartment-id') or self.tenancy_ocid
+            add_tag_defaults(
+                td for td in root_defaults if td['source_compartment_id'] in known_compartments
+            )
+            print("Tag defaults for all compartments were returned by the root compartment, skipping the compartment scan")
+        else:
+            # The root listing only covers the root itself (or failed, in which
+            # case the root is scanned again with the others)
+            add_tag_defaults(root_defaults or [])
+            scan_ids = [
+                comp_id for comp_id in self.compartments
+                if root_defaults is None or comp_id != self.tenancy_ocid
+            ]
+            
+            workers = self._pool_size(self.max_workers_compartments, len(scan_ids))
+            print(f"Using {workers} parallel workers for faster collection...")
+            
+            tracker = ProgressTracker(len(scan_ids))
+            completed = 0
+            
+            # Use ThreadPoolExecutor for parallel processing
+            executor = self._executor(workers)
             # Submit all tasks
             future_to_compartment = {
                 executor.submit(self._fetch_tag_defaults_for_compartment, comp_id): comp_id
-                for comp_id in self.compartments
+                for comp_id in scan_ids
             }
-            
+                
             # Process completed tasks as they finish
             for future in as_completed(future_to_compartment):
                 _, tag_defaults = future.result()
                 completed += 1
-                
+                    
                 if tag_defaults is not None and len(tag_defaults) > 0:
-                    all_tag_defaults.extend(tag_defaults)
-                
+                    add_tag_defaults(tag_defaults)
+                    
                 # Update progress display
                 tracker.update(completed)
-        
-        tracker.finish()
+            
+            tracker.finish()
         
         self.tag_defaults = all_tag_defaults
         print(f"✅ Collected {len(self.tag_defaults)} tag defaults")
@@ -357,136 +823,404 @@ class OCIGrowthCollector:
         
         return self.tag_defaults
     
-    def collect_resource_tags(self, from_date, to_date):
+    @staticmethod
+    def _usage_date_shards(from_date, to_date, days=USAGE_SHARD_DAYS):
         """
-        Collect defined tags and freeform tags from resources via Usage API.
-        Data Points: Defined Tags on Resources, Freeform Tags on Resources
-        API: Each resource API returns defined_tags and freeform_tags
-        Purpose: Cost allocation & chargeback, Custom metadata tracking
-        
-        Note: This collects tags from the Usage API which already includes
-        tag information for resources. We'll aggregate unique tag keys used.
+        Split a date range into consecutive ranges of at most `days` days.
         
         Args:
             from_date: Start date (YYYY-MM-DD)
-            to_date: End date (YYYY-MM-DD)
+            to_date: End date (YYYY-MM-DD, exclusive like timeUsageEnded)
+            days: Maximum length of each range
             
         Returns:
-            Dictionary with defined_tags and freeform_tags statistics
+            List of (start, end) date strings covering the range without overlap
         """
-        print(f"\n{'='*70}")
-        print("🔍 Collecting Resource Tags from Usage Data")
-        print(f"{'='*70}")
-        
-        # Build request to get usage data with tags
-        request_body = {
-            "tenantId": self.tenancy_ocid,
-            "timeUsageStarted": f"{from_date}T00:00:00Z",
-            "timeUsageEnded": f"{to_date}T00:00:00Z",
-            "granularity": "DAILY",
-            "queryType": "USAGE",
-            "groupBy": ["resourceId", "tagNamespace", "tagKey", "tagValue"],
-            "compartmentDepth": 4
-        }
-        
-        # Save request body
-        request_file = self.output_dir / "request_resource_tags.json"
-        with open(request_file, 'w') as f:
-            json.dump(request_body, f, indent=2)
+        start = datetime.strptime(from_date, '%Y-%m-%d')
+        end = datetime.strptime(to_date, '%Y-%m-%d')
+        
+        shards = []
+        while start + timedelta(days=days) < end:
+            shards.append((start.strftime('%Y-%m-%d'), (start + timedelta(days=days)).strftime('%Y-%m-%d')))
+            start += timedelta(days=days)
+        shards.append((start.strftime('%Y-%m-%d'), to_date))
+        return shards
+    
+    def _fetch_tags_and_costs_items(self, request_body, description):
+        """
+        Run one tag/cost Usage API query.
         
+        Args:
+            request_body: Usage API request body
+            description: Description for progress spinner (None for no spinner)
+            
+        Returns:
+            Iterator over usage items, or None if the request failed
+        """
         api_endpoint = f"https://usageapi.{self.home_region}.oci.oraclecloud.com/20200107/usage"
         
         command = [
             'oci', 'raw-request',
             '--http-method', 'POST',
             '--target-uri', api_endpoint,
-            '--request-body', f'file://{request_file}',
+            '--request-body', 'file:///dev/stdin',
             '--output', 'json'
         ]
         
-        data = self._execute_oci_command(
-            command,
-            "🌐 Fetching resource tags from Usage API..."
-        )
+        return self._fetch_usage_items(command, description, api_endpoint, request_body)
+    
+    @staticmethod
+    def _reduce_tag_items(items):
+        """
+        Reduce tag/cost usage items to the partial results collect_tags_and_costs merges.
         
-        # Clean up request file
-        if request_file.exists():
-            request_file.unlink()
+        Items are consumed one at a time, so a streamed response is never
+        held in memory as a whole.
         
-        if data and 'items' in data:
-            items = data['items']
+        Args:
+            items: Iterable of Usage API items (COST query grouped by
+                resource, tag and service)
             
-            # Aggregate unique tag namespaces, keys, and values
-            tag_stats = {
-                'total_records': len(items),
-                'unique_tag_namespaces': set(),
-                'unique_tag_keys': set(),
-                'tag_namespace_key_pairs': set(),
-                'resources_with_tags': set()
-            }
+        Returns:
+            Dictionary with total_records, raw_sample (first 1000 items),
+            resource_tags (resource id -> distinct (namespace, key, value)
+            tuples in first-seen order) and costs ((namespace, key, value,
+            service) -> summed computedAmount in first-seen order)
+        """
+        total_records = 0
+        raw_sample = []
+        resource_tags = {}
+        costs = {}
+        
+        for item in items:
+            total_records += 1
+            if len(raw_sample) < 1000:
+                raw_sample.append(item)
             
-            # Build resource-to-tags mapping for enrichment
-            self._resource_tag_map = {}
+            # Cost by tag and service; unparseable amounts count as 0, as
+            # pd.to_numeric(errors='coerce') did for the row-level columns
+            cost_key = (
+                item.get('tagNamespace', 'untagged'),
+                item.get('tagKey', 'untagged'),
+                item.get('tagValue', 'untagged'),
+                item.get('service', 'Unknown')
+            )
+            try:
+                cost = float(item.get('computedAmount', 0))
+            except (TypeError, ValueError):
+                cost = 0.0
+            if cost != cost:
+                cost = 0.0
+            costs[cost_key] = costs.get(cost_key, 0.0) + cost
             
-            for item in items:
-                resource_id = item.get('resourceId', '')
+            # Resource tags
+            resource_id = item.get('resourceId', '')
+            
+            # Tags come in a nested 'tags' array from the Usage API
+            tags_array = item.get('tags', [])
+            
+            if resource_id and tags_array:
+                # Keys of a dict keep the resource's distinct tags in order
+                resource_seen = resource_tags.setdefault(resource_id, {})
                 
-                # Tags come in a nested 'tags' array from the Usage API
-                tags_array = item.get('tags', [])
+                for tag_dict in tags_array:
+                    if not isinstance(tag_dict, dict):
+                        continue
+                        
+                    tag_namespace = tag_dict.get('namespace', '')
+                    tag_key = tag_dict.get('key', '')
+                    tag_value = tag_dict.get('value', '')
+                    
+                    # Skip tags with None/empty values
+                    if not tag_namespace or not tag_key:
+                        continue
+                    
+                    # Every row repeats the same few namespace/key strings;
+                    # interning keeps one copy of each in the sets and tag map
+                    resource_seen[(sys.intern(tag_namespace), sys.intern(tag_key), tag_value)] = None
+        
+        return {
+            'total_records': total_records,
+            'raw_sample': raw_sample,
+            'resource_tags': resource_tags,
+            'costs': costs
+        }
+    
+    def _fetch_tags_and_costs_shards(self, request_bodies, description):
+        """
+        Run tag/cost Usage API queries for several date ranges in parallel.
+        
+        Each worker reduces its range's items with _reduce_tag_items as they
+        stream in, so only the per-range partial results are kept.
+        
+        Args:
+            request_bodies: Usage API request bodies, in date order
+            description: Heading printed before the queries start
+            
+        Returns:
+            List of partial results (see _reduce_tag_items) in date order, or
+            None if any query failed (partial cost data would under-report)
+        """
+        def fetch(request_body):
+            items = self._fetch_tags_and_costs_items(request_body, None)
+            return None if items is None else self._reduce_tag_items(items)
+        
+        workers = self._pool_size(self.max_workers_compartments, len(request_bodies))
+        print(description)
+        print(f"Using {workers} parallel workers for {len(request_bodies)} date ranges...")
+        
+        tracker = ProgressTracker(len(request_bodies))
+        completed = 0
+        shard_results = [None] * len(request_bodies)
+        
+        executor = self._executor(workers)
+        future_to_shard = {
+            executor.submit(fetch, request_body): index
+            for index, request_body in enumerate(request_bodies)
+        }
+            
+        for future in as_completed(future_to_shard):
+            shard_results[future_to_shard[future]] = future.result()
+            completed += 1
+            tracker.update(completed)
+        
+        tracker.finish()
+        
+        failed = sum(result is None for result in shard_results)
+        if failed:
+            print(f"❌ {failed} of {len(request_bodies)} Usage API queries failed")
+            return None
+        
+        return shard_results
+    
+    def collect_tags_and_costs(self, from_date, to_date):
+        """
+        Collect resource tags and cost-tracking tags from one Usage API query.
+        
+        A COST query grouped by resource, tag and service carries everything
+        both collections need, so it is fetched once and both aggregations are
+        built from the same items. Results are kept per date range, so
+        collect_resource_tags and collect_cost_tracking_tags share the request.
+        
+        Args:
+            from_date: Start date (YYYY-MM-DD)
+            to_date: End date (YYYY-MM-DD)
+            
+        Returns:
+            Tuple of (resource tag statistics, cost data grouped by tags); both
+            are None if no data was returned
+        """
+        if (from_date, to_date) in self._tags_and_costs:
+            return self._tags_and_costs[(from_date, to_date)]
+        
+        # Build requests to get cost data with resource tags, one per date range
+        request_bodies = [
+            {
+                "tenantId": self.tenancy_ocid,
+                "timeUsageStarted": f"{shard_start}T00:00:00Z",
+                "timeUsageEnded": f"{shard_end}T00:00:00Z",
+                "granularity": "DAILY",
+                "queryType": "COST",
+                "groupBy": ["resourceId", "tagNamespace", "tagKey", "tagValue", "service"],
+                "compartmentDepth": 4
+            }
+            for shard_start, shard_end in self._usage_date_shards(from_date, to_date)
+        ]
+        
+        description = "🌐 Fetching resource tags and costs from Usage API..."
+        if len(request_bodies) == 1:
+            items = self._fetch_tags_and_costs_items(request_bodies[0], description)
+            shard_results = None if items is None else [self._reduce_tag_items(items)]
+        else:
+            shard_results = self._fetch_tags_and_costs_shards(request_bodies, description)
+        
+        if shard_results is None:
+            self._tags_and_costs[(from_date, to_date)] = (None, None)
+            return None, None
+        
+        raw_sample = []
+        
+        # Aggregate unique tag namespaces, keys, and values
+        tag_stats = {
+            'total_records': 0,
+            'unique_tag_namespaces': set(),
+            'unique_tag_keys': set(),
+            'tag_namespace_key_pairs': set(),
+            'resources_with_tags': set()
+        }
+        
+        # Build resource-to-tags mapping for enrichment
+        self._resource_tag_map = {}
+        # Rows are split by tag and service, so the same tag is reported for a
+        # resource once per row (and once per date range); track what each
+        # resource already has
+        seen_tags = {}
+        
+        costs = {}
+        
+        # Merge the partial results in date order, so first-seen ordering and
+        # the last-wins cost center / environment match a single pass
+        for shard in shard_results:
+            tag_stats['total_records'] += shard['total_records']
+            raw_sample.extend(shard['raw_sample'][:1000 - len(raw_sample)])
+            
+            for cost_key, cost in shard['costs'].items():
+                costs[cost_key] = costs.get(cost_key, 0.0) + cost
+            
+            for resource_id, resource_tags in shard['resource_tags'].items():
+                # Initialize resource entry if not exists
+                if resource_id not in self._resource_tag_map:
+                    self._resource_tag_map[resource_id] = {
+                        'tags': [],
+                        'namespaces': set(),
+                        'primary_cost_center': '',
+                        'primary_environment': ''
+                    }
+                resource_entry = self._resource_tag_map[resource_id]
+                resource_seen = seen_tags.setdefault(resource_id, set())
                 
-                if resource_id and tags_array:
-                    # Initialize resource entry if not exists
-                    if resource_id not in self._resource_tag_map:
-                        self._resource_tag_map[resource_id] = {
-                            'tags': [],
-                            'namespaces': set()
-                        }
+                for tag in resource_tags:
+                    if tag in resource_seen:
+                        continue
+                    resource_seen.add(tag)
+                    tag_namespace, tag_key, tag_value = tag
                     
-                    # Process each tag in the array
-                    for tag_dict in tags_array:
-                        if not isinstance(tag_dict, dict):
-                            continue
-                            
-                        tag_namespace = tag_dict.get('namespace', '')
-                        tag_key = tag_dict.get('key', '')
-                        tag_value = tag_dict.get('value', '')
-                        
-                        # Skip tags with None/empty values
-                        if not tag_namespace or not tag_key:
-                            continue
-                        
-                        # Update statistics
-                        tag_stats['unique_tag_namespaces'].add(tag_namespace)
-                        tag_stats['unique_tag_keys'].add(tag_key)
-                        tag_stats['tag_namespace_key_pairs'].add(
-                            f"{tag_namespace}.{tag_key}"
-                        )
-                        tag_stats['resources_with_tags'].add(resource_id)
-                        
-                        # Add to resource tag map
-                        self._resource_tag_map[resource_id]['tags'].append({
-                            'namespace': tag_namespace,
-                            'key': tag_key,
-                            'value': tag_value
-                        })
-                        self._resource_tag_map[resource_id]['namespaces'].add(tag_namespace)
-            
-            # Convert sets to lists for JSON serialization
-            for resource_id in self._resource_tag_map:
-                self._resource_tag_map[resource_id]['namespaces'] = list(
-                    self._resource_tag_map[resource_id]['namespaces']
-                )
+                    # Update statistics
+                    tag_stats['unique_tag_namespaces'].add(tag_namespace)
+                    tag_stats['unique_tag_keys'].add(tag_key)
+                    tag_stats['tag_namespace_key_pairs'].add((tag_namespace, tag_key))
+                    tag_stats['resources_with_tags'].add(resource_id)
+                    
+                    # Add to resource tag map
+                    resource_entry['tags'].append({
+                        'namespace': tag_namespace,
+                        'key': tag_key,
+                        'value': tag_value
+                    })
+                    resource_entry['namespaces'].add(tag_namespace)
+                    
+                    # Resolve the common cost center / environment tags once
+                    # here so enrichment does not rescan every tag (last one wins)
+                    key_lower = tag_key.lower()
+                    if key_lower in COST_CENTER_KEYS:
+                        resource_entry['primary_cost_center'] = tag_value
+                    if key_lower in ENV_KEYS:
+                        resource_entry['primary_environment'] = tag_value
+        
+        # Convert sets to lists for JSON serialization
+        for resource_id in self._resource_tag_map:
+            self._resource_tag_map[resource_id]['namespaces'] = list(
+                self._resource_tag_map[resource_id]['namespaces']
+            )
+        
+        # Convert sets to lists for JSON serialization
+        resource_tags = {
+            'total_records': tag_stats['total_records'],
+            'unique_tag_namespaces': sorted(list(tag_stats['unique_tag_namespaces'])),
+            'unique_tag_keys': sorted(list(tag_stats['unique_tag_keys'])),
+            'tag_namespace_key_pairs': sorted(
+                f"{tag_namespace}.{tag_key}" for tag_namespace, tag_key in tag_stats['tag_namespace_key_pairs']
+            ),
+            'resources_with_tags_count': len(tag_stats['resources_with_tags']),
+            'raw_data': raw_sample  # Store first 1000 records
+        }
+        
+        # Per-tag-and-service sums are aggregated per tag by pandas below
+        cost_columns = {'namespace': [], 'key': [], 'value': [], 'service': [], 'cost': []}
+        for (tag_namespace, tag_key, tag_value, service), cost in costs.items():
+            cost_columns['namespace'].append(tag_namespace)
+            cost_columns['key'].append(tag_key)
+            cost_columns['value'].append(tag_value)
+            cost_columns['service'].append(service)
+            cost_columns['cost'].append(cost)
+        
+        cost_by_tag, total_cost = self._aggregate_cost_by_tag(cost_columns)
+        
+        cost_tracking_tags = {
+            'total_cost': total_cost,
+            'unique_tag_combinations': len(cost_by_tag),
+            'cost_by_tag': cost_by_tag,
+            'raw_data': raw_sample  # Store first 1000 records
+        }
+        
+        self._tags_and_costs[(from_date, to_date)] = (resource_tags, cost_tracking_tags)
+        return resource_tags, cost_tracking_tags
+    
+    @staticmethod
+    def _aggregate_cost_by_tag(cost_columns):
+        """
+        Total usage cost per tag and per tag and service.
+        
+        Args:
+            cost_columns: Dict of equal-length lists: namespace, key, value,
+                service and cost (computedAmount) for each usage row
             
-            # Convert sets to lists for JSON serialization
-            result = {
-                'total_records': tag_stats['total_records'],
-                'unique_tag_namespaces': sorted(list(tag_stats['unique_tag_namespaces'])),
-                'unique_tag_keys': sorted(list(tag_stats['unique_tag_keys'])),
-                'tag_namespace_key_pairs': sorted(list(tag_stats['tag_namespace_key_pairs'])),
-                'resources_with_tags_count': len(tag_stats['resources_with_tags']),
-                'raw_data': items[:1000]  # Store first 1000 records
+        Returns:
+            Tuple of (dict mapping "namespace.key=value" to its namespace, key,
+            value, total_cost and per-service costs, sorted by total_cost
+            descending; total cost of all rows)
+        """
+        import pandas as pd
+        
+        costs = pd.DataFrame(cost_columns)
+        costs['cost'] = pd.to_numeric(costs['cost'], errors='coerce').fillna(0.0)
+        
+        # sort=False keeps groups in first-seen order, so the stable sort below
+        # orders tags with equal cost by first appearance
+        by_service = costs.groupby(
+            ['namespace', 'key', 'value', 'service'], sort=False, dropna=False
+        )['cost'].sum()
+        by_tag = by_service.groupby(level=[0, 1, 2], sort=False, dropna=False).sum()
+        by_tag = by_tag.sort_values(ascending=False, kind='stable')
+        
+        def restore_null(field):
+            # groupby reports null tag fields as NaN; keep them as None
+            return None if pd.isna(field) else field
+        
+        services = {}
+        for (tag_ns, tag_key, tag_value, service), cost in by_service.items():
+            tag = (restore_null(tag_ns), restore_null(tag_key), restore_null(tag_value))
+            services.setdefault(tag, {})[restore_null(service)] = float(cost)
+        
+        cost_by_tag = {}
+        for (tag_ns, tag_key, tag_value), total in by_tag.items():
+            tag = (restore_null(tag_ns), restore_null(tag_key), restore_null(tag_value))
+            cost_by_tag[f"{tag[0]}.{tag[1]}={tag[2]}"] = {
+                'namespace': tag[0],
+                'key': tag[1],
+                'value': tag[2],
+                'total_cost': float(total),
+                'services': services[tag]
             }
+        
+        return cost_by_tag, float(costs['cost'].sum())
+    
+    def collect_resource_tags(self, from_date, to_date):
+        """
+        Collect defined tags and freeform tags from resources via Usage API.
+        Data Points: Defined Tags on Resources, Freeform Tags on Resources
+        API: Each resource API returns defined_tags and freeform_tags
+        Purpose: Cost allocation & chargeback, Custom metadata tracking
+        
+        Note: This collects tags from the Usage API which already includes
+        tag information for resources. We'll aggregate unique tag keys used.
+        The query is shared with collect_cost_tracking_tags (see
+        collect_tags_and_costs).
+        
+        Args:
+            from_date: Start date (YYYY-MM-DD)
+            to_date: End date (YYYY-MM-DD)
             
+        Returns:
+            Dictionary with defined_tags and freeform_tags statistics
+        """
+        print(f"\n{'='*70}")
+        print("🔍 Collecting Resource Tags from Usage Data")
+        print(f"{'='*70}")
+        
+        result, _ = self.collect_tags_and_costs(from_date, to_date)
+        
+        if result:
             print(f"✅ Collected tag data from {result['total_records']} usage records")
             print(f"  📊 Unique tag namespaces: {len(result['unique_tag_namespaces'])}")
             print(f"  📊 Unique tag keys: {len(result['unique_tag_keys'])}")
@@ -504,6 +1238,8 @@ class OCIGrowthCollector:
         API: oci.usage_api.UsageapiClient with tagNamespace, tagKey, tagValue in groupBy
         Purpose: Tag-based cost breakdown
         
+        The query is shared with collect_resource_tags (see collect_tags_and_costs).
+        
         Args:
             from_date: Start date (YYYY-MM-DD)
             to_date: End date (YYYY-MM-DD)
@@ -515,93 +1251,16 @@ class OCIGrowthCollector:
         print("💰 Collecting Cost-Tracking Tags")
         print(f"{'='*70}")
         
-        # Build request to get cost data grouped by tags
-        request_body = {
-            "tenantId": self.tenancy_ocid,
-            "timeUsageStarted": f"{from_date}T00:00:00Z",
-            "timeUsageEnded": f"{to_date}T00:00:00Z",
-            "granularity": "DAILY",
-            "queryType": "COST",
-            "groupBy": ["tagNamespace", "tagKey", "tagValue", "service"],
-            "compartmentDepth": 4
-        }
-        
-        # Save request body
-        request_file = self.output_dir / "request_cost_tracking_tags.json"
-        with open(request_file, 'w') as f:
-            json.dump(request_body, f, indent=2)
-        
-        api_endpoint = f"https://usageapi.{self.home_region}.oci.oraclecloud.com/20200107/usage"
+        _, result = self.collect_tags_and_costs(from_date, to_date)
         
-        command = [
-            'oci', 'raw-request',
-            '--http-method', 'POST',
-            '--target-uri', api_endpoint,
-            '--request-body', f'file://{request_file}',
-            '--output', 'json'
-        ]
-        
-        data = self._execute_oci_command(
-            command,
-            "🌐 Fetching cost data by tags from Usage API..."
-        )
-        
-        # Clean up request file
-        if request_file.exists():
-            request_file.unlink()
-        
-        if data and 'items' in data:
-            items = data['items']
-            
-            # Aggregate cost by tag
-            cost_by_tag = {}
-            total_cost = 0
-            
-            for item in items:
-                tag_ns = item.get('tagNamespace', 'untagged')
-                tag_key = item.get('tagKey', 'untagged')
-                tag_value = item.get('tagValue', 'untagged')
-                cost = float(item.get('computedAmount', 0))
-                
-                tag_full = f"{tag_ns}.{tag_key}={tag_value}"
-                
-                if tag_full not in cost_by_tag:
-                    cost_by_tag[tag_full] = {
-                        'namespace': tag_ns,
-                        'key': tag_key,
-                        'value': tag_value,
-                        'total_cost': 0,
-                        'services': {}
-                    }
-                
-                cost_by_tag[tag_full]['total_cost'] += cost
-                total_cost += cost
-                
-                service = item.get('service', 'Unknown')
-                if service not in cost_by_tag[tag_full]['services']:
-                    cost_by_tag[tag_full]['services'][service] = 0
-                cost_by_tag[tag_full]['services'][service] += cost
-            
-            # Sort by cost descending
-            sorted_tags = sorted(
-                cost_by_tag.items(),
-                key=lambda x: x[1]['total_cost'],
-                reverse=True
-            )
-            
-            result = {
-                'total_cost': total_cost,
-                'unique_tag_combinations': len(cost_by_tag),
-                'cost_by_tag': dict(sorted_tags),
-                'raw_data': items[:1000]  # Store first 1000 records
-            }
-            
+        if result:
+            cost_by_tag = result['cost_by_tag']
             print(f"✅ Collected cost data for {len(cost_by_tag)} unique tag combinations")
-            print(f"  💵 Total cost tracked: ${total_cost:,.2f}")
+            print(f"  💵 Total cost tracked: ${result['total_cost']:,.2f}")
             
             # Show top 5 cost-driving tags
             print("\n📊 Top 5 cost-driving tag combinations:")
-            for tag_full, tag_data in sorted_tags[:5]:
+            for tag_full, tag_data in list(cost_by_tag.items())[:5]:
                 print(f"  💰 {tag_full}: ${tag_data['total_cost']:,.2f}")
             
             return result
@@ -637,47 +1296,55 @@ class OCIGrowthCollector:
         print(f"{'='*70}")
         print(f"Input DataFrame: {len(df)} rows")
         
-        # Initialize new columns
-        df['has_tags'] = False
-        df['tag_count'] = 0
-        df['tag_namespaces'] = ''
-        df['primary_cost_center'] = ''
-        df['primary_environment'] = ''
+        import numpy as np
+        import pandas as pd
+        
+        # Derive the tag columns once per tagged resource instead of once per row
+        resource_ids = list(self._resource_tag_map)
+        tag_counts = np.empty(len(resource_ids), dtype=np.int64)
+        tag_namespaces = np.empty(len(resource_ids), dtype=object)
+        tags_json = np.empty(len(resource_ids), dtype=object)
+        cost_centers = np.empty(len(resource_ids), dtype=object)
+        environments = np.empty(len(resource_ids), dtype=object)
+        
+        for i, tag_info in enumerate(self._resource_tag_map.values()):
+            tags_list = tag_info.get('tags', [])
+            tag_counts[i] = len(tags_list)
+            tag_namespaces[i] = ','.join(tag_info.get('namespaces', []))
+            tags_json[i] = json.dumps(tags_list) if tags_list else None
+            # Resolved in collect_resource_tags
+            cost_centers[i] = tag_info.get('primary_cost_center', '')
+            environments[i] = tag_info.get('primary_environment', '')
+        
+        # Position of each row's resource in the arrays above (-1 when untagged)
+        if resource_id_column in df.columns:
+            positions = pd.Index(resource_ids, dtype=object).get_indexer(df[resource_id_column])
+        else:
+            positions = np.full(len(df), -1)
+        matched = positions >= 0
+        matched_positions = positions[matched]
+        enriched_count = int(matched.sum())
+        
+        def column(values, fill):
+            """Spread per-resource values over the rows, using fill for untagged rows."""
+            result = np.full(len(df), fill, dtype=values.dtype)
+            result[matched] = values[matched_positions]
+            return result
+        
+        df['has_tags'] = matched
+        df['tag_count'] = column(tag_counts, 0)
+        df['tag_namespaces'] = column(tag_namespaces, '')
+        df['primary_cost_center'] = column(cost_centers, '')
+        df['primary_environment'] = column(environments, '')
         
-        # Replace the tags column if it exists (from Usage API with None values)
+        # Store the actual tags list as a JSON string. An existing tags column
+        # (from the Usage API, holding None values) is replaced; otherwise the
+        # column is only added when at least one resource has tags.
+        row_tags = column(tags_json, None)
         if 'tags' in df.columns:
-            df['tags'] = None
-        
-        # Enrich each row
-        enriched_count = 0
-        for idx, row in df.iterrows():
-            resource_id = row.get(resource_id_column, '')
-            if resource_id and resource_id in self._resource_tag_map:
-                tag_info = self._resource_tag_map[resource_id]
-                tags_list = tag_info.get('tags', [])
-                
-                df.at[idx, 'has_tags'] = True
-                df.at[idx, 'tag_count'] = len(tags_list)
-                df.at[idx, 'tag_namespaces'] = ','.join(tag_info.get('namespaces', []))
-                
-                # Store the actual tags list as JSON string
-                if tags_list:
-                    df.at[idx, 'tags'] = json.dumps(tags_list)
-                
-                # Extract common tags
-                for tag in tags_list:
-                    key = tag.get('key', '')
-                    value = tag.get('value', '')
-                    
-                    # Map common cost center tags
-                    if key.lower() in ['costcenter', 'cost-center', 'cost_center', 'department']:
-                        df.at[idx, 'primary_cost_center'] = value
-                    
-                    # Map common environment tags
-                    if key.lower() in ['environment', 'env', 'stage']:
-                        df.at[idx, 'primary_environment'] = value
-                
-                enriched_count += 1
+            df['tags'] = row_tags
+        elif any(value is not None for value in row_tags):
+            df['tags'] = np.where(pd.isna(row_tags), np.nan, row_tags)
         
         print(f"✅ Enriched {enriched_count}/{len(df)} rows with tag information")
         print(f"  - Resources with tags: {df['has_tags'].sum()}")
@@ -707,6 +1374,63 @@ class OCIGrowthCollector:
             )
         }
     
+    def _fetch_one_metric(self, namespace, metric_name, from_date, to_date):
+        """
+        Fetch hourly data for a single metric (helper for parallel processing).
+        
+        Args:
+            namespace: Monitoring namespace (e.g. oci_computeagent)
+            metric_name: Metric name within the namespace
+            from_date: Start date (YYYY-MM-DD)
+            to_date: End date (YYYY-MM-DD)
+            
+        Returns:
+            Tuple of (namespace, metric_name, list of metric series or None if failed)
+        """
+        # Build query for this metric
+        query = f"{metric_name}[1m].mean()"
+        
+        # Build request body for summarize_metrics_data
+        request_body = {
+            "namespace": namespace,
+            "query": query,
+            "startTime": f"{from_date}T00:00:00.000Z",
+            "endTime": f"{to_date}T23:59:59.999Z",
+            "resolution": "1h"
+        }
+        
+        api_endpoint = f"https://telemetry.{self.home_region}.oraclecloud.com/20180401/metrics/actions/summarizeMetricsData"
+        
+        try:
+            from .oci_client import get_rest_client
+            rest_client = get_rest_client()
+            if rest_client is not None:
+                status, data = rest_client.request('POST', api_endpoint, body=request_body, timeout=300)
+                return namespace, metric_name, data if status == 200 else None
+            
+            # The request body is piped through stdin, so parallel queries
+            # share no files
+            result = subprocess.run(
+                [
+                    'oci', 'raw-request',
+                    '--http-method', 'POST',
+                    '--target-uri', api_endpoint,
+                    '--request-body', 'file:///dev/stdin',
+                    '--output', 'json'
+                ],
+                input=json_dumps(request_body, indent=False),
+                capture_output=True,
+                timeout=300
+            )
+            
+            if result.returncode != 0:
+                return namespace, metric_name, None
+            
+            response = json_loads(result.stdout)
+            return namespace, metric_name, response.get('data', response) if isinstance(response, dict) else response
+        except Exception:
+            return namespace, metric_name, None
+    
     def collect_performance_metrics(self, from_date, to_date):
         """
         Collect performance metrics from OCI Monitoring service.
@@ -755,10 +1479,47 @@ class OCIGrowthCollector:
             }
         }
         
+        # One query per (namespace, metric); they are independent, so run them in parallel
+        metric_queries = [
+            (namespace, metric_name)
+            for namespace, config in metrics_config.items()
+            for metric_name in config['metrics']
+        ]
+        
+        workers = self._pool_size(self.max_workers_tags, len(metric_queries))
+        print(f"Using {workers} parallel workers for {len(metric_queries)} metric queries...")
+        
+        tracker = ProgressTracker(len(metric_queries))
+        completed = 0
+        # (namespace, metric) -> (data points, samples written); each series is
+        # written to its JSON Lines file as its query completes and then dropped
+        metric_counts = {}
+        
+        executor = self._executor(workers)
+        futures = [
+            executor.submit(self._fetch_one_metric, namespace, metric_name, from_date, to_date)
+            for namespace, metric_name in metric_queries
+        ]
+        
+        for future in as_completed(futures):
+            namespace, metric_name, data = future.result()
+            completed += 1
+            if data and isinstance(data, list):
+                samples_count = write_jsonl(
+                    data[:MAX_METRIC_SAMPLES],
+                    self.output_dir / f"growth_metrics_{namespace}_{metric_name}.jsonl",
+                    default=str
+                )
+                metric_counts[(namespace, metric_name)] = (len(data), samples_count)
+            tracker.update(completed)
+        
+        tracker.finish()
+        
+        # Assemble results in configuration order so the output is stable
         all_metrics = {}
         
         for namespace, config in metrics_config.items():
-            print(f"\n🔍 Collecting {config['display_name']} metrics...")
+            print(f"\n🔍 {config['display_name']} metrics:")
             
             namespace_metrics = {
                 'display_name': config['display_name'],
@@ -766,53 +1527,21 @@ class OCIGrowthCollector:
             }
             
             for metric_name in config['metrics']:
-                # Build query for this metric
-                query = f"{metric_name}[1m].mean()"
-                
-                # Build request body for summarize_metrics_data
-                request_body = {
-                    "namespace": namespace,
-                    "query": query,
-                    "startTime": f"{from_date}T00:00:00.000Z",
-                    "endTime": f"{to_date}T23:59:59.999Z",
-                    "resolution": "1h"
-                }
-                
-                # Save request body
-                request_file = self.output_dir / f"request_metrics_{namespace}_{metric_name}.json"
-                with open(request_file, 'w') as f:
-                    json.dump(request_body, f, indent=2)
-                
-                api_endpoint = f"https://telemetry.{self.home_region}.oraclecloud.com/20180401/metrics/actions/summarizeMetricsData"
-                
-                command = [
-                    'oci', 'raw-request',
-                    '--http-method', 'POST',
-                    '--target-uri', api_endpoint,
-                    '--request-body', f'file://{request_file}',
-                    '--output', 'json'
-                ]
-                
-                data = self._execute_oci_command(
-                    command,
-                    f"  📈 Fetching {metric_name}..."
-                )
+                counts = metric_counts.get((namespace, metric_name))
                 
-                # Clean up request file
-                if request_file.exists():
-                    request_file.unlink()
-                
-                if data and isinstance(data, list) and len(data) > 0:
-                    # Store metric data
+                if counts:
+                    data_points, samples_count = counts
                     namespace_metrics['metrics'][metric_name] = {
-                        'data_points': len(data),
-                        'samples': data[:100]  # Store first 100 samples
+                        'data_points': data_points,
+                        'samples_file': f"growth_metrics_{namespace}_{metric_name}.jsonl",
+                        'samples_count': samples_count
                     }
-                    print(f"    ✅ Collected {len(data)} data points for {metric_name}")
+                    print(f"    ✅ Collected {data_points} data points for {metric_name}")
                 else:
                     namespace_metrics['metrics'][metric_name] = {
                         'data_points': 0,
-                        'samples': []
+                        'samples_file': None,
+                        'samples_count': 0
                     }
                     print(f"    ⚠️  No data found for {metric_name}")
             
@@ -850,21 +1579,27 @@ class OCIGrowthCollector:
         if not self.compartments:
             self._get_all_compartments()
         
-        all_events = []
+        # The first MAX_SAMPLE_EVENTS events are written to AUDIT_EVENTS_FILE as
+        # they arrive; the rest are just counted
+        sample_events_count = 0
         event_stats = {
             'total_events': 0,
-            'event_types': {},
-            'resource_types': {},
+            'event_types': Counter(),
+            'resource_types': Counter(),
             'users': set(),
             'compartments_with_events': set()
         }
         
         print(f"Scanning {len(self.compartments)} compartments for audit events...")
-        print(f"Using {self.max_workers_compartments} parallel workers...")
+        workers = self._pool_size(self.max_workers_compartments, len(self.compartments))
+        print(f"Using {workers} parallel workers...")
         
         tracker = ProgressTracker(len(self.compartments))
         completed = 0
         
+        from .oci_client import AUDIT_MAP_FIELDS, get_rest_client, service_endpoint, to_cli_keys
+        rest_client = get_rest_client()
+        
         # Helper function for parallel processing
         def fetch_audit_events(comp_id):
             command = [
@@ -877,15 +1612,28 @@ class OCIGrowthCollector:
             ]
             
             try:
+                if rest_client is not None:
+                    status, data = rest_client.list_all(
+                        f"{service_endpoint('audit', self.home_region)}/20190901/auditEvents",
+                        params={
+                            'compartmentId': comp_id,
+                            'startTime': f"{from_date}T00:00:00.000Z",
+                            'endTime': f"{to_date}T23:59:59.999Z"
+                        },
+                        timeout=60,
+                        # Each page is converted while the next one downloads
+                        transform=lambda page: to_cli_keys(page, AUDIT_MAP_FIELDS)
+                    )
+                    return comp_id, (data if status == 200 else [])
+                
                 result = subprocess.run(
                     command,
                     capture_output=True,
-                    text=True,
                     timeout=60
                 )
                 
                 if result.returncode == 0:
-                    response = json.loads(result.stdout)
+                    response = json_loads(result.stdout)
                     return comp_id, response.get('data', [])
                 else:
                     return comp_id, []
@@ -893,7 +1641,8 @@ class OCIGrowthCollector:
                 return comp_id, []
         
         # Execute in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers_compartments) as executor:
+        executor = self._executor(workers)
+        with atomic_open(self.output_dir / AUDIT_EVENTS_FILE, 'wb') as events_out:
             future_to_compartment = {
                 executor.submit(fetch_audit_events, comp_id): comp_id
                 for comp_id in self.compartments
@@ -904,22 +1653,20 @@ class OCIGrowthCollector:
                 completed += 1
                 
                 if events:
-                    all_events.extend(events)
+                    for event in events[:MAX_SAMPLE_EVENTS - sample_events_count]:
+                        events_out.write(json_dumps(event, indent=False, default=str) + b'\n')
+                        sample_events_count += 1
                     event_stats['compartments_with_events'].add(comp_id)
                     
-                    # Analyze events
-                    for event in events:
-                        event_stats['total_events'] += 1
-                        
-                        event_type = event.get('data', {}).get('eventName', 'Unknown')
-                        event_stats['event_types'][event_type] = event_stats['event_types'].get(event_type, 0) + 1
-                        
-                        resource_type = event.get('data', {}).get('resourceName', 'Unknown')
-                        event_stats['resource_types'][resource_type] = event_stats['resource_types'].get(resource_type, 0) + 1
-                        
-                        principal = event.get('data', {}).get('identity', {}).get('principalName', '')
-                        if principal:
-                            event_stats['users'].add(principal)
+                    # Analyze events (counted per compartment batch); the
+                    # nested data map is looked up once per event
+                    event_data = [event.get('data') or {} for event in events]
+                    event_stats['total_events'] += len(events)
+                    event_stats['event_types'].update(d.get('event-name', 'Unknown') for d in event_data)
+                    event_stats['resource_types'].update(d.get('resource-name', 'Unknown') for d in event_data)
+                    event_stats['users'].update(filter(None, (
+                        (d.get('identity') or {}).get('principal-name') for d in event_data
+                    )))
                 
                 tracker.update(completed)
         
@@ -934,9 +1681,10 @@ class OCIGrowthCollector:
             'total_events': event_stats['total_events'],
             'compartments_with_events': len(event_stats['compartments_with_events']),
             'unique_users': len(event_stats['users']),
-            'event_types': dict(sorted(event_stats['event_types'].items(), key=lambda x: x[1], reverse=True)),
-            'resource_types': dict(sorted(event_stats['resource_types'].items(), key=lambda x: x[1], reverse=True)),
-            'sample_events': all_events[:1000]  # Store first 1000 events
+            'event_types': dict(event_stats['event_types'].most_common()),
+            'resource_types': dict(event_stats['resource_types'].most_common()),
+            'sample_events_file': AUDIT_EVENTS_FILE,
+            'sample_events_count': sample_events_count
         }
         
         print(f"✅ Collected {result['total_events']} audit events")
@@ -973,16 +1721,20 @@ class OCIGrowthCollector:
             'total_rules': 0,
             'enabled_rules': 0,
             'disabled_rules': 0,
-            'action_types': {},
+            'action_types': Counter(),
             'compartments_with_rules': set()
         }
         
         print(f"Scanning {len(self.compartments)} compartments for event rules...")
-        print(f"Using {self.max_workers_compartments} parallel workers...")
+        workers = self._pool_size(self.max_workers_compartments, len(self.compartments))
+        print(f"Using {workers} parallel workers...")
         
         tracker = ProgressTracker(len(self.compartments))
         completed = 0
         
+        from .oci_client import get_rest_client, service_endpoint, to_cli_keys
+        rest_client = get_rest_client()
+        
         # Helper function for parallel processing
         def fetch_event_rules(comp_id):
             command = [
@@ -993,15 +1745,22 @@ class OCIGrowthCollector:
             ]
             
             try:
+                if rest_client is not None:
+                    status, data = rest_client.list_all(
+                        f"{service_endpoint('events', self.home_region)}/20181201/rules",
+                        params={'compartmentId': comp_id},
+                        timeout=30
+                    )
+                    return comp_id, (to_cli_keys(data) if status == 200 else [])
+                
                 result = subprocess.run(
                     command,
                     capture_output=True,
-                    text=True,
                     timeout=30
                 )
                 
                 if result.returncode == 0:
-                    response = json.loads(result.stdout)
+                    response = json_loads(result.stdout)
                     return comp_id, response.get('data', [])
                 else:
                     return comp_id, []
@@ -1009,37 +1768,37 @@ class OCIGrowthCollector:
                 return comp_id, []
         
         # Execute in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers_compartments) as executor:
-            future_to_compartment = {
-                executor.submit(fetch_event_rules, comp_id): comp_id
-                for comp_id in self.compartments
-            }
+        executor = self._executor(workers)
+        future_to_compartment = {
+            executor.submit(fetch_event_rules, comp_id): comp_id
+            for comp_id in self.compartments
+        }
             
-            for future in as_completed(future_to_compartment):
-                comp_id, rules = future.result()
-                completed += 1
+        for future in as_completed(future_to_compartment):
+            comp_id, rules = future.result()
+            completed += 1
                 
-                if rules:
-                    all_rules.extend(rules)
-                    rule_stats['compartments_with_rules'].add(comp_id)
+            if rules:
+                all_rules.extend(rules)
+                rule_stats['compartments_with_rules'].add(comp_id)
                     
-                    # Analyze rules
-                    for rule in rules:
-                        rule_stats['total_rules'] += 1
-                        
-                        if rule.get('lifecycle-state') == 'ACTIVE':
-                            rule_stats['enabled_rules'] += 1
-                        else:
-                            rule_stats['disabled_rules'] += 1
-                        
-                        # Analyze actions
-                        actions = rule.get('actions', {})
-                        if isinstance(actions, dict):
-                            for action in actions.get('actions', []):
-                                action_type = action.get('action-type', 'Unknown')
-                                rule_stats['action_types'][action_type] = rule_stats['action_types'].get(action_type, 0) + 1
+                # Analyze rules (counted per compartment batch)
+                enabled = Counter(rule.get('lifecycle-state') for rule in rules)['ACTIVE']
+                rule_stats['total_rules'] += len(rules)
+                rule_stats['enabled_rules'] += enabled
+                rule_stats['disabled_rules'] += len(rules) - enabled
+                    
+                # Analyze actions
+                for rule in rules:
+                    try:
+                        actions = rule['actions']['actions']
+                    except (KeyError, TypeError):
+                        continue
+                    rule_stats['action_types'].update(
+                        action.get('action-type', 'Unknown') for action in actions
+                    )
                 
-                tracker.update(completed)
+            tracker.update(completed)
         
         tracker.finish()
         
@@ -1048,7 +1807,7 @@ class OCIGrowthCollector:
             'enabled_rules': rule_stats['enabled_rules'],
             'disabled_rules': rule_stats['disabled_rules'],
             'compartments_with_rules': len(rule_stats['compartments_with_rules']),
-            'action_types': dict(sorted(rule_stats['action_types'].items(), key=lambda x: x[1], reverse=True)),
+            'action_types': dict(rule_stats['action_types'].most_common()),
             'rules': all_rules
         }
         
@@ -1065,13 +1824,14 @@ class OCIGrowthCollector:
         
         return result
     
-    def collect_all(self, from_date=None, to_date=None):
+    def collect_all(self, from_date=None, to_date=None, force_refresh=False):
         """
         Collect all growth-related data including performance metrics, audit events, and event rules.
         
         Args:
             from_date: Start date for usage/cost queries (YYYY-MM-DD)
             to_date: End date for usage/cost queries (YYYY-MM-DD)
+            force_refresh: Ignore cached compartment and tag discovery results
             
         Returns:
             Dictionary with all collected data
@@ -1090,27 +1850,30 @@ class OCIGrowthCollector:
             'home_region': self.home_region
         }
         
-        # Collect tag structure data (no date range needed)
-        results['compartments'] = self._get_all_compartments()
-        results['tag_namespaces'] = self.collect_tag_namespaces()
-        results['tag_definitions'] = self.collect_tag_definitions()
-        results['tag_defaults'] = self.collect_tag_defaults()
-        
-        # Collect usage-based tag data (requires date range)
-        if from_date and to_date:
-            results['resource_tags'] = self.collect_resource_tags(from_date, to_date)
-            results['cost_tracking_tags'] = self.collect_cost_tracking_tags(from_date, to_date)
+        try:
+            # Collect tag structure data (no date range needed)
+            results['compartments'] = self._get_all_compartments(force_refresh=force_refresh)
+            results['tag_namespaces'] = self.collect_tag_namespaces(force_refresh=force_refresh)
+            results['tag_definitions'] = self.collect_tag_definitions(force_refresh=force_refresh)
+            results['tag_defaults'] = self.collect_tag_defaults()
             
-            # Collect performance metrics
-            results['performance_metrics'] = self.collect_performance_metrics(from_date, to_date)
+            # Collect usage-based tag data (requires date range)
+            if from_date and to_date:
+                results['resource_tags'] = self.collect_resource_tags(from_date, to_date)
+                results['cost_tracking_tags'] = self.collect_cost_tracking_tags(from_date, to_date)
             
-            # Collect audit events
-            results['audit_events'] = self.collect_audit_events(from_date, to_date)
-        else:
-            print("\n⚠️  Skipping date-range-dependent collections (no date range provided)")
-        
-        # Collect event rules (no date range needed)
-        results['event_rules'] = self.collect_event_rules()
+                # Collect performance metrics
+                results['performance_metrics'] = self.collect_performance_metrics(from_date, to_date)
+            
+                # Collect audit events
+                results['audit_events'] = self.collect_audit_events(from_date, to_date)
+            else:
+                print("\n⚠️  Skipping date-range-dependent collections (no date range provided)")
+            
+            # Collect event rules (no date range needed)
+            results['event_rules'] = self.collect_event_rules()
+        finally:
+            self.close()
         
         # Save all collected data
         self._save_results(results)
@@ -1128,8 +1891,9 @@ class OCIGrowthCollector:
         spinner = ProgressSpinner("Writing data to file...")
         spinner.start()
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        # One top-level section (tags, metrics, audit events, ...) is serialized
+        # at a time instead of the whole document at once
+        write_json_object(results.items(), output_file, default=str)
         
         spinner.stop()
         
@@ -1143,144 +1907,150 @@ class OCIGrowthCollector:
     
     def _generate_summary_report(self, results, output_file):
         """Generate a human-readable summary report."""
-        with open(output_file, 'w') as f:
-            f.write("="*70 + "\n")
-            f.write("OCI Growth Collection - Tag Analysis Summary\n")
-            f.write("="*70 + "\n\n")
-            
-            f.write(f"Collection Timestamp: {results.get('collection_timestamp', 'N/A')}\n")
-            f.write(f"Tenancy OCID: {results.get('tenancy_ocid', 'N/A')}\n")
-            f.write(f"Home Region: {results.get('home_region', 'N/A')}\n\n")
-            
-            # Compartments
-            f.write("-"*70 + "\n")
-            f.write("COMPARTMENTS\n")
-            f.write("-"*70 + "\n")
-            comps = results.get('compartments', [])
-            f.write(f"Total Compartments: {len(comps)}\n\n")
-            
-            # Tag Namespaces
-            f.write("-"*70 + "\n")
-            f.write("TAG NAMESPACES\n")
-            f.write("-"*70 + "\n")
-            namespaces = results.get('tag_namespaces', [])
-            f.write(f"Total Tag Namespaces: {len(namespaces)}\n")
-            for ns in namespaces:
-                f.write(f"  - {ns.get('name', 'N/A')}: {ns.get('description', 'No description')}\n")
-            f.write("\n")
-            
-            # Tag Definitions
-            f.write("-"*70 + "\n")
-            f.write("TAG DEFINITIONS\n")
-            f.write("-"*70 + "\n")
-            definitions = results.get('tag_definitions', {})
-            total_tags = sum(len(ns_data.get('tags', [])) for ns_data in definitions.values())
-            f.write(f"Total Tag Definitions: {total_tags}\n")
-            for ns_id, ns_data in definitions.items():
-                ns_name = ns_data.get('namespace_name', 'Unknown')
-                tags = ns_data.get('tags', [])
-                f.write(f"  Namespace '{ns_name}': {len(tags)} tags\n")
-                for tag in tags[:5]:  # Show first 5
-                    f.write(f"    - {tag.get('name', 'N/A')}\n")
-                if len(tags) > 5:
-                    f.write(f"    ... and {len(tags) - 5} more\n")
-            f.write("\n")
-            
-            # Tag Defaults
-            f.write("-"*70 + "\n")
-            f.write("TAG DEFAULTS (Auto-tagging Rules)\n")
-            f.write("-"*70 + "\n")
-            defaults = results.get('tag_defaults', [])
-            f.write(f"Total Tag Defaults: {len(defaults)}\n")
-            for td in defaults[:10]:  # Show first 10
-                f.write(f"  - {td.get('tag-definition-name', 'N/A')} = {td.get('value', 'N/A')}\n")
-            if len(defaults) > 10:
-                f.write(f"  ... and {len(defaults) - 10} more\n")
-            f.write("\n")
-            
-            # Resource Tags (if available)
-            if 'resource_tags' in results and results['resource_tags']:
-                f.write("-"*70 + "\n")
-                f.write("RESOURCE TAGS\n")
-                f.write("-"*70 + "\n")
-                rt = results['resource_tags']
-                f.write(f"Total Records: {rt.get('total_records', 0)}\n")
-                f.write(f"Unique Tag Namespaces: {len(rt.get('unique_tag_namespaces', []))}\n")
-                f.write(f"Unique Tag Keys: {len(rt.get('unique_tag_keys', []))}\n")
-                f.write(f"Resources with Tags: {rt.get('resources_with_tags_count', 0)}\n\n")
-            
-            # Cost-Tracking Tags (if available)
-            if 'cost_tracking_tags' in results and results['cost_tracking_tags']:
-                f.write("-"*70 + "\n")
-                f.write("COST-TRACKING TAGS\n")
-                f.write("-"*70 + "\n")
-                ct = results['cost_tracking_tags']
-                f.write(f"Total Cost Tracked: ${ct.get('total_cost', 0):,.2f}\n")
-                f.write(f"Unique Tag Combinations: {ct.get('unique_tag_combinations', 0)}\n")
-                f.write("\nTop 10 Cost-Driving Tags:\n")
-                cost_by_tag = ct.get('cost_by_tag', {})
-                for i, (tag_full, tag_data) in enumerate(list(cost_by_tag.items())[:10], 1):
-                    f.write(f"  {i}. {tag_full}: ${tag_data['total_cost']:,.2f}\n")
-                f.write("\n")
-            
-            # Performance Metrics (if available)
-            if 'performance_metrics' in results and results['performance_metrics']:
-                f.write("-"*70 + "\n")
-                f.write("PERFORMANCE METRICS\n")
-                f.write("-"*70 + "\n")
-                pm = results['performance_metrics']
-                period = pm.get('collection_period', {})
-                f.write(f"Collection Period: {period.get('from_date', 'N/A')} to {period.get('to_date', 'N/A')}\n\n")
-                
-                metrics_by_ns = pm.get('metrics_by_namespace', {})
-                for namespace, ns_data in metrics_by_ns.items():
-                    f.write(f"{ns_data.get('display_name', namespace)}:\n")
-                    for metric_name, metric_data in ns_data.get('metrics', {}).items():
-                        data_points = metric_data.get('data_points', 0)
-                        f.write(f"  - {metric_name}: {data_points} data points\n")
-                    f.write("\n")
-            
-            # Audit Events (if available)
-            if 'audit_events' in results and results['audit_events']:
-                f.write("-"*70 + "\n")
-                f.write("AUDIT EVENTS\n")
-                f.write("-"*70 + "\n")
-                ae = results['audit_events']
-                period = ae.get('collection_period', {})
-                f.write(f"Collection Period: {period.get('from_date', 'N/A')} to {period.get('to_date', 'N/A')}\n")
-                f.write(f"Total Events: {ae.get('total_events', 0)}\n")
-                f.write(f"Unique Users: {ae.get('unique_users', 0)}\n")
-                f.write(f"Compartments with Events: {ae.get('compartments_with_events', 0)}\n")
-                
-                f.write("\nTop 10 Event Types:\n")
-                event_types = ae.get('event_types', {})
-                for i, (event_type, count) in enumerate(list(event_types.items())[:10], 1):
-                    f.write(f"  {i}. {event_type}: {count}\n")
-                
-                f.write("\nTop 10 Resource Types:\n")
-                resource_types = ae.get('resource_types', {})
-                for i, (resource_type, count) in enumerate(list(resource_types.items())[:10], 1):
-                    f.write(f"  {i}. {resource_type}: {count}\n")
-                f.write("\n")
-            
-            # Event Rules (if available)
-            if 'event_rules' in results and results['event_rules']:
-                f.write("-"*70 + "\n")
-                f.write("EVENT RULES\n")
-                f.write("-"*70 + "\n")
-                er = results['event_rules']
-                f.write(f"Total Rules: {er.get('total_rules', 0)}\n")
-                f.write(f"Enabled Rules: {er.get('enabled_rules', 0)}\n")
-                f.write(f"Disabled Rules: {er.get('disabled_rules', 0)}\n")
-                f.write(f"Compartments with Rules: {er.get('compartments_with_rules', 0)}\n")
-                
-                action_types = er.get('action_types', {})
-                if action_types:
-                    f.write("\nAction Types:\n")
-                    for action_type, count in action_types.items():
-                        f.write(f"  - {action_type}: {count}\n")
-                f.write("\n")
-            
-            f.write("="*70 + "\n")
-            f.write("End of Report\n")
-            f.write("="*70 + "\n")
+        # The report is assembled in memory and written with a single call,
+        # replacing any previous report atomically
+        parts = []
+        w = parts.append
+        w("="*70 + "\n")
+        w("OCI Growth Collection - Tag Analysis Summary\n")
+        w("="*70 + "\n\n")
+        
+        w(f"Collection Timestamp: {results.get('collection_timestamp', 'N/A')}\n")
+        w(f"Tenancy OCID: {results.get('tenancy_ocid', 'N/A')}\n")
+        w(f"Home Region: {results.get('home_region', 'N/A')}\n\n")
+        
+        # Compartments
+        w("-"*70 + "\n")
+        w("COMPARTMENTS\n")
+        w("-"*70 + "\n")
+        comps = results.get('compartments', [])
+        w(f"Total Compartments: {len(comps)}\n\n")
+        
+        # Tag Namespaces
+        w("-"*70 + "\n")
+        w("TAG NAMESPACES\n")
+        w("-"*70 + "\n")
+        namespaces = results.get('tag_namespaces', [])
+        w(f"Total Tag Namespaces: {len(namespaces)}\n")
+        for ns in namespaces:
+            w(f"  - {ns.get('name', 'N/A')}: {ns.get('description', 'No description')}\n")
+        w("\n")
+        
+        # Tag Definitions
+        w("-"*70 + "\n")
+        w("TAG DEFINITIONS\n")
+        w("-"*70 + "\n")
+        definitions = results.get('tag_definitions', {})
+        total_tags = sum(len(ns_data.get('tags', [])) for ns_data in definitions.values())
+        w(f"Total Tag Definitions: {total_tags}\n")
+        for ns_id, ns_data in definitions.items():
+            ns_name = ns_data.get('namespace_name', 'Unknown')
+            tags = ns_data.get('tags', [])
+            w(f"  Namespace '{ns_name}': {len(tags)} tags\n")
+            for tag in tags[:5]:  # Show first 5
+                w(f"    - {tag.get('name', 'N/A')}\n")
+            if len(tags) > 5:
+                w(f"    ... and {len(tags) - 5} more\n")
+        w("\n")
+        
+        # Tag Defaults
+        w("-"*70 + "\n")
+        w("TAG DEFAULTS (Auto-tagging Rules)\n")
+        w("-"*70 + "\n")
+        defaults = results.get('tag_defaults', [])
+        w(f"Total Tag Defaults: {len(defaults)}\n")
+        for td in defaults[:10]:  # Show first 10
+            w(f"  - {td.get('tag-definition-name', 'N/A')} = {td.get('value', 'N/A')}\n")
+        if len(defaults) > 10:
+            w(f"  ... and {len(defaults) - 10} more\n")
+        w("\n")
+        
+        # Resource Tags (if available)
+        if 'resource_tags' in results and results['resource_tags']:
+            w("-"*70 + "\n")
+            w("RESOURCE TAGS\n")
+            w("-"*70 + "\n")
+            rt = results['resource_tags']
+            w(f"Total Records: {rt.get('total_records', 0)}\n")
+            w(f"Unique Tag Namespaces: {len(rt.get('unique_tag_namespaces', []))}\n")
+            w(f"Unique Tag Keys: {len(rt.get('unique_tag_keys', []))}\n")
+            w(f"Resources with Tags: {rt.get('resources_with_tags_count', 0)}\n\n")
+        
+        # Cost-Tracking Tags (if available)
+        if 'cost_tracking_tags' in results and results['cost_tracking_tags']:
+            w("-"*70 + "\n")
+            w("COST-TRACKING TAGS\n")
+            w("-"*70 + "\n")
+            ct = results['cost_tracking_tags']
+            w(f"Total Cost Tracked: ${ct.get('total_cost', 0):,.2f}\n")
+            w(f"Unique Tag Combinations: {ct.get('unique_tag_combinations', 0)}\n")
+            w("\nTop 10 Cost-Driving Tags:\n")
+            cost_by_tag = ct.get('cost_by_tag', {})
+            for i, (tag_full, tag_data) in enumerate(list(cost_by_tag.items())[:10], 1):
+                w(f"  {i}. {tag_full}: ${tag_data['total_cost']:,.2f}\n")
+            w("\n")
+        
+        # Performance Metrics (if available)
+        if 'performance_metrics' in results and results['performance_metrics']:
+            w("-"*70 + "\n")
+            w("PERFORMANCE METRICS\n")
+            w("-"*70 + "\n")
+            pm = results['performance_metrics']
+            period = pm.get('collection_period', {})
+            w(f"Collection Period: {period.get('from_date', 'N/A')} to {period.get('to_date', 'N/A')}\n\n")
+            
+            metrics_by_ns = pm.get('metrics_by_namespace', {})
+            for namespace, ns_data in metrics_by_ns.items():
+                w(f"{ns_data.get('display_name', namespace)}:\n")
+                for metric_name, metric_data in ns_data.get('metrics', {}).items():
+                    data_points = metric_data.get('data_points', 0)
+                    w(f"  - {metric_name}: {data_points} data points\n")
+                w("\n")
+        
+        # Audit Events (if available)
+        if 'audit_events' in results and results['audit_events']:
+            w("-"*70 + "\n")
+            w("AUDIT EVENTS\n")
+            w("-"*70 + "\n")
+            ae = results['audit_events']
+            period = ae.get('collection_period', {})
+            w(f"Collection Period: {period.get('from_date', 'N/A')} to {period.get('to_date', 'N/A')}\n")
+            w(f"Total Events: {ae.get('total_events', 0)}\n")
+            w(f"Unique Users: {ae.get('unique_users', 0)}\n")
+            w(f"Compartments with Events: {ae.get('compartments_with_events', 0)}\n")
+            
+            w("\nTop 10 Event Types:\n")
+            event_types = ae.get('event_types', {})
+            for i, (event_type, count) in enumerate(list(event_types.items())[:10], 1):
+                w(f"  {i}. {event_type}: {count}\n")
+            
+            w("\nTop 10 Resource Types:\n")
+            resource_types = ae.get('resource_types', {})
+            for i, (resource_type, count) in enumerate(list(resource_types.items())[:10], 1):
+                w(f"  {i}. {resource_type}: {count}\n")
+            w("\n")
+        
+        # Event Rules (if available)
+        if 'event_rules' in results and results['event_rules']:
+            w("-"*70 + "\n")
+            w("EVENT RULES\n")
+            w("-"*70 + "\n")
+            er = results['event_rules']
+            w(f"Total Rules: {er.get('total_rules', 0)}\n")
+            w(f"Enabled Rules: {er.get('enabled_rules', 0)}\n")
+            w(f"Disabled Rules: {er.get('disabled_rules', 0)}\n")
+            w(f"Compartments with Rules: {er.get('compartments_with_rules', 0)}\n")
+            
+            action_types = er.get('action_types', {})
+            if action_types:
+                w("\nAction Types:\n")
+                for action_type, count in action_types.items():
+                    w(f"  - {action_type}: {count}\n")
+            w("\n")
+        
+        w("="*70 + "\n")
+        w("End of Report\n")
+        w("="*70 + "\n")
+        
+        with atomic_open(output_file, 'w') as f:
+            f.write(''.join(parts))
@@ -0,0 +1,355 @@
+"""
+In-process OCI REST client used instead of spawning the OCI CLI.
+Copyright (c) 2025 Oracle and/or its affiliates.
+"""
+
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .serialization import iter_json_items, json_loads
+
+try:
+    import oci
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:  # the OCI SDK is optional - callers fall back to the OCI CLI
+    oci = None
+
+
+# Connection pool sizing: one pool per regional endpoint, with enough kept-alive
+# connections for every in-flight instance lookup (see MAX_INFLIGHT_REQUESTS)
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 50
+
+# Throttling and transient server errors are retried with exponential backoff.
+# Both GetInstance and the Usage API summarize POST are read-only, so POST is
+# safe to retry as well.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+# Fields holding user-defined tag maps; their keys are tag names, not field names
+TAG_MAP_FIELDS = frozenset({'freeformTags', 'definedTags', 'systemTags'})
+
+# Free-form maps inside audit events (HTTP headers, query parameters, resource
+# state snapshots and service-specific details)
+AUDIT_MAP_FIELDS = TAG_MAP_FIELDS | {'additionalDetails', 'headers', 'parameters', 'previous', 'current'}
+
+_CAMEL_BOUNDARY = re.compile(r'(?<!^)(?=[A-Z])')
+
+# Endpoint templates for services the SDK's region table does not know by name
+SERVICE_ENDPOINT_TEMPLATES = {
+    'events': 'https://events.{region}.oci.{secondLevelDomain}',
+    'optimizer': 'https://optimizer.{region}.oci.{secondLevelDomain}'
+}
+
+
+# Errors raised while resolving credentials or calling the REST API, and timeouts
+if oci is not None:
+    SDK_ERRORS = (oci.exceptions.ClientError, requests.RequestException, KeyError, OSError, ValueError)
+    SDK_TIMEOUTS = (requests.Timeout,)
+else:
+    SDK_ERRORS = ()
+    SDK_TIMEOUTS = ()
+
+
+def sdk_enabled():
+    """
+    Check whether calls should go through the OCI Python SDK.
+
+    Returns:
+        bool: True if the SDK is installed and OCI_FINOPS_USE_CLI=1 is not set
+    """
+    return oci is not None and os.environ.get('OCI_FINOPS_USE_CLI') != '1'
+
+
+def _read_token(path):
+    """Read a token file referenced from the OCI config."""
+    with open(os.path.expanduser(path), 'r') as f:
+        return f.read().strip()
+
+
+def load_signer():
+    """
+    Resolve OCI credentials the same way the OCI CLI does.
+
+    Honours OCI_CLI_AUTH (api_key, security_token, instance_principal,
+    instance_obo_user for Cloud Shell, resource_principal), OCI_CLI_CONFIG_FILE
+    and OCI_CLI_PROFILE.
+
+    Returns:
+        Tuple of (config dict, request signer)
+    """
+    auth = os.environ.get('OCI_CLI_AUTH', 'api_key')
+
+    if auth == 'instance_principal':
+        return {}, oci.auth.signers.InstancePrincipalsSecurityTokenSigner()
+    if auth == 'resource_principal':
+        return {}, oci.auth.signers.get_resource_principals_signer()
+
+    config = oci.config.from_file(
+        file_location=os.environ.get('OCI_CLI_CONFIG_FILE', oci.config.DEFAULT_LOCATION),
+        profile_name=os.environ.get('OCI_CLI_PROFILE', oci.config.DEFAULT_PROFILE)
+    )
+
+    if auth == 'instance_obo_user':
+        token = _read_token(config['delegation_token_file'])
+        return config, oci.auth.signers.InstancePrincipalsDelegationTokenSigner(delegation_token=token)
+
+    if auth == 'security_token':
+        token = _read_token(config['security_token_file'])
+        private_key = oci.signer.load_private_key_from_file(config['key_file'], config.get('pass_phrase'))
+        return config, oci.auth.signers.SecurityTokenSigner(token, private_key)
+
+    signer = oci.signer.Signer(
+        tenancy=config['tenancy'],
+        user=config['user'],
+        fingerprint=config['fingerprint'],
+        private_key_file_location=config['key_file'],
+        pass_phrase=config.get('pass_phrase')
+    )
+    return config, signer
+
+
+class OCIRestClient:
+    """Signed OCI REST client that reuses one HTTP session for all calls."""
+
+    def __init__(self):
+        """Resolve credentials and open a keep-alive session."""
+        self.config, self.signer = load_signer()
+        self.session = requests.Session()
+        self.session.auth = self.signer
+
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({'GET', 'POST'}),
+            # Hand the last error response back so callers can report its OCI code
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+        self.session.mount('https://', adapter)
+
+    def request(self, method, url, body=None, params=None, timeout=300):
+        """
+        Send a signed request and parse the JSON response.
+
+        Error responses are returned like successful ones, so callers can
+        inspect the OCI 'code' and 'message' fields the same way they do for
+        `oci raw-request` output.
+
+        Args:
+            method: HTTP method (GET, POST, ...)
+            url: Full endpoint URL
+            body: Optional JSON-serializable request body
+            params: Optional query parameters
+            timeout: Request timeout in seconds
+
+        Returns:
+            Tuple of (HTTP status code, parsed JSON body or None if empty)
+        """
+        status, content = self.request_raw(method, url, body=body, params=params, timeout=timeout)
+        if not content:
+            return status, None
+        return status, json_loads(content)
+
+    def request_raw(self, method, url, body=None, params=None, timeout=300):
+        """
+        Send a signed request and return the undecoded response body.
+
+        Args:
+            method: HTTP method (GET, POST, ...)
+            url: Full endpoint URL
+            body: Optional JSON-serializable request body
+            params: Optional query parameters
+            timeout: Request timeout in seconds
+
+        Returns:
+            Tuple of (HTTP status code, response body bytes)
+        """
+        response = self.session.request(method, url, json=body, params=params, timeout=timeout)
+        return response.status_code, response.content
+
+    def stream_items(self, method, url, prefix, body=None, timeout=300):
+        """
+        Send a signed request and iterate over a JSON array in the response
+        as it is downloaded, without holding the whole body in memory.
+
+        Requires ijson (see serialization.iter_json_items).
+
+        Args:
+            method: HTTP method (GET, POST, ...)
+            url: Full endpoint URL
+            prefix: ijson path of the array elements (e.g. 'items.item')
+            body: Optional JSON-serializable request body
+            timeout: Timeout in seconds for connecting and for each read
+
+        Returns:
+            Tuple of (HTTP status code, iterator over the elements), or the status
+            and parsed error body when the request failed
+        """
+        response = self.session.request(method, url, json=body, timeout=timeout, stream=True)
+        if response.status_code != 200:
+            with response:
+                return response.status_code, json_loads(response.content) if response.content else None
+
+        def iter_items():
+            with response:
+                # Let urllib3 undo any gzip/deflate transfer encoding
+                response.raw.decode_content = True
+                yield from iter_json_items(response.raw, prefix)
+
+        return response.status_code, iter_items()
+
+    def list_all(self, url, params=None, timeout=300, transform=None):
+        """
+        GET every page of an OCI list endpoint.
+
+        Follows the opc-next-page header the same way `--all` does in the
+        OCI CLI. Collection responses ({"items": [...]}) are unwrapped.
+
+        Args:
+            url: Full list endpoint URL
+            params: Optional query parameters
+            timeout: Per-page request timeout in seconds
+            transform: Optional function applied to the items of each page
+
+        Returns:
+            Tuple of (HTTP status code, list of items), or the status and parsed
+            error body of the first page that failed
+        """
+        status, items, _ = self.list_all_conditional(url, params=params, timeout=timeout, transform=transform)
+        return status, items
+
+    def list_all_conditional(self, url, params=None, etag=None, timeout=300, transform=None):
+        """
+        GET every page of an OCI list endpoint, revalidating a previous result.
+
+        When etag is given it is sent as If-None-Match with the first page; a
+        304 Not Modified answer means the previous result is still current.
+
+        The next page is requested in the background as soon as its token
+        arrives, so it downloads while the current page is parsed and
+        transformed.
+
+        Args:
+            url: Full list endpoint URL
+            params: Optional query parameters
+            etag: ETag returned for the previous result, if any
+            timeout: Per-page request timeout in seconds
+            transform: Optional function applied to the items of each page
+
+        Returns:
+            Tuple of (HTTP status code, list of items or None for 304 or the
+            parsed error body, ETag of the result). The ETag is only returned
+            for single-page results, since it describes a single response.
+        """
+        params = dict(params or {})
+        headers = {'if-none-match': etag} if etag else None
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        if response.status_code == 304:
+            return response.status_code, None, etag
+
+        items = []
+        pages = 0
+        prefetch = None
+        try:
+            while True:
+                if response.status_code != 200:
+                    data = json_loads(response.content) if response.content else None
+                    return response.status_code, data, None
+                pages += 1
+
+                next_page = response.headers.get('opc-next-page')
+                pending = None
+                if next_page:
+                    if prefetch is None:
+                        prefetch = ThreadPoolExecutor(max_workers=1)
+                    pending = prefetch.submit(
+                        self.session.get, url, params={**params, 'page': next_page}, timeout=timeout
+                    )
+
+                page_items = (json_loads(response.content) if response.content else None) or []
+                if isinstance(page_items, dict):
+                    page_items = page_items.get('items') or []
+                items.extend(transform(page_items) if transform else page_items)
+
+                if pending is None:
+                    return response.status_code, items, response.headers.get('etag') if pages == 1 else None
+                response = pending.result()
+        finally:
+            if prefetch is not None:
+                prefetch.shutdown(wait=False)
+
+
+_shared_client = None
+_shared_client_ready = False
+_shared_client_lock = threading.Lock()
+
+
+def get_rest_client():
+    """
+    Return the process-wide OCIRestClient, creating it on first use.
+
+    Returns:
+        OCIRestClient or None when the OCI CLI should be used instead (SDK
+        missing, disabled with OCI_FINOPS_USE_CLI=1, or authentication failed)
+    """
+    global _shared_client, _shared_client_ready
+
+    with _shared_client_lock:
+        if not _shared_client_ready:
+            if sdk_enabled():
+                try:
+                    _shared_client = OCIRestClient()
+                except SDK_ERRORS as e:
+                    print(f"⚠️  OCI SDK authentication unavailable ({e}), falling back to OCI CLI")
+            _shared_client_ready = True
+
+    return _shared_client
+
+
+def service_endpoint(service, region):
+    """
+    Resolve the REST endpoint of an OCI service in a region.
+
+    Args:
+        service: SDK service name (e.g. 'compute', 'identity', 'audit', 'events')
+        region: Region name or short code as found in OCIDs (e.g. 'us-ashburn-1', 'iad')
+
+    Returns:
+        str: Base endpoint URL without the API version path
+    """
+    template = SERVICE_ENDPOINT_TEMPLATES.get(service)
+    if template:
+        return oci.regions.endpoint_for(
+            service, region=region, service_endpoint_template=template, endpoint_service_name=service
+        )
+    return oci.regions.endpoint_for(service, region=region)
+
+
+def to_cli_keys(value, keep=TAG_MAP_FIELDS):
+    """
+    Rename REST camelCase field names to the kebab-case names of OCI CLI output.
+
+    Lets REST responses stand in for `oci ... list` output (e.g. lifecycleState
+    becomes lifecycle-state). Free-form maps keep their keys unchanged.
+
+    Args:
+        value: Parsed JSON value (dict, list or scalar)
+        keep: Field names whose values are free-form maps (default: tag maps)
+
+    Returns:
+        The same structure with renamed dict keys
+    """
+    if isinstance(value, list):
+        return [to_cli_keys(item, keep) for item in value]
+    if isinstance(value, dict):
+        return {
+            _CAMEL_BOUNDARY.sub('-', key).lower(): (item if key in keep else to_cli_keys(item, keep))
+            for key, item in value.items()
+        }
+    return value
@@ -3,11 +3,110 @@ Progress tracking utilities for long-running operations.
 Copyright (c) 2025 Oracle and/or its affiliates.
 """
 
+import io
+import shutil
 import sys
 import time
 import threading
+from functools import lru_cache
 from itertools import cycle
 
+# Minimum seconds between progress bar redraws
+REDRAW_INTERVAL = 0.1
+
+# Progress bar width, and the columns kept free for the counters after it
+BAR_LENGTH = 30
+STATUS_COLUMNS = 50
+
+
+@lru_cache(maxsize=1024)
+def _format_seconds(seconds):
+    """Format whole seconds to human readable format (cached per value)."""
+    if seconds < 60:
+        return f"{seconds}s"
+    elif seconds < 3600:
+        mins, secs = divmod(seconds, 60)
+        return f"{mins}m {secs}s"
+    else:
+        hours, rest = divmod(seconds, 3600)
+        return f"{hours}h {rest // 60}m"
+
+
+def _format_time(seconds):
+    """Format seconds to human readable format."""
+    # Displays only change once per second, so repeated redraws hit the cache
+    return _format_seconds(int(seconds))
+
+
+def _stdout_is_tty():
+    """Check whether progress output would reach an interactive terminal."""
+    return sys.stdout is not None and sys.stdout.isatty()
+
+
+# Output buffers of the threads running inside BufferedOutput.call, by thread id
+_thread_buffers = {}
+_install_lock = threading.Lock()
+
+
+class _ThreadRoutingStdout:
+    """sys.stdout wrapper that sends the output of buffered threads to their buffer."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def _target(self):
+        return _thread_buffers.get(threading.get_ident(), self._stream)
+    
+    def write(self, text):
+        return self._target().write(text)
+    
+    def flush(self):
+        self._target().flush()
+    
+    def isatty(self):
+        # Buffered output is replayed later, so spinners and live progress
+        # bars are not drawn for it
+        target = self._target()
+        return target is self._stream and self._stream.isatty()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class BufferedOutput:
+    """Hold back what a background stage prints until flush() is called."""
+    
+    def __init__(self):
+        self._buffer = io.StringIO()
+        # Installed from the submitting thread, before any stage runs
+        with _install_lock:
+            if sys.stdout is not None and not isinstance(sys.stdout, _ThreadRoutingStdout):
+                sys.stdout = _ThreadRoutingStdout(sys.stdout)
+    
+    def call(self, func, *args, **kwargs):
+        """
+        Call func with the current thread's output going to this buffer.
+        
+        Threads started by func are not buffered.
+        
+        Returns:
+            Whatever func returns
+        """
+        thread_id = threading.get_ident()
+        _thread_buffers[thread_id] = self._buffer
+        try:
+            return func(*args, **kwargs)
+        finally:
+            del _thread_buffers[thread_id]
+    
+    def flush(self):
+        """Write the held-back output in one block."""
+        text = self._buffer.getvalue()
+        self._buffer = io.StringIO()
+        if text and sys.stdout is not None:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
 
 class ProgressSpinner:
     """Simple progress spinner for long-running operations."""
@@ -19,34 +118,29 @@ class ProgressSpinner:
         self.thread = None
         self.start_time = None
     
-    def _format_time(self, seconds):
-        """Format seconds to human readable format."""
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            mins = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{mins}m {secs}s"
-        else:
-            hours = int(seconds // 3600)
-            mins = int((seconds % 3600) // 60)
-            return f"{hours}h {mins}m"
-    
     def _spinner_animation(self):
         """Display spinning animation with elapsed time."""
-        while not self.stop_event.is_set():
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        # Draw a frame immediately, then every 0.1s until stop() wakes the wait
+        while True:
             char = next(self.spinner_chars)
             elapsed = time.time() - self.start_time
-            elapsed_str = self._format_time(elapsed)
-            sys.stdout.write(f"\r{char} {self.message} ({elapsed_str} elapsed)")
-            sys.stdout.flush()
-            time.sleep(0.1)
-        sys.stdout.write("\r")
-        sys.stdout.flush()
+            elapsed_str = _format_time(elapsed)
+            write(f"\r{char} {self.message} ({elapsed_str} elapsed)")
+            flush()
+            if self.stop_event.wait(0.1):
+                break
+        write("\r")
+        flush()
     
     def start(self):
-        """Start the spinner."""
+        """Start the spinner (no-op when stdout is not a terminal)."""
         self.start_time = time.time()
+        # Redirected output (CI logs, files) would only collect control codes,
+        # so no animation thread is started there
+        if not _stdout_is_tty():
+            return
         self.stop_event.clear()
         self.thread = threading.Thread(target=self._spinner_animation, daemon=True)
         self.thread.start()
@@ -61,57 +155,67 @@ class ProgressSpinner:
 class ProgressTracker:
     """Track progress with ETA calculation."""
     
+    # Bar segments are sliced from these instead of being rebuilt per redraw
+    _BAR_FULL = '█' * 60
+    _BAR_EMPTY = '░' * 60
+    _LINE_TEMPLATE = "\r  [%s] %.1f%% | %d/%d | ⏱️  %s | ⏳ ETA: %s"
+    
     def __init__(self, total_items, operation_name="Processing"):
         self.total_items = total_items
         self.operation_name = operation_name
         self.completed_items = 0
         self.start_time = time.time()
-    
-    def _format_time(self, seconds):
-        """Format seconds to human readable format."""
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            mins = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{mins}m {secs}s"
-        else:
-            hours = int(seconds // 3600)
-            mins = int((seconds % 3600) // 60)
-            return f"{hours}h {mins}m"
+        # The live bar is only drawn on a terminal; finish() always reports
+        self.interactive = _stdout_is_tty()
+        # Redraw at most every 1% of the items or every REDRAW_INTERVAL seconds
+        self._redraw_every = max(1, total_items // 100)
+        self._last_drawn_item = 0
+        self._last_draw_time = 0.0
+        # Narrow the bar once so the status line does not wrap on small
+        # terminals (a wrapped line cannot be redrawn in place with \r)
+        columns = shutil.get_terminal_size().columns if self.interactive else 0
+        self._bar_length = max(10, min(BAR_LENGTH, columns - STATUS_COLUMNS))
     
     def update(self, current_item):
-        """Update progress and display with ETA."""
+        """Update progress and display with ETA (redraws are rate-limited)."""
         self.completed_items = current_item
+        if not self.interactive:
+            return
+        
+        now = time.monotonic()
+        if (current_item < self.total_items
+                and current_item - self._last_drawn_item < self._redraw_every
+                and now - self._last_draw_time < REDRAW_INTERVAL):
+            return
+        self._last_drawn_item = current_item
+        self._last_draw_time = now
+        
         elapsed = time.time() - self.start_time
         
         if current_item > 0:
             rate = elapsed / current_item  # seconds per item
             remaining_items = self.total_items - current_item
             eta_seconds = rate * remaining_items
-            eta_str = self._format_time(eta_seconds)
+            eta_str = _format_time(eta_seconds)
         else:
             eta_str = "calculating..."
         
-        elapsed_str = self._format_time(elapsed)
+        elapsed_str = _format_time(elapsed)
         percentage = (current_item / self.total_items * 100) if self.total_items > 0 else 0
         
         # Create progress bar
-        bar_length = 30
+        bar_length = self._bar_length
         filled = int(bar_length * current_item / self.total_items) if self.total_items > 0 else 0
-        bar = '█' * filled + '░' * (bar_length - filled)
+        bar = self._BAR_FULL[:filled] + self._BAR_EMPTY[:bar_length - filled]
         
-        sys.stdout.write(
-            f"\r  [{bar}] {percentage:.1f}% | "
-            f"{current_item}/{self.total_items} | "
-            f"⏱️  {elapsed_str} | "
-            f"⏳ ETA: {eta_str}"
-        )
+        sys.stdout.write(self._LINE_TEMPLATE % (
+            bar, percentage, current_item, self.total_items, elapsed_str, eta_str
+        ))
         sys.stdout.flush()
     
     def finish(self):
         """Display final progress."""
         elapsed = time.time() - self.start_time
-        elapsed_str = self._format_time(elapsed)
+        elapsed_str = _format_time(elapsed)
         sys.stdout.write(f"\r✅ Completed {self.completed_items}/{self.total_items} in {elapsed_str}\n")
         sys.stdout.flush()
@@ -5,16 +5,358 @@ Copyright (c) 2025 Oracle and/or its affiliates.
 """
 
 import json
-import subprocess
+import time
+from collections import namedtuple
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .progress import ProgressSpinner
+from .serialization import atomic_open, json_loads, write_json, write_json_object, write_jsonl
+
+# Upper bound on regions queried at the same time by fetch_recommendations_many
+MAX_PARALLEL_REGIONS = 8
+
+# Reports with more recommendations than this are aggregated with NumPy; below
+# it the pure Python pass is faster than building the arrays
+NUMPY_SUMMARY_MIN_ITEMS = 500
+
+# One recommendation with the fields the report uses, read from the API item once
+ParsedRec = namedtuple('ParsedRec', 'name name_lower importance rank savings state pending description rec_id')
+
+# Separator lines of the actionable report
+_BAR_EQ = "=" * 80
+_BAR_HEAVY = "━" * 80
+_BAR_LIGHT = "─" * 80
+_HEADER_LINE = _BAR_EQ + "\n"
+_SECTION_LINE = _BAR_HEAVY + "\n"
+_ITEM_LINE = _BAR_LIGHT + "\n"
+
+# One entry of the prioritized recommendations section, formatted in one call
+_ITEM_TEMPLATE = (
+    "[{idx}] {name}\n"
+    + _ITEM_LINE
+    + "Priority:        {importance}\n"
+    "Savings:         {savings:,.2f} {currency}/month\n"
+    "Status:          {state}\n"
+    "Resources:       {pending} resource(s) affected\n"
+    "Description:     {description}\n"
+    "Recommendation:  {rec_id}\n"
+    "\n"
+    "WHAT THIS MEANS:\n"
+    "  {explanation}\n"
+    "\n"
+    "ACTIONS TO TAKE:\n"
+    "{actions}"
+    "\n"
+    "CLI COMMAND TO EXECUTE:\n"
+    "  {cli_command}\n"
+    "\n"
+)
+
+
+def _actions_boot_volume_attachment(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for boot-volume-attachment recommendations."""
+    explanation = "Your compute instances are oversized based on CPU, memory, and network utilization metrics. Right-sizing can reduce costs by up to 50% while maintaining performance."
+    actions = (
+        f"Review {resource_count} instance(s) for downsizing opportunities",
+        "Analyze CPU, memory, and network utilization metrics",
+        "Resize to smaller shape via OCI Console or CLI",
+        "Schedule during maintenance window to minimize disruption"
+    )
+    cli_command = f"oci compute instance update --instance-id <instance-ocid> --shape <new-shape> --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_block_volume_attachment(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for block-volume-attachment recommendations."""
+    explanation = f"You have {resource_count} block volumes that are either unattached, underutilized, or using excess performance capacity. These volumes continue to incur storage costs even when not actively used."
+    actions = (
+        f"Identify the {resource_count} block volumes with optimization opportunities",
+        "List unattached volumes: these can be deleted if data is no longer needed",
+        "Review volumes with low I/O usage - consider reducing VPUs per GB",
+        "Delete unattached volumes or downgrade performance tier to save costs"
+    )
+    cli_command = f"oci bv volume list --compartment-id {tenancy_ocid} --lifecycle-state AVAILABLE --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_ccd(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for ccd / commitment recommendations."""
+    explanation = f"Based on your consistent usage patterns across {resource_count} resource(s), you can save significantly by purchasing Compute Cloud Credits (CCD) commitments. Commitments offer 33-52% discounts for 1-year terms or 46-60% for 3-year terms."
+    actions = (
+        f"Analyze historical usage for the {resource_count} eligible resource(s)",
+        "Calculate your average monthly compute spend over the last 3-6 months",
+        "Purchase CCD commitment matching your baseline usage (1-year or 3-year term)",
+        "Continue using pay-as-you-go for variable/burst workloads above commitment level"
+    )
+    cli_command = f"oci optimizer recommendation get --recommendation-id {rec_id} --region {region} --output json"
+    return explanation, actions, cli_command
+
+
+def _actions_compute_host_terminated(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for compute-host-terminated recommendations."""
+    explanation = f"You have {resource_count} compute instance(s) in TERMINATED or STOPPED state that still have associated resources (boot volumes, reserved IPs) incurring costs. Fully removing these instances can eliminate ongoing charges."
+    actions = (
+        f"List the {resource_count} terminated/stopped instance(s)",
+        "Verify these instances are no longer needed",
+        "Delete associated boot volumes (they continue billing even after instance termination)",
+        "Release any reserved public IPs attached to terminated instances"
+    )
+    cli_command = f"oci compute instance list --compartment-id {tenancy_ocid} --lifecycle-state TERMINATED --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_compute_host_underutilized(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for compute-host-underutilized / compute-host-burstable recommendations."""
+    explanation = f"You have {resource_count} compute instance(s) with consistently low CPU, memory, or network utilization. Right-sizing these instances to smaller shapes can reduce costs by 30-70% while still meeting workload requirements."
+    actions = (
+        f"Review utilization metrics for the {resource_count} underutilized instance(s)",
+        "Check CPU average over last 30 days - if consistently below 20%, consider smaller shape",
+        "Evaluate memory usage - downsize if actual usage is <50% of allocated",
+        "Resize instances during maintenance window, test performance after change"
+    )
+    cli_command = f"oci compute instance action --instance-id <instance-ocid> --action SOFTSTOP && oci compute instance update --instance-id <instance-ocid> --shape <smaller-shape> --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_load_balancer_underutilized(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for load-balancer-underutilized recommendations."""
+    explanation = f"You have {resource_count} load balancer(s) with low traffic or connection counts. Load balancers have fixed hourly costs regardless of usage - consolidating or removing underutilized load balancers can significantly reduce costs."
+    actions = (
+        f"Review traffic patterns for the {resource_count} load balancer(s)",
+        "Check average bandwidth usage and connection counts over the last 30 days",
+        "Consolidate multiple low-traffic load balancers where possible",
+        "Delete load balancers with negligible traffic and use alternative routing"
+    )
+    cli_command = f"oci lb load-balancer list --compartment-id {tenancy_ocid} --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_autonomous_database_underutilized(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for autonomous-database-underutilized recommendations."""
+    explanation = f"You have {resource_count} Autonomous Database instance(s) with low CPU utilization. ADB charges per OCPU hour - reducing OCPU count or switching to auto-scaling can optimize costs while maintaining performance."
+    actions = (
+        f"Review CPU utilization for the {resource_count} ADB instance(s)",
+        "If average CPU is consistently below 30%, reduce OCPU count",
+        "Enable auto-scaling to handle peak loads without over-provisioning",
+        "Consider stopping non-production databases during off-hours"
+    )
+    cli_command = f"oci db autonomous-database update --autonomous-database-id <adb-ocid> --cpu-core-count <new-count> --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_object_storage_enable_olm(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for object-storage-enable-olm recommendations."""
+    explanation = f"You have {resource_count} objects in Object Storage that could benefit from Object Lifecycle Management (OLM) policies. OLM automatically moves older objects to lower-cost Archive storage, reducing costs by up to 90% for infrequently accessed data."
+    actions = (
+        f"Review the {resource_count} objects eligible for lifecycle management",
+        "Identify objects not accessed in the last 90+ days",
+        "Create OLM policy to auto-archive objects after specified age (e.g., 90 days)",
+        "Configure auto-deletion for temporary/log objects after retention period"
+    )
+    cli_command = f"oci os object-lifecycle-policy put --bucket-name <bucket-name> --namespace-name <namespace> --items file://lifecycle-policy.json --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_enable_db_management(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for enable-db-management recommendations."""
+    explanation = f"Enabling Database Management on {resource_count} database(s) provides performance monitoring, tuning recommendations, and operational insights at no additional cost. This helps optimize database performance and identify cost-saving opportunities."
+    actions = (
+        f"Enable Database Management for the {resource_count} database(s)",
+        "Configure database management features: Performance Hub, SQL Monitoring",
+        "Review automated tuning recommendations weekly",
+        "Use insights to rightsize database resources"
+    )
+    cli_command = f"oci database-management enable-external-database --external-database-id <db-ocid> --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_object_storage_enable_object_versioning(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for object-storage-enable-object-versioning recommendations."""
+    explanation = f"Enabling Object Storage versioning on {resource_count} buckets protects against accidental deletions and overwrites. While it adds minimal cost for version storage, it provides essential data protection and audit trail capabilities."
+    actions = (
+        f"Enable versioning on the {resource_count} bucket(s)",
+        "Configure lifecycle policies to automatically delete old versions after retention period",
+        "Set appropriate retention based on compliance requirements (30-365 days)",
+        "Monitor versioning storage costs and adjust retention as needed"
+    )
+    cli_command = f"oci os bucket update --bucket-name <bucket-name> --namespace-name <namespace> --versioning Enabled --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_object_storage_enable_replication(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for object-storage-enable-replication recommendations."""
+    explanation = f"Enabling cross-region replication for {resource_count} critical buckets provides disaster recovery and high availability. While replication adds storage and data transfer costs, it ensures business continuity for mission-critical data."
+    actions = (
+        f"Configure replication for the {resource_count} critical bucket(s)",
+        "Select target region based on geographic requirements and disaster recovery plan",
+        "Set up replication policy for full bucket or prefix-based replication",
+        "Monitor replication lag and costs - only replicate truly critical data"
+    )
+    cli_command = f"oci os replication create-replication-policy --bucket-name <bucket-name> --namespace-name <namespace> --destination-bucket <dest-bucket> --destination-region <dest-region> --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_rightsize_exacs(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for rightsize-exacs / rightsize-vmdb / downsize-exacs / downsize-vmdb recommendations."""
+    explanation = f"Your database system(s) have {resource_count} instances that can be right-sized based on actual CPU, memory, and storage utilization. Database right-sizing can reduce costs by 20-60% while maintaining performance."
+    actions = (
+        f"Review resource utilization for the {resource_count} database system(s)",
+        "Analyze CPU, memory, and I/O metrics over last 30 days",
+        "Downsize to appropriate shape or reduce enabled cores",
+        "Schedule change during maintenance window, monitor performance after"
+    )
+    cli_command = f"oci db system update --db-system-id <db-system-ocid> --cpu-core-count <new-count> --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_compute_fault_domain(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for compute-fault-domain recommendations."""
+    explanation = f"You have {resource_count} compute instances not configured with fault domains. Distributing instances across fault domains improves high availability by isolating failures within the data center at no additional cost."
+    actions = (
+        f"Review placement of the {resource_count} instance(s)",
+        "Identify instances in the same fault domain that should be distributed",
+        "Create new instances in different fault domains for redundancy",
+        "Update deployment automation to specify fault domain placement"
+    )
+    cli_command = f"oci compute instance launch --fault-domain FAULT-DOMAIN-1 --shape <shape> --compartment-id <compartment-ocid> --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_enable_auto_tuning(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for enable-auto-tuning recommendations."""
+    explanation = f"You have {resource_count} block/boot volumes that could benefit from auto-tuning. Auto-tuning automatically adjusts volume performance based on workload patterns at no extra cost, ensuring optimal performance."
+    actions = (
+        f"Enable auto-tuning for the {resource_count} volume(s)",
+        "Auto-tuning optimizes VPUs per GB automatically based on I/O patterns",
+        "No manual VPU adjustments needed - system handles optimization",
+        "Monitor volume performance after enabling to verify improvements"
+    )
+    cli_command = f"oci bv volume update --volume-id <volume-ocid> --is-auto-tune-enabled true --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_load_balancer_highutilization(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for load-balancer-highutilization recommendations."""
+    explanation = f"You have {resource_count} load balancer(s) experiencing high utilization. Upgrading bandwidth or adding additional load balancers prevents performance degradation and ensures application availability during traffic peaks."
+    actions = (
+        f"Review traffic patterns for the {resource_count} load balancer(s)",
+        "Check if bandwidth limits are being reached during peak hours",
+        "Upgrade to higher bandwidth tier or add additional load balancers",
+        "Implement horizontal scaling with multiple load balancers for high-traffic apps"
+    )
+    cli_command = f"oci lb load-balancer update --load-balancer-id <lb-ocid> --shape-name <larger-shape> --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_compute_host_highutilization(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for compute-host-highutilization recommendations."""
+    explanation = f"You have {resource_count} compute instance(s) with consistently high CPU/memory utilization. Upgrading to larger shapes prevents performance issues and improves application responsiveness."
+    actions = (
+        f"Review utilization metrics for the {resource_count} instance(s)",
+        "Check if CPU consistently exceeds 80% or memory is fully utilized",
+        "Upsize to larger shape with more OCPUs/memory",
+        "Consider enabling auto-scaling for variable workloads"
+    )
+    cli_command = f"oci compute instance update --instance-id <instance-ocid> --shape <larger-shape> --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_enable_monitoring(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for enable-monitoring recommendations."""
+    explanation = f"You have {resource_count} compute instances without enhanced monitoring enabled. Basic monitoring is free, but enhanced monitoring (1-minute intervals) provides critical insights for performance troubleshooting and cost optimization."
+    actions = (
+        f"Enable enhanced monitoring for the {resource_count} instance(s)",
+        "Configure 1-minute metric intervals for better visibility",
+        "Set up alarms for CPU, memory, and disk utilization thresholds",
+        "Use monitoring data to identify right-sizing opportunities"
+    )
+    cli_command = f"oci compute instance update --instance-id <instance-ocid> --metadata '{{\\\"user_data\\\":\\\"<enable-monitoring-script>\\\"}}' --region {region}"
+    return explanation, actions, cli_command
+
+
+def _actions_generic(region, tenancy_ocid, rec_id, resource_count):
+    """Actions for recommendations not matched by RECOMMENDATION_ACTIONS."""
+    # Generic actions for unmatched recommendation types
+    explanation = f"Oracle Cloud Advisor identified an optimization opportunity for {resource_count} resource(s). Review the recommendation details to understand the specific improvements suggested and potential cost savings."
+    actions = (
+        f"Review the {resource_count} affected resource(s) in Cloud Advisor console",
+        "Get detailed recommendation information including affected resources",
+        "Evaluate the impact and feasibility of implementing the recommendation",
+        "Implement changes and mark recommendation as IMPLEMENTED when complete"
+    )
+    cli_command = f"oci optimizer recommendation get --recommendation-id {rec_id} --region {region} --output json"
+    return explanation, actions, cli_command
+
+
+# Recommendation name markers (matched as substrings of the lowercased name,
+# first match wins) and the function building their explanation and actions
+RECOMMENDATION_ACTIONS = (
+    (('boot-volume-attachment',), _actions_boot_volume_attachment),
+    (('block-volume-attachment',), _actions_block_volume_attachment),
+    (('ccd', 'commitment'), _actions_ccd),
+    (('compute-host-terminated',), _actions_compute_host_terminated),
+    (('compute-host-underutilized', 'compute-host-burstable'), _actions_compute_host_underutilized),
+    (('load-balancer-underutilized',), _actions_load_balancer_underutilized),
+    (('autonomous-database-underutilized',), _actions_autonomous_database_underutilized),
+    (('object-storage-enable-olm',), _actions_object_storage_enable_olm),
+    (('enable-db-management',), _actions_enable_db_management),
+    (('object-storage-enable-object-versioning',), _actions_object_storage_enable_object_versioning),
+    (('object-storage-enable-replication',), _actions_object_storage_enable_replication),
+    (('rightsize-exacs', 'rightsize-vmdb', 'downsize-exacs', 'downsize-vmdb'), _actions_rightsize_exacs),
+    (('compute-fault-domain',), _actions_compute_fault_domain),
+    (('enable-auto-tuning',), _actions_enable_auto_tuning),
+    (('load-balancer-highutilization',), _actions_load_balancer_highutilization),
+    (('compute-host-highutilization',), _actions_compute_host_highutilization),
+    (('enable-monitoring',), _actions_enable_monitoring),
+)
+
+
+@lru_cache(maxsize=256)
+def _actions_builder(name_lower):
+    """Find the RECOMMENDATION_ACTIONS function for a lowercased name (cached per name)."""
+    for markers, build_actions in RECOMMENDATION_ACTIONS:
+        for marker in markers:
+            if marker in name_lower:
+                return build_actions
+    return _actions_generic
+
+
+# Human-readable names of recommendation categories, keyed by lowercased name
+CATEGORY_DISPLAY_NAMES = {
+    'cost-management-boot-volume-attachment-name': 'Boot Volumes - Optimize size and performance settings',
+    'cost-management-block-volume-attachment-name': 'Block Volumes - Remove unattached or underutilized volumes',
+    'create-ccd-commitment': 'Compute Commitments - Purchase 1-3 year commitments for discounts',
+    'cost-management-compute-host-burstable-name': 'Compute Instances - Switch to burstable shapes for variable workloads',
+    'cost-management-compute-host-terminated-name': 'Terminated Instances - Clean up resources from stopped instances',
+    'cost-management-compute-host-underutilized-name': 'Underutilized Instances - Right-size based on actual usage',
+    'cost-management-load-balancer-underutilized-name': 'Load Balancers - Consolidate or remove low-traffic load balancers',
+    'cost-management-autonomous-database-underutilized-name': 'Autonomous Databases - Reduce OCPUs or enable auto-scaling',
+    'cost-management-object-storage-enable-olm-name': 'Object Storage - Enable lifecycle policies to archive old data',
+    'high-availability-object-storage-enable-replication': 'Object Storage - Enable cross-region replication for DR',
+    'high-availability-object-storage-enable-object-versioning': 'Object Storage - Enable versioning for data protection',
+    'rightsize-exacs-x6-x7-x8-db-cluster': 'Exadata Cloud - Right-size database cluster resources',
+    'rightsize-vmdb-system': 'VM Database - Right-size database system resources',
+    'enable-db-management': 'Database Management - Enable monitoring and performance insights',
+    'downsize-exacs-x6-x7-x8-db-cluster': 'Exadata Cloud - Downsize overprovisioned clusters',
+    'downsize-vmdb-system': 'VM Database - Downsize overprovisioned systems',
+    'performance-compute-host-highutilization-name': 'High CPU Instances - Upgrade instances with performance issues',
+    'performance-load-balancer-highutilization-name': 'High Traffic Load Balancers - Increase bandwidth capacity',
+    'high-availability-compute-fault-domain-name': 'Compute HA - Distribute instances across fault domains',
+    'performance-boot-volume-enable-auto-tuning-name': 'Boot Volumes - Enable auto-tuning for optimal performance',
+    'performance-block-volume-enable-auto-tuning-name': 'Block Volumes - Enable auto-tuning for optimal performance',
+    'cost-management-compute-enable-monitoring-name': 'Compute Monitoring - Enable enhanced monitoring for optimization'
+}
+
+# Sort rank of recommendation importance levels in the report (unknown last)
+IMPORTANCE_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MODERATE': 2, 'LOW': 3, 'MINOR': 4}
 
 
 class OCIRecommendationsFetcher:
     """Fetch cost-saving recommendations from Oracle Cloud Advisor API using REST API."""
     
-    def __init__(self, tenancy_ocid, region, output_dir='output', currency='USD'):
+    def __init__(self, tenancy_ocid, region, output_dir='output', currency='USD',
+                 output_name='recommendations'):
         """
         Initialize recommendations fetcher.
         
@@ -23,18 +365,52 @@ class OCIRecommendationsFetcher:
             region: OCI Region
             output_dir: Output directory for recommendations
             currency: Target currency for cost display (default: USD)
+            output_name: Base name of the .json, .jsonl and .out files
+                (default: recommendations)
         """
         self.tenancy_ocid = tenancy_ocid
         self.region = region
         self.currency = currency  # Default is USD
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.json_file = self.output_dir / f'{output_name}.json'
+        self.jsonl_file = self.output_dir / f'{output_name}.jsonl'
+        self.report_file = self.output_dir / f'{output_name}.out'
+        # Fetched recommendations are cached per tenancy and region, in their
+        # own directory next to the growth collection's discovery cache
+        self.cache_dir = self.output_dir / '.cache' / tenancy_ocid / 'recommendations'
         self.api_endpoint = f"https://optimizer.{region}.oraclecloud.com/20200606/recommendations"
     
+    def _fetch_recommendations_sdk(self, rest_client, region):
+        """
+        List recommendations over the shared OCI REST session.
+        
+        Args:
+            rest_client: OCIRestClient to send the requests with
+            region: Region whose Cloud Advisor endpoint is queried
+        
+        Returns:
+            dict: Response shaped like the OCI CLI output ({'data': {'items': [...]}}
+                with CLI-style keys), or the OCI error body if the request failed
+        """
+        from .oci_client import service_endpoint, to_cli_keys
+        status, data = rest_client.list_all(
+            f"{service_endpoint('optimizer', region)}/20200606/recommendations",
+            params={'compartmentId': self.tenancy_ocid, 'compartmentIdInSubtree': 'true'},
+            timeout=300
+        )
+        if status != 200:
+            if isinstance(data, dict) and 'code' in data and 'message' in data:
+                return data
+            return {'code': f"HTTP {status}", 'message': str(data)}
+        return {'data': {'items': to_cli_keys(data)}}
+    
     def fetch_recommendations_api(self):
         """
-        Fetch recommendations using OCI CLI (optimizer recommendation-summary list).
-        Note: Using CLI command as a reliable API wrapper.
+        Fetch recommendations from the Cloud Advisor (Optimizer) API.
+        
+        Uses the in-process OCI REST client when the OCI SDK is available and
+        the OCI CLI (optimizer recommendation-summary list) otherwise.
         
         Returns:
             dict: Recommendations data or None if failed
@@ -46,35 +422,107 @@ class OCIRecommendationsFetcher:
         print(f"Tenancy: {self.tenancy_ocid}")
         print(f"Currency: {self.currency}")
         
-        spinner = ProgressSpinner("🌐 Contacting Oracle Cloud Advisor...")
-        spinner.start()
+        return self._fetch_region(self.region)
+    
+    def fetch_recommendations_many(self, regions, max_cache_age=None):
+        """
+        Fetch recommendations for several regions concurrently.
+        
+        The calls are network-bound, so they run on a thread pool (at most
+        MAX_PARALLEL_REGIONS at a time) and the total wait is roughly that of
+        the slowest region. No spinner is shown while they run.
+        
+        Args:
+            regions: Region names (e.g. ['us-ashburn-1', 'eu-frankfurt-1'])
+            max_cache_age: Reuse cached recommendations of a region when younger
+                than this many seconds instead of calling the API (None always fetches)
+        
+        Returns:
+            dict: Recommendations data (or None if failed) keyed by region, in
+                the order given
+        """
+        print(f"\n{'='*70}")
+        print("💡 Fetching Cost-Saving Recommendations")
+        print(f"{'='*70}")
+        print(f"Regions: {', '.join(regions)}")
+        print(f"Tenancy: {self.tenancy_ocid}")
+        print(f"Currency: {self.currency}")
+        
+        results = {}
+        if max_cache_age:
+            for region in regions:
+                cached = self.load_cached_recommendations(max_cache_age, region)
+                if cached is not None:
+                    results[region] = cached
+        
+        pending = [region for region in regions if region not in results]
+        if not pending:
+            return {region: results[region] for region in regions}
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REGIONS, len(pending))) as executor:
+            future_to_region = {
+                executor.submit(self._fetch_region, region, show_spinner=False): region
+                for region in pending
+            }
+            for future in as_completed(future_to_region):
+                results[future_to_region[future]] = future.result()
+        
+        return {region: results[region] for region in regions}
+    
+    def _fetch_region(self, region, show_spinner=True):
+        """
+        Fetch the recommendations of one region.
+        
+        Successful results are written to the region's cache file.
+        
+        Args:
+            region: OCI region to query
+            show_spinner: Show a progress spinner (disable for parallel calls)
+        
+        Returns:
+            dict: Recommendations data or None if failed
+        """
+        # The OCI SDK is slow to import, so it is only loaded once a call is made;
+        # subprocess is only needed here, for the CLI fallback
+        import subprocess
+        from .oci_client import SDK_TIMEOUTS, get_rest_client
+        rest_client = get_rest_client()
+        
+        spinner = ProgressSpinner(f"🌐 Contacting Oracle Cloud Advisor ({region})...")
+        if show_spinner:
+            spinner.start()
         
         try:
+            if rest_client is not None:
+                response = self._fetch_recommendations_sdk(rest_client, region)
+                spinner.stop()
+                return self._cache_recommendations(self._parse_recommendations_response(response, region), region)
+            
             # Execute OCI CLI command (reliable API access method)
             result = subprocess.run(
                 [
                     'oci', 'optimizer', 'recommendation-summary', 'list',
                     '--compartment-id', self.tenancy_ocid,
                     '--compartment-id-in-subtree', 'true',
-                    '--region', self.region,
+                    '--region', region,
                     '--all',
                     '--output', 'json'
                 ],
                 capture_output=True,
-                text=True,
                 timeout=300
             )
             
             spinner.stop()
             
             if result.returncode != 0:
+                stderr = result.stderr.decode('utf-8', errors='replace')
                 # Check if it's an authorization error
-                is_auth_error = 'NotAuthorizedOrNotFound' in result.stderr or 'Authorization failed' in result.stderr
+                is_auth_error = 'NotAuthorizedOrNotFound' in stderr or 'Authorization failed' in stderr
                 
-                print(f"❌ API call failed: {result.stderr[:50]}...")
+                print(f"❌ API call failed: {stderr[:50]}...")
                 print("\n📋 Debug information:")
                 print(f"   Return code: {result.returncode}")
-                print(f"   Region: {self.region}")
+                print(f"   Region: {region}")
                 print(f"   Tenancy: {self.tenancy_ocid[:50]}...")
                 
                 if is_auth_error:
@@ -90,78 +538,205 @@ class OCIRecommendationsFetcher:
 
                 
                 print(f"\n   Full error output (first 500 chars):")
-                print(f"   {result.stderr[:500]}")
+                print(f"   {stderr[:500]}")
                 return None
             
             # Parse response
-            response = json.loads(result.stdout)
-            
-            # Check for API errors
-            if 'code' in response and 'message' in response:
-                print(f"❌ API Error: {response.get('message')}")
-                print("\n📋 Error details:")
-                print(f"   Error code: {response.get('code')}")
-                return None
-            
-            # Extract recommendations
-            api_data = response.get('data', response)
-            
-            if isinstance(api_data, dict) and 'items' in api_data:
-                items = api_data['items']
-                print(f"✅ Success: Retrieved {len(items)} recommendations")
-                return api_data
-            
-            if isinstance(api_data, list):
-                print(f"✅ Success: Retrieved {len(api_data)} recommendations (list format)")
-                return {"items": api_data}
-            
-            print("❌ Unexpected API response format")
-            return None
+            return self._cache_recommendations(self._parse_recommendations_response(json_loads(result.stdout), region), region)
         
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired,) + SDK_TIMEOUTS:
             spinner.stop()
-            print("❌ API call timeout after 300 seconds")
+            print(f"❌ API call timeout after 300 seconds ({region})")
             return None
         
         except json.JSONDecodeError as json_err:
             spinner.stop()
-            print(f"❌ Failed to parse API response: {json_err}")
+            print(f"❌ Failed to parse API response ({region}): {json_err}")
             return None
         
         except Exception as e:
             spinner.stop()
-            print(f"❌ Failed to fetch recommendations: {e}")
+            print(f"❌ Failed to fetch recommendations ({region}): {e}")
             return None
     
+    def _parse_recommendations_response(self, response, region):
+        """
+        Extract the recommendation items from an API response.
+        
+        Args:
+            response: Parsed OCI CLI output or equivalent REST response
+            region: Region the response came from (for messages)
+        
+        Returns:
+            dict: Recommendations data ({'items': [...]}) or None on API errors
+        """
+        # Check for API errors
+        if 'code' in response and 'message' in response:
+            print(f"❌ API Error ({region}): {response.get('message')}")
+            print("\n📋 Error details:")
+            print(f"   Error code: {response.get('code')}")
+            return None
+        
+        # Extract recommendations
+        api_data = response.get('data', response)
+        
+        if isinstance(api_data, dict) and 'items' in api_data:
+            items = api_data['items']
+            print(f"✅ Success: Retrieved {len(items)} recommendations ({region})")
+            return api_data
+        
+        if isinstance(api_data, list):
+            print(f"✅ Success: Retrieved {len(api_data)} recommendations (list format, {region})")
+            return {"items": api_data}
+        
+        print(f"❌ Unexpected API response format ({region})")
+        return None
+    
+    @staticmethod
+    def _parse_item(item):
+        """
+        Normalize one recommendation item for reporting.
+        
+        Args:
+            item: Recommendation item with CLI-style keys
+        
+        Returns:
+            ParsedRec: The item with the name also lowercased (for matching
+                action markers), the report sort rank of its importance (a
+                missing importance ranks as MINOR but is shown as UNKNOWN),
+                savings as float, the count of resources still PENDING and
+                description None when missing
+        """
+        get = item.get
+        pending = 0
+        for resource_count in get('resource-counts') or ():
+            if resource_count.get('status') == 'PENDING':
+                pending += resource_count.get('count', 0)
+        name = get('name', 'unknown')
+        return ParsedRec(
+            name,
+            name.lower(),
+            get('importance', 'UNKNOWN'),
+            IMPORTANCE_ORDER.get(get('importance', 'MINOR'), 99),
+            float(get('estimated-cost-saving', 0) or 0),
+            get('lifecycle-state', 'UNKNOWN'),
+            pending,
+            get('description'),
+            get('id', '')
+        )
+    
+    @staticmethod
+    def _parse_items(items):
+        """
+        Normalize recommendation items for reporting.
+        
+        Args:
+            items: Recommendation items with CLI-style keys
+        
+        Returns:
+            list: ParsedRec per item (see _parse_item)
+        """
+        return list(map(OCIRecommendationsFetcher._parse_item, items))
+    
     def generate_category_summary(self, items):
         """Generate summary by category with actionable insights."""
+        return self._summarize(self._parse_items(items))[4]
+    
+    @staticmethod
+    def _summarize(parsed):
+        """
+        Aggregate parsed recommendations in a single pass.
+        
+        Args:
+            parsed: List of ParsedRec (see _parse_items)
+        
+        Returns:
+            Tuple of (total savings, active count, critical count, high count,
+            dict of category summaries keyed by recommendation name)
+        """
+        if len(parsed) > NUMPY_SUMMARY_MIN_ITEMS:
+            return OCIRecommendationsFetcher._summarize_numpy(parsed)
+        
+        total_savings = 0.0
+        active_count = critical_count = high_count = 0
         categories = {}
         
-        for item in items:
-            category_name = item.get('name', 'unknown')
-            importance = item.get('importance', 'UNKNOWN')
-            savings = float(item.get('estimated-cost-saving', 0))
-            state = item.get('lifecycle-state', 'UNKNOWN')
-            resource_counts = item.get('resource-counts', [])
-            
-            # Count affected resources
-            pending = sum(r.get('count', 0) for r in resource_counts if r.get('status') == 'PENDING')
+        for rec in parsed:
+            total_savings += rec.savings
+            active_count += rec.state == 'ACTIVE'
+            critical_count += rec.importance == 'CRITICAL'
+            high_count += rec.importance == 'HIGH'
             
-            if category_name not in categories:
-                categories[category_name] = {
-                    'name': category_name,
-                    'description': item.get('description', ''),
-                    'importance': importance,
+            category = categories.get(rec.name)
+            if category is None:
+                category = categories[rec.name] = {
+                    'name': rec.name,
+                    'description': rec.description if rec.description is not None else '',
+                    'importance': rec.importance,
                     'total_savings': 0,
                     'affected_resources': 0,
-                    'state': state,
-                    'recommendation_id': item.get('id', '')
+                    'state': rec.state,
+                    'recommendation_id': rec.rec_id
                 }
             
-            categories[category_name]['total_savings'] += savings
-            categories[category_name]['affected_resources'] += pending
+            category['total_savings'] += rec.savings
+            category['affected_resources'] += rec.pending
+        
+        return total_savings, active_count, critical_count, high_count, categories
+    
+    @staticmethod
+    def _summarize_numpy(parsed):
+        """
+        Vectorized _summarize for large reports.
+        
+        Each recommendation gets the code of its category in order of first
+        appearance, and category savings and resource counts are summed with
+        np.bincount; a category takes its description, importance, state and
+        id from its first recommendation.
+        
+        Args:
+            parsed: List of ParsedRec (see _parse_items)
         
-        return categories
+        Returns:
+            Same tuple as _summarize
+        """
+        import numpy as np
+        
+        count = len(parsed)
+        savings = np.fromiter((rec.savings for rec in parsed), dtype=np.float64, count=count)
+        pending = np.fromiter((rec.pending for rec in parsed), dtype=np.int64, count=count)
+        importance = np.array([rec.importance for rec in parsed], dtype=object)
+        state = np.array([rec.state for rec in parsed], dtype=object)
+        
+        codes = {}
+        first = []
+        for rec in parsed:
+            if rec.name not in codes:
+                codes[rec.name] = len(first)
+                first.append(rec)
+        groups = np.fromiter((codes[rec.name] for rec in parsed), dtype=np.int64, count=count)
+        category_savings = np.bincount(groups, weights=savings)
+        category_pending = np.bincount(groups, weights=pending)
+        
+        categories = {}
+        for group, rec in enumerate(first):
+            categories[rec.name] = {
+                'name': rec.name,
+                'description': rec.description if rec.description is not None else '',
+                'importance': rec.importance,
+                'total_savings': float(category_savings[group]),
+                'affected_resources': int(category_pending[group]),
+                'state': rec.state,
+                'recommendation_id': rec.rec_id
+            }
+        
+        return (
+            float(savings.sum()),
+            int((state == 'ACTIVE').sum()),
+            int((importance == 'CRITICAL').sum()),
+            int((importance == 'HIGH').sum()),
+            categories
+        )
     
     def format_actionable_report(self, recommendations_data):
         """
@@ -173,46 +748,77 @@ class OCIRecommendationsFetcher:
         Returns:
             str: Formatted actionable report
         """
+        return "".join(self.iter_report_lines(recommendations_data))
+    
+    def write_actionable_report(self, recommendations_data, path, parsed=None):
+        """
+        Write the actionable report to a file as it is generated.
+        
+        Lines go through the file's 1 MB buffer as iter_report_lines yields
+        them, so the whole report is never held in memory; the previous file
+        is replaced atomically once the report is complete.
+        
+        Args:
+            recommendations_data: Raw recommendations data
+            path: Report file path
+            parsed: ParsedRec list of the items, if already parsed
+        """
+        with atomic_open(path, 'w') as f:
+            f.writelines(self.iter_report_lines(recommendations_data, parsed))
+    
+    def iter_report_lines(self, recommendations_data, parsed=None):
+        """
+        Generate the actionable report line by line.
+        
+        Args:
+            recommendations_data: Raw recommendations data
+            parsed: ParsedRec list of the items, if already parsed
+        
+        Yields:
+            str: Report text, one line at a time except for the entries of the
+                prioritized section, which come as one block each. Everything
+                ends with a newline except the last line.
+        """
         items = recommendations_data.get('items', [])
         
         if not items:
-            return "No recommendations available at this time.\n"
-        
-        report_lines = []
-        report_lines.append("=" * 80)
-        report_lines.append("ORACLE CLOUD ADVISOR - COST OPTIMIZATION RECOMMENDATIONS")
-        report_lines.append("=" * 80)
-        report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append(f"Tenancy: {self.tenancy_ocid}")
-        report_lines.append(f"Region: {self.region}")
-        report_lines.append("")
-        
-        # Calculate aggregated summary
-        total_savings = sum(float(item.get('estimated-cost-saving', 0)) for item in items)
-        active_count = sum(1 for item in items if item.get('lifecycle-state') == 'ACTIVE')
-        critical_count = sum(1 for item in items if item.get('importance') == 'CRITICAL')
-        high_count = sum(1 for item in items if item.get('importance') == 'HIGH')
+            yield "No recommendations available at this time.\n"
+            return
+        
+        from datetime import datetime
+        
+        yield _HEADER_LINE
+        yield "ORACLE CLOUD ADVISOR - COST OPTIMIZATION RECOMMENDATIONS\n"
+        yield _HEADER_LINE
+        yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        yield f"Tenancy: {self.tenancy_ocid}\n"
+        yield f"Region: {self.region}\n"
+        yield "\n"
+        
+        # Items are parsed once; the summary counts and the category breakdown
+        # come from a single pass over the parsed records
+        if parsed is None:
+            parsed = self._parse_items(items)
+        total_savings, active_count, critical_count, high_count, categories = self._summarize(parsed)
         
         # Always use the configured currency (default: USD)
         currency = self.currency
         
         # EXECUTIVE SUMMARY
-        report_lines.append("━" * 80)
-        report_lines.append("EXECUTIVE SUMMARY")
-        report_lines.append("━" * 80)
-        report_lines.append(f"Total Recommendations:       {len(items)}")
-        report_lines.append(f"Active Recommendations:      {active_count}")
-        report_lines.append(f"Critical Priority:           {critical_count}")
-        report_lines.append(f"High Priority:               {high_count}")
-        report_lines.append(f"Estimated Monthly Savings:   {total_savings:,.2f} {currency}")
-        report_lines.append("")
+        yield _SECTION_LINE
+        yield "EXECUTIVE SUMMARY\n"
+        yield _SECTION_LINE
+        yield f"Total Recommendations:       {len(items)}\n"
+        yield f"Active Recommendations:      {active_count}\n"
+        yield f"Critical Priority:           {critical_count}\n"
+        yield f"High Priority:               {high_count}\n"
+        yield f"Estimated Monthly Savings:   {total_savings:,.2f} {currency}\n"
+        yield "\n"
         
         # CATEGORY BREAKDOWN
-        categories = self.generate_category_summary(items)
-        
-        report_lines.append("━" * 80)
-        report_lines.append("SAVINGS BY CATEGORY")
-        report_lines.append("━" * 80)
+        yield _SECTION_LINE
+        yield "SAVINGS BY CATEGORY\n"
+        yield _SECTION_LINE
         
         # Sort categories by savings
         sorted_categories = sorted(categories.values(), 
@@ -222,91 +828,71 @@ class OCIRecommendationsFetcher:
         for idx, cat in enumerate(sorted_categories, 1):
             # Get human-readable category name
             category_name = self._get_category_display_name(cat['name'])
-            report_lines.append(f"\n{idx}. {category_name}")
-            report_lines.append(f"   Priority:           {cat['importance']}")
-            report_lines.append(f"   Potential Savings:  {cat['total_savings']:,.2f} {currency}")
-            report_lines.append(f"   Affected Resources: {cat['affected_resources']}")
-            report_lines.append(f"   Status:             {cat['state']}")
+            yield f"\n{idx}. {category_name}\n"
+            yield f"   Priority:           {cat['importance']}\n"
+            yield f"   Potential Savings:  {cat['total_savings']:,.2f} {currency}\n"
+            yield f"   Affected Resources: {cat['affected_resources']}\n"
+            yield f"   Status:             {cat['state']}\n"
         
-        report_lines.append("")
+        yield "\n"
         
         # DETAILED ACTIONABLE STEPS
-        report_lines.append("━" * 80)
-        report_lines.append("ACTIONABLE RECOMMENDATIONS (PRIORITIZED)")
-        report_lines.append("━" * 80)
-        report_lines.append("")
+        yield _SECTION_LINE
+        yield "ACTIONABLE RECOMMENDATIONS (PRIORITIZED)\n"
+        yield _SECTION_LINE
+        yield "\n"
         
         # Sort by importance and savings
-        importance_order = {'CRITICAL': 0, 'HIGH': 1, 'MODERATE': 2, 'LOW': 3, 'MINOR': 4}
-        sorted_items = sorted(
-            items,
-            key=lambda x: (
-                importance_order.get(x.get('importance', 'MINOR'), 99),
-                -float(x.get('estimated-cost-saving', 0))
-            )
+        sorted_recs = sorted(
+            parsed,
+            key=lambda rec: (rec.rank, -rec.savings)
         )
         
-        for idx, item in enumerate(sorted_items, 1):
-            savings = float(item.get('estimated-cost-saving', 0))
-            importance = item.get('importance', 'UNKNOWN')
-            name = item.get('name', 'Unknown')
-            description = item.get('description', 'No description available')
-            rec_id = item.get('id', '')
-            state = item.get('lifecycle-state', 'UNKNOWN')
-            
-            # Get resource counts
-            resource_counts = item.get('resource-counts', [])
-            pending = sum(r.get('count', 0) for r in resource_counts if r.get('status') == 'PENDING')
-            
-            report_lines.append(f"[{idx}] {name.upper()}")
-            report_lines.append(f"{'─' * 80}")
-            report_lines.append(f"Priority:        {importance}")
-            report_lines.append(f"Savings:         {savings:,.2f} {currency}/month")
-            report_lines.append(f"Status:          {state}")
-            report_lines.append(f"Resources:       {pending} resource(s) affected")
-            report_lines.append(f"Description:     {description}")
-            report_lines.append(f"Recommendation:  {rec_id}")
-            report_lines.append("")
+        for idx, (name, name_lower, importance, _, savings, state, pending, description, rec_id) in enumerate(sorted_recs, 1):
+            if description is None:
+                description = 'No description available'
             
             # Generate specific actions based on recommendation name
-            explanation, actions, cli_command = self._generate_actions(name, rec_id, pending)
+            explanation, actions, cli_command = self._generate_actions(name_lower, rec_id, pending)
             
-            report_lines.append("WHAT THIS MEANS:")
-            report_lines.append(f"  {explanation}")
-            report_lines.append("")
-            report_lines.append("ACTIONS TO TAKE:")
-            for action_idx, action in enumerate(actions, 1):
-                report_lines.append(f"  {action_idx}. {action}")
-            report_lines.append("")
-            report_lines.append("CLI COMMAND TO EXECUTE:")
-            report_lines.append(f"  {cli_command}")
-            
-            report_lines.append("")
+            yield _ITEM_TEMPLATE.format(
+                idx=idx,
+                name=name.upper(),
+                importance=importance,
+                savings=savings,
+                currency=currency,
+                state=state,
+                pending=pending,
+                description=description,
+                rec_id=rec_id,
+                explanation=explanation,
+                actions="".join(f"  {action_idx}. {action}\n" for action_idx, action in enumerate(actions, 1)),
+                cli_command=cli_command
+            )
         
         # FOOTER
-        report_lines.append("━" * 80)
-        report_lines.append("HOW TO IMPLEMENT RECOMMENDATIONS")
-        report_lines.append("━" * 80)
-        report_lines.append("")
-        report_lines.append("Via OCI Console:")
-        report_lines.append("  1. Navigate to: Governance & Administration > Cloud Advisor")
-        report_lines.append("  2. Select the recommendation category")
-        report_lines.append("  3. Review resources and apply recommendations")
-        report_lines.append("")
-        report_lines.append("Via OCI CLI:")
-        report_lines.append("  # View recommendation details")
-        report_lines.append("  oci optimizer recommendation get --recommendation-id <RECOMMENDATION_ID>")
-        report_lines.append("")
-        report_lines.append("  # Apply recommendation")
-        report_lines.append("  oci optimizer recommendation bulk-apply \\")
-        report_lines.append("    --recommendation-id <RECOMMENDATION_ID> \\")
-        report_lines.append("    --status IMPLEMENTED")
-        report_lines.append("")
-        report_lines.append("=" * 80)
-        report_lines.append("END OF REPORT")
-        report_lines.append("=" * 80)
-        
-        return "\n".join(report_lines)
+        yield _SECTION_LINE
+        yield "HOW TO IMPLEMENT RECOMMENDATIONS\n"
+        yield _SECTION_LINE
+        yield "\n"
+        yield "Via OCI Console:\n"
+        yield "  1. Navigate to: Governance & Administration > Cloud Advisor\n"
+        yield "  2. Select the recommendation category\n"
+        yield "  3. Review resources and apply recommendations\n"
+        yield "\n"
+        yield "Via OCI CLI:\n"
+        yield "  # View recommendation details\n"
+        yield "  oci optimizer recommendation get --recommendation-id <RECOMMENDATION_ID>\n"
+        yield "\n"
+        yield "  # Apply recommendation\n"
+        yield "  oci optimizer recommendation bulk-apply \\\n"
+        yield "    --recommendation-id <RECOMMENDATION_ID> \\\n"
+        yield "    --status IMPLEMENTED\n"
+        yield "\n"
+        yield _HEADER_LINE
+        yield "END OF REPORT\n"
+        yield _BAR_EQ
+    
     
     def _get_category_display_name(self, category_code):
         """
@@ -318,254 +904,225 @@ class OCIRecommendationsFetcher:
         Returns:
             str: Human-readable category name with description
         """
-        category_map = {
-            'cost-management-boot-volume-attachment-name': 'Boot Volumes - Optimize size and performance settings',
-            'cost-management-block-volume-attachment-name': 'Block Volumes - Remove unattached or underutilized volumes',
-            'create-ccd-commitment': 'Compute Commitments - Purchase 1-3 year commitments for discounts',
-            'cost-management-compute-host-burstable-name': 'Compute Instances - Switch to burstable shapes for variable workloads',
-            'cost-management-compute-host-terminated-name': 'Terminated Instances - Clean up resources from stopped instances',
-            'cost-management-compute-host-underutilized-name': 'Underutilized Instances - Right-size based on actual usage',
-            'cost-management-load-balancer-underutilized-name': 'Load Balancers - Consolidate or remove low-traffic load balancers',
-            'cost-management-autonomous-database-underutilized-name': 'Autonomous Databases - Reduce OCPUs or enable auto-scaling',
-            'cost-management-object-storage-enable-olm-name': 'Object Storage - Enable lifecycle policies to archive old data',
-            'high-availability-object-storage-enable-replication': 'Object Storage - Enable cross-region replication for DR',
-            'high-availability-object-storage-enable-object-versioning': 'Object Storage - Enable versioning for data protection',
-            'rightsize-exacs-x6-x7-x8-db-cluster': 'Exadata Cloud - Right-size database cluster resources',
-            'rightsize-vmdb-system': 'VM Database - Right-size database system resources',
-            'enable-db-management': 'Database Management - Enable monitoring and performance insights',
-            'downsize-exacs-x6-x7-x8-db-cluster': 'Exadata Cloud - Downsize overprovisioned clusters',
-            'downsize-vmdb-system': 'VM Database - Downsize overprovisioned systems',
-            'performance-compute-host-highutilization-name': 'High CPU Instances - Upgrade instances with performance issues',
-            'performance-load-balancer-highutilization-name': 'High Traffic Load Balancers - Increase bandwidth capacity',
-            'high-availability-compute-fault-domain-name': 'Compute HA - Distribute instances across fault domains',
-            'performance-boot-volume-enable-auto-tuning-name': 'Boot Volumes - Enable auto-tuning for optimal performance',
-            'performance-block-volume-enable-auto-tuning-name': 'Block Volumes - Enable auto-tuning for optimal performance',
-            'cost-management-compute-enable-monitoring-name': 'Compute Monitoring - Enable enhanced monitoring for optimization',
-        }
-        
         # Return mapped name or a cleaned version of the code
-        return category_map.get(category_code.lower(), 
-                               category_code.replace('-', ' ').replace('_', ' ').title())
+        display_name = CATEGORY_DISPLAY_NAMES.get(category_code.lower())
+        if display_name is None:
+            display_name = category_code.replace('-', ' ').replace('_', ' ').title()
+        return display_name
     
-    def _generate_actions(self, recommendation_name, rec_id, resource_count):
+    def _generate_actions(self, name_lower, rec_id, resource_count):
         """
         Generate specific actions based on recommendation type.
         
+        Args:
+            name_lower: Lowercased recommendation name (ParsedRec.name_lower)
+            rec_id: Recommendation OCID
+            resource_count: Number of resources still pending
+        
         Returns:
-            tuple: (explanation, actions_list, cli_command)
-        """
-        actions = []
-        explanation = ""
-        cli_command = ""
-        rec_lower = recommendation_name.lower()
-        
-        # Generate detailed explanations and actions based on recommendation name
-        if 'boot-volume-attachment' in rec_lower:
-            explanation = "Your compute instances are oversized based on CPU, memory, and network utilization metrics. Right-sizing can reduce costs by up to 50% while maintaining performance."
-            actions.append(f"Review {resource_count} instance(s) for downsizing opportunities")
-            actions.append("Analyze CPU, memory, and network utilization metrics")
-            actions.append("Resize to smaller shape via OCI Console or CLI")
-            actions.append("Schedule during maintenance window to minimize disruption")
-            cli_command = f"oci compute instance update --instance-id <instance-ocid> --shape <new-shape> --region {self.region}"
-        
-        elif 'block-volume-attachment' in rec_lower:
-            explanation = f"You have {resource_count} block volumes that are either unattached, underutilized, or using excess performance capacity. These volumes continue to incur storage costs even when not actively used."
-            actions.append(f"Identify the {resource_count} block volumes with optimization opportunities")
-            actions.append("List unattached volumes: these can be deleted if data is no longer needed")
-            actions.append("Review volumes with low I/O usage - consider reducing VPUs per GB")
-            actions.append("Delete unattached volumes or downgrade performance tier to save costs")
-            cli_command = f"oci bv volume list --compartment-id {self.tenancy_ocid} --lifecycle-state AVAILABLE --region {self.region}"
-        
-        elif 'ccd' in rec_lower or 'commitment' in rec_lower:
-            explanation = f"Based on your consistent usage patterns across {resource_count} resource(s), you can save significantly by purchasing Compute Cloud Credits (CCD) commitments. Commitments offer 33-52% discounts for 1-year terms or 46-60% for 3-year terms."
-            actions.append(f"Analyze historical usage for the {resource_count} eligible resource(s)")
-            actions.append("Calculate your average monthly compute spend over the last 3-6 months")
-            actions.append("Purchase CCD commitment matching your baseline usage (1-year or 3-year term)")
-            actions.append("Continue using pay-as-you-go for variable/burst workloads above commitment level")
-            cli_command = f"oci optimizer recommendation get --recommendation-id {rec_id} --region {self.region} --output json"
-        
-        elif 'compute-host-terminated' in rec_lower:
-            explanation = f"You have {resource_count} compute instance(s) in TERMINATED or STOPPED state that still have associated resources (boot volumes, reserved IPs) incurring costs. Fully removing these instances can eliminate ongoing charges."
-            actions.append(f"List the {resource_count} terminated/stopped instance(s)")
-            actions.append("Verify these instances are no longer needed")
-            actions.append("Delete associated boot volumes (they continue billing even after instance termination)")
-            actions.append("Release any reserved public IPs attached to terminated instances")
-            cli_command = f"oci compute instance list --compartment-id {self.tenancy_ocid} --lifecycle-state TERMINATED --region {self.region}"
-        
-        elif 'compute-host-underutilized' in rec_lower or 'compute-host-burstable' in rec_lower:
-            explanation = f"You have {resource_count} compute instance(s) with consistently low CPU, memory, or network utilization. Right-sizing these instances to smaller shapes can reduce costs by 30-70% while still meeting workload requirements."
-            actions.append(f"Review utilization metrics for the {resource_count} underutilized instance(s)")
-            actions.append("Check CPU average over last 30 days - if consistently below 20%, consider smaller shape")
-            actions.append("Evaluate memory usage - downsize if actual usage is <50% of allocated")
-            actions.append("Resize instances during maintenance window, test performance after change")
-            cli_command = f"oci compute instance action --instance-id <instance-ocid> --action SOFTSTOP && oci compute instance update --instance-id <instance-ocid> --shape <smaller-shape> --region {self.region}"
-        
-        elif 'load-balancer-underutilized' in rec_lower:
-            explanation = f"You have {resource_count} load balancer(s) with low traffic or connection counts. Load balancers have fixed hourly costs regardless of usage - consolidating or removing underutilized load balancers can significantly reduce costs."
-            actions.append(f"Review traffic patterns for the {resource_count} load balancer(s)")
-            actions.append("Check average bandwidth usage and connection counts over the last 30 days")
-            actions.append("Consolidate multiple low-traffic load balancers where possible")
-            actions.append("Delete load balancers with negligible traffic and use alternative routing")
-            cli_command = f"oci lb load-balancer list --compartment-id {self.tenancy_ocid} --region {self.region}"
-        
-        elif 'autonomous-database-underutilized' in rec_lower:
-            explanation = f"You have {resource_count} Autonomous Database instance(s) with low CPU utilization. ADB charges per OCPU hour - reducing OCPU count or switching to auto-scaling can optimize costs while maintaining performance."
-            actions.append(f"Review CPU utilization for the {resource_count} ADB instance(s)")
-            actions.append("If average CPU is consistently below 30%, reduce OCPU count")
-            actions.append("Enable auto-scaling to handle peak loads without over-provisioning")
-            actions.append("Consider stopping non-production databases during off-hours")
-            cli_command = f"oci db autonomous-database update --autonomous-database-id <adb-ocid> --cpu-core-count <new-count> --region {self.region}"
-        
-        elif 'object-storage-enable-olm' in rec_lower:
-            explanation = f"You have {resource_count} objects in Object Storage that could benefit from Object Lifecycle Management (OLM) policies. OLM automatically moves older objects to lower-cost Archive storage, reducing costs by up to 90% for infrequently accessed data."
-            actions.append(f"Review the {resource_count} objects eligible for lifecycle management")
-            actions.append("Identify objects not accessed in the last 90+ days")
-            actions.append("Create OLM policy to auto-archive objects after specified age (e.g., 90 days)")
-            actions.append("Configure auto-deletion for temporary/log objects after retention period")
-            cli_command = f"oci os object-lifecycle-policy put --bucket-name <bucket-name> --namespace-name <namespace> --items file://lifecycle-policy.json --region {self.region}"
-        
-        elif 'enable-db-management' in rec_lower:
-            explanation = f"Enabling Database Management on {resource_count} database(s) provides performance monitoring, tuning recommendations, and operational insights at no additional cost. This helps optimize database performance and identify cost-saving opportunities."
-            actions.append(f"Enable Database Management for the {resource_count} database(s)")
-            actions.append("Configure database management features: Performance Hub, SQL Monitoring")
-            actions.append("Review automated tuning recommendations weekly")
-            actions.append("Use insights to rightsize database resources")
-            cli_command = f"oci database-management enable-external-database --external-database-id <db-ocid> --region {self.region}"
-        
-        elif 'object-storage-enable-object-versioning' in rec_lower:
-            explanation = f"Enabling Object Storage versioning on {resource_count} buckets protects against accidental deletions and overwrites. While it adds minimal cost for version storage, it provides essential data protection and audit trail capabilities."
-            actions.append(f"Enable versioning on the {resource_count} bucket(s)")
-            actions.append("Configure lifecycle policies to automatically delete old versions after retention period")
-            actions.append("Set appropriate retention based on compliance requirements (30-365 days)")
-            actions.append("Monitor versioning storage costs and adjust retention as needed")
-            cli_command = f"oci os bucket update --bucket-name <bucket-name> --namespace-name <namespace> --versioning Enabled --region {self.region}"
-        
-        elif 'object-storage-enable-replication' in rec_lower:
-            explanation = f"Enabling cross-region replication for {resource_count} critical buckets provides disaster recovery and high availability. While replication adds storage and data transfer costs, it ensures business continuity for mission-critical data."
-            actions.append(f"Configure replication for the {resource_count} critical bucket(s)")
-            actions.append("Select target region based on geographic requirements and disaster recovery plan")
-            actions.append("Set up replication policy for full bucket or prefix-based replication")
-            actions.append("Monitor replication lag and costs - only replicate truly critical data")
-            cli_command = f"oci os replication create-replication-policy --bucket-name <bucket-name> --namespace-name <namespace> --destination-bucket <dest-bucket> --destination-region <dest-region> --region {self.region}"
-        
-        elif 'rightsize-exacs' in rec_lower or 'rightsize-vmdb' in rec_lower or 'downsize-exacs' in rec_lower or 'downsize-vmdb' in rec_lower:
-            explanation = f"Your database system(s) have {resource_count} instances that can be right-sized based on actual CPU, memory, and storage utilization. Database right-sizing can reduce costs by 20-60% while maintaining performance."
-            actions.append(f"Review resource utilization for the {resource_count} database system(s)")
-            actions.append("Analyze CPU, memory, and I/O metrics over last 30 days")
-            actions.append("Downsize to appropriate shape or reduce enabled cores")
-            actions.append("Schedule change during maintenance window, monitor performance after")
-            cli_command = f"oci db system update --db-system-id <db-system-ocid> --cpu-core-count <new-count> --region {self.region}"
-        
-        elif 'compute-fault-domain' in rec_lower:
-            explanation = f"You have {resource_count} compute instances not configured with fault domains. Distributing instances across fault domains improves high availability by isolating failures within the data center at no additional cost."
-            actions.append(f"Review placement of the {resource_count} instance(s)")
-            actions.append("Identify instances in the same fault domain that should be distributed")
-            actions.append("Create new instances in different fault domains for redundancy")
-            actions.append("Update deployment automation to specify fault domain placement")
-            cli_command = f"oci compute instance launch --fault-domain FAULT-DOMAIN-1 --shape <shape> --compartment-id <compartment-ocid> --region {self.region}"
-        
-        elif 'enable-auto-tuning' in rec_lower:
-            explanation = f"You have {resource_count} block/boot volumes that could benefit from auto-tuning. Auto-tuning automatically adjusts volume performance based on workload patterns at no extra cost, ensuring optimal performance."
-            actions.append(f"Enable auto-tuning for the {resource_count} volume(s)")
-            actions.append("Auto-tuning optimizes VPUs per GB automatically based on I/O patterns")
-            actions.append("No manual VPU adjustments needed - system handles optimization")
-            actions.append("Monitor volume performance after enabling to verify improvements")
-            cli_command = f"oci bv volume update --volume-id <volume-ocid> --is-auto-tune-enabled true --region {self.region}"
-        
-        elif 'load-balancer-highutilization' in rec_lower:
-            explanation = f"You have {resource_count} load balancer(s) experiencing high utilization. Upgrading bandwidth or adding additional load balancers prevents performance degradation and ensures application availability during traffic peaks."
-            actions.append(f"Review traffic patterns for the {resource_count} load balancer(s)")
-            actions.append("Check if bandwidth limits are being reached during peak hours")
-            actions.append("Upgrade to higher bandwidth tier or add additional load balancers")
-            actions.append("Implement horizontal scaling with multiple load balancers for high-traffic apps")
-            cli_command = f"oci lb load-balancer update --load-balancer-id <lb-ocid> --shape-name <larger-shape> --region {self.region}"
-        
-        elif 'compute-host-highutilization' in rec_lower:
-            explanation = f"You have {resource_count} compute instance(s) with consistently high CPU/memory utilization. Upgrading to larger shapes prevents performance issues and improves application responsiveness."
-            actions.append(f"Review utilization metrics for the {resource_count} instance(s)")
-            actions.append("Check if CPU consistently exceeds 80% or memory is fully utilized")
-            actions.append("Upsize to larger shape with more OCPUs/memory")
-            actions.append("Consider enabling auto-scaling for variable workloads")
-            cli_command = f"oci compute instance update --instance-id <instance-ocid> --shape <larger-shape> --region {self.region}"
-        
-        elif 'enable-monitoring' in rec_lower:
-            explanation = f"You have {resource_count} compute instances without enhanced monitoring enabled. Basic monitoring is free, but enhanced monitoring (1-minute intervals) provides critical insights for performance troubleshooting and cost optimization."
-            actions.append(f"Enable enhanced monitoring for the {resource_count} instance(s)")
-            actions.append("Configure 1-minute metric intervals for better visibility")
-            actions.append("Set up alarms for CPU, memory, and disk utilization thresholds")
-            actions.append("Use monitoring data to identify right-sizing opportunities")
-            cli_command = f"oci compute instance update --instance-id <instance-ocid> --metadata '{{\\\"user_data\\\":\\\"<enable-monitoring-script>\\\"}}' --region {self.region}"
-        
-        else:
-            # Generic actions for unmatched recommendation types
-            explanation = f"Oracle Cloud Advisor identified an optimization opportunity for {resource_count} resource(s). Review the recommendation details to understand the specific improvements suggested and potential cost savings."
-            actions.append(f"Review the {resource_count} affected resource(s) in Cloud Advisor console")
-            actions.append("Get detailed recommendation information including affected resources")
-            actions.append("Evaluate the impact and feasibility of implementing the recommendation")
-            actions.append("Implement changes and mark recommendation as IMPLEMENTED when complete")
-            cli_command = f"oci optimizer recommendation get --recommendation-id {rec_id} --region {self.region} --output json"
-        
-        return explanation, actions, cli_command
+            tuple: (explanation, tuple of actions, cli_command)
+        """
+        return _actions_builder(name_lower)(self.region, self.tenancy_ocid, rec_id, resource_count)
+    
+    def _cache_file(self, region):
+        """Cache file holding the last recommendations fetched for a region."""
+        return self.cache_dir / f"{region}.json"
+    
+    def _cache_recommendations(self, recommendations_data, region):
+        """
+        Store freshly fetched recommendations in the region's cache file.
+        
+        Args:
+            recommendations_data: Parsed recommendations data (None is not cached)
+            region: Region the data belongs to
+        
+        Returns:
+            dict: recommendations_data, unchanged
+        """
+        if recommendations_data is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                write_json(recommendations_data, self._cache_file(region), indent=False)
+            except OSError as e:
+                print(f"⚠️  Could not write recommendations cache: {e}")
+        return recommendations_data
+    
+    def load_cached_recommendations(self, max_age_seconds, region=None):
+        """
+        Load the recommendations fetched for this tenancy and region if they are recent enough.
+        
+        Args:
+            max_age_seconds: Maximum age of the cache file (by modification time)
+            region: Region to look up (default: the fetcher's region)
+        
+        Returns:
+            dict: Cached recommendations data or None if missing, empty or stale
+        """
+        cache_file = self._cache_file(region or self.region)
+        try:
+            stat = cache_file.stat()
+        except OSError:
+            return None
+        
+        age = time.time() - stat.st_mtime
+        if stat.st_size == 0 or age > max_age_seconds:
+            return None
+        
+        try:
+            recommendations_data = json_loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        
+        print(f"♻️  Using cached recommendations from {cache_file} ({int(age // 60)} min old)")
+        return recommendations_data
     
-    def save_recommendations(self, recommendations_data, format_type='actionable'):
+    def save_recommendations(self, recommendations_data, format_type='actionable', save_json=True):
         """
         Save recommendations to files.
         
         Args:
             recommendations_data: Recommendations data dictionary
             format_type: 'actionable' for human-readable, 'json' for raw data, 'both' for both
+            save_json: Write recommendations.json and recommendations.jsonl (default: True)
         
         Returns:
-            dict: Paths to saved files
+            tuple: (dict of paths to the files written: 'json' and 'jsonl' with
+                save_json, 'report'; estimated monthly savings of all items;
+                number of items), or None if saving failed
         """
         if not recommendations_data:
             return None
         
         saved_files = {}
+        items = recommendations_data.get('items') or []
+        parsed = []
+        total_savings = 0.0
+        
+        def items_while_parsing():
+            # Parses each item for the report and adds up the savings as the
+            # item is written
+            nonlocal total_savings
+            parse_item = self._parse_item
+            append = parsed.append
+            for item in items:
+                rec = parse_item(item)
+                append(rec)
+                total_savings += rec.savings
+                yield item
         
         try:
-            # Always save raw JSON for programmatic access
-            json_file = self.output_dir / 'recommendations.json'
-            with open(json_file, 'w') as f:
-                json.dump(recommendations_data, f, indent=2)
-            saved_files['json'] = json_file
-            print(f"✅ Raw JSON saved to {json_file}")
+            # Always save raw JSON for programmatic access; the items are
+            # written one at a time instead of as one indented document, and
+            # parsed for the report on the way
+            json_file = self.json_file
+            if save_json:
+                write_json_object(
+                    ((key, items_while_parsing() if key == 'items' else value)
+                     for key, value in recommendations_data.items()),
+                    json_file,
+                    arrays=('items',)
+                )
+                print(f"✅ Raw JSON saved to {json_file}")
+                # One item per line, for tools that read the items incrementally
+                write_jsonl(items, self.jsonl_file)
+                print(f"✅ JSON Lines saved to {self.jsonl_file}")
+                saved_files['json'] = json_file
+                saved_files['jsonl'] = self.jsonl_file
+            if len(parsed) != len(items):
+                # The items were not written (save_json=False)
+                for _ in items_while_parsing():
+                    pass
             
             # Save actionable report
             if format_type in ['actionable', 'both']:
-                actionable_report = self.format_actionable_report(recommendations_data)
-                report_file = self.output_dir / 'recommendations.out'
-                with open(report_file, 'w') as f:
-                    f.write(actionable_report)
+                report_file = self.report_file
+                self.write_actionable_report(recommendations_data, report_file, parsed)
                 saved_files['report'] = report_file
                 print(f"✅ Actionable report saved to {report_file}")
             
-            return saved_files
+            return saved_files, total_savings, len(items)
         
         except Exception as e:
             print(f"❌ Failed to save recommendations: {e}")
             return None
     
-    def fetch_and_save(self):
+    def fetch_and_save(self, max_cache_age=None):
         """
         Fetch recommendations and save to files.
         
+        Args:
+            max_cache_age: Reuse the recommendations cached for this tenancy and
+                region when younger than this many seconds instead of calling
+                the API (None always fetches)
+        
+        Returns:
+            dict: Paths to saved files ('json', 'jsonl', 'report') or None if failed
+        """
+        recommendations = None
+        if max_cache_age:
+            recommendations = self.load_cached_recommendations(max_cache_age)
+        
+        if recommendations is None:
+            recommendations = self.fetch_recommendations_api()
+        return self._save_with_summary(recommendations)
+    
+    def fetch_and_save_many(self, regions, max_cache_age=None):
+        """
+        Fetch recommendations for several regions concurrently and save each region.
+        
+        Each region is written to recommendations_<region>.json, .jsonl and
+        .out, and its report uses that region's console links and commands.
+        
+        Args:
+            regions: Region names (e.g. ['us-ashburn-1', 'eu-frankfurt-1'])
+            max_cache_age: Reuse cached recommendations of a region when younger
+                than this many seconds instead of calling the API (None always fetches)
+        
+        Returns:
+            dict: Paths to saved files (see save_recommendations) keyed by
+                region for the regions that were saved, or None if none were
+        """
+        saved = {}
+        for region, recommendations in self.fetch_recommendations_many(regions, max_cache_age).items():
+            print(f"\n🌍 Region: {region}")
+            region_fetcher = OCIRecommendationsFetcher(
+                tenancy_ocid=self.tenancy_ocid,
+                region=region,
+                output_dir=str(self.output_dir),
+                currency=self.currency,
+                output_name=f'recommendations_{region}'
+            )
+            files = region_fetcher._save_with_summary(recommendations)
+            if files:
+                saved[region] = files
+            else:
+                print(f"⚠️  No recommendations saved for {region}")
+        return saved or None
+    
+    def _save_with_summary(self, recommendations):
+        """
+        Save fetched recommendations and print the savings summary.
+        
+        Args:
+            recommendations: Recommendations data (None if the fetch failed)
+        
         Returns:
             dict: Paths to saved files or None if failed
         """
-        recommendations = self.fetch_recommendations_api()
         if recommendations:
-            files = self.save_recommendations(recommendations, format_type='both')
-            if files:
+            # The outputs are always rewritten, so they match this tenancy and
+            # region and the report reflects the current currency
+            saved = self.save_recommendations(recommendations, format_type='both')
+            if saved:
+                # Summed while recommendations.json was written
+                files, total_savings, item_count = saved
                 # Print summary
-                items = recommendations.get('items', [])
-                if items:
-                    total_savings = sum(float(item.get('estimated-cost-saving', 0)) for item in items)
+                if item_count:
                     # Always use configured currency (default: USD)
                     currency = self.currency
                     
                     print(f"\n💰 Total Potential Savings: {total_savings:,.2f} {currency}/month")
-                    print(f"📊 Total Recommendations: {len(items)}")
+                    print(f"📊 Total Recommendations: {item_count}")
                 
                 return files
         return None
@@ -0,0 +1,219 @@
+"""
+Serialization helpers for collector output files.
+Copyright (c) 2025 Oracle and/or its affiliates.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the standard library
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional - responses are then parsed in one piece
+    ijson = None
+
+
+def json_dumps(obj, indent=True, default=None):
+    """
+    Serialize an object to JSON bytes.
+
+    Uses orjson when it is installed and the stdlib json module otherwise.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation (default: True)
+        default: Optional callable for objects that are not natively serializable
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    return json.dumps(obj, indent=2 if indent else None, default=default).encode('utf-8')
+
+
+def json_loads(data):
+    """
+    Parse a JSON document from str or bytes.
+
+    Uses orjson when it is installed and the stdlib json module otherwise.
+    Both raise a json.JSONDecodeError subclass on invalid input.
+
+    Args:
+        data: JSON text as str or UTF-8 bytes
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_json_items(stream, prefix):
+    """
+    Iterate over the elements of a JSON array inside a document read from a stream.
+
+    Requires ijson. Numbers are decoded as int/float, matching json_loads.
+
+    Args:
+        stream: Binary file-like object positioned at the start of the document
+        prefix: ijson path of the elements (e.g. 'items.item' for {"items": [...]})
+
+    Returns:
+        Iterator over the parsed elements
+    """
+    return ijson.items(stream, prefix, use_float=True)
+
+
+# Buffer size for output files, so large documents take few write calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def atomic_open(path, mode='wb'):
+    """
+    Open a temporary file that replaces path once the block completes.
+
+    The data is written to '<name>.<pid>.tmp' next to path and renamed over
+    it with os.replace, so readers (and an interrupted run) never see a
+    partially written file. If the block raises, the temporary file is
+    removed and path is left as it was.
+
+    Args:
+        path: Destination file path
+        mode: File mode, 'wb' or 'w'
+
+    Yields:
+        File object open for writing
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, mode, buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_json(obj, path, indent=True, default=None):
+    """Serialize an object and write it atomically to path as a single bytes write."""
+    with atomic_open(path) as f:
+        f.write(json_dumps(obj, indent=indent, default=default))
+
+
+def write_json_object(members, path, default=None, arrays=()):
+    """
+    Write a top-level JSON object one member at a time.
+
+    Each value is serialized and written on its own, so the full document is
+    never held in memory as one bytes object. Members named in arrays are
+    streamed further: their value may be any iterable (e.g. a generator) and
+    is written as a JSON array one element at a time. The output matches a
+    2-space indented dump of the equivalent dict and replaces path atomically.
+
+    Args:
+        members: Iterable of (key, value) pairs
+        path: Destination file path
+        default: Optional callable for objects that are not natively serializable
+        arrays: Keys whose values are written element by element
+
+    Returns:
+        int: Number of elements written for the members named in arrays
+    """
+    count = 0
+    with atomic_open(path) as f:
+        f.write(b'{')
+        separator = b'\n'
+        for key, value in members:
+            f.write(separator)
+            f.write(b'  ' + json_dumps(key) + b': ')
+            separator = b',\n'
+            if key not in arrays:
+                # JSON strings cannot contain raw newlines, so this only re-indents
+                f.write(json_dumps(value, default=default).replace(b'\n', b'\n  '))
+                continue
+
+            f.write(b'[')
+            element_separator = b'\n    '
+            for element in value:
+                f.write(element_separator)
+                f.write(json_dumps(element, default=default).replace(b'\n', b'\n    '))
+                element_separator = b',\n    '
+                count += 1
+            f.write(b'\n  ]' if element_separator != b'\n    ' else b']')
+        f.write(b'\n}' if separator != b'\n' else b'}')
+    return count
+
+
+def write_jsonl(records, path, default=None):
+    """
+    Write records as JSON Lines, one compact JSON document per line.
+
+    The file replaces path atomically once all records are written.
+
+    Args:
+        records: Iterable of JSON-serializable records
+        path: Destination file path
+        default: Optional callable for objects that are not natively serializable
+
+    Returns:
+        int: Number of records written
+    """
+    count = 0
+    with atomic_open(path) as f:
+        for record in records:
+            f.write(json_dumps(record, indent=False, default=default) + b'\n')
+            count += 1
+    return count
+
+
+def write_csv(df, path, parquet_path=None):
+    """
+    Write a DataFrame to CSV without the index, optionally with a Parquet copy.
+
+    The CSV always comes from DataFrame.to_csv so its number formatting (e.g.
+    2.0 rather than 2 for float columns) stays the same. Only the Parquet copy
+    uses pyarrow, when it is installed.
+
+    Args:
+        df: pandas DataFrame to write
+        path: Destination file path
+        parquet_path: Optional path for a Snappy-compressed Parquet copy
+            (requires pyarrow)
+
+    Returns:
+        bool: True if the Parquet copy was written
+    """
+    df.to_csv(path, index=False)
+
+    if parquet_path is None:
+        return False
+
+    # pyarrow is imported lazily so that importing this module stays cheap
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pa_parquet
+    except ImportError:  # pyarrow is optional - the CSV is still written
+        return False
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_parquet.write_table(table, str(parquet_path), compression='snappy')
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        # Do not leave a Parquet file from an earlier write next to the new CSV
+        Path(parquet_path).unlink(missing_ok=True)
+        return False
+    return True